@@ -1,15 +1,23 @@
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import asyncio
 import json
+import logging
 import os
-import asyncio
 from datetime import datetime
+from typing import Dict, List, Optional
+
+from flask import Flask, jsonify, request
+from flask_cors import CORS
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+
+from app_modules.middleware.request_logging import register_request_logging
 
 app = Flask(__name__, static_folder='client/dist', static_url_path='/')
 CORS(app)
 
+# Write structured JSON logs from a background thread, with per-request ids
+register_request_logging(app)
+logger = logging.getLogger(__name__)
+
 # Define schemas
 class Rsvp(BaseModel):
     id: int
@@ -109,7 +117,7 @@ def create_rsvp():
         }), 201
     
     except Exception as e:
-        print(f"RSVP submission error: {str(e)}")
+        logger.warning("RSVP submission error: %s", e)
         return jsonify({"message": f"Failed to submit RSVP: {str(e)}"}), 400
 
 @app.route('/api/rsvp', methods=['GET'])
@@ -136,7 +144,7 @@ def get_rsvps():
         }), 200
     
     except Exception as e:
-        print(f"Error fetching RSVPs: {str(e)}")
+        logger.exception("Error fetching RSVPs")
         return jsonify({"message": f"Failed to fetch RSVPs: {str(e)}"}), 500
 
 @app.route('/api/rsvp/<email>', methods=['GET'])
@@ -151,7 +159,7 @@ def get_rsvp_by_email(email):
             return jsonify({"message": "RSVP not found"}), 404
     
     except Exception as e:
-        print(f"Error fetching RSVP: {str(e)}")
+        logger.exception("Error fetching RSVP")
         return jsonify({"message": f"Failed to fetch RSVP: {str(e)}"}), 500
 
 # Message board functionality
@@ -211,7 +219,7 @@ def create_message():
         }), 201
     
     except Exception as e:
-        print(f"Message submission error: {str(e)}")
+        logger.warning("Message submission error: %s", e)
         return jsonify({"message": f"Failed to submit message: {str(e)}"}), 400
 
 @app.route('/api/messages', methods=['GET'])
@@ -225,7 +233,7 @@ def get_messages():
         }), 200
     
     except Exception as e:
-        print(f"Error fetching messages: {str(e)}")
+        logger.exception("Error fetching messages")
         return jsonify({"message": f"Failed to fetch messages: {str(e)}"}), 500
 
 # Serve the frontend
@@ -238,4 +246,5 @@ def serve(path):
         return app.send_static_file('index.html')
 
 if __name__ == '__main__':
+    logger.info("Flask server listening on http://0.0.0.0:5001")
     app.run(host='0.0.0.0', port=5001, debug=True)
\ No newline at end of file
@@ -5,14 +5,33 @@ Main entry point for the wedding e-invitation Flask application.
 This file initializes the Flask app and registers all routes.
 """
 
+import logging
+
 from flask import Flask
 from flask_cors import CORS
+
+from app_modules.middleware import (
+    register_admission_control,
+    register_compression,
+    register_request_logging,
+    register_request_profiler,
+    register_tenant_routing,
+)
 from app_modules.routes import (
-    register_rsvp_routes,
+    register_config_image_routes,
+    register_diagnostics_routes,
+    register_feature_flag_routes,
     register_message_routes,
-    register_static_routes
+    register_rsvp_routes,
+    register_static_routes,
+    register_stats_routes,
+    register_tenant_routes,
+    register_upload_routes,
 )
 
+logger = logging.getLogger(__name__)
+
+
 def create_app() -> Flask:
     """
     Create and configure the Flask application.
@@ -26,9 +45,30 @@ def create_app() -> Flask:
     # Configure CORS to allow requests from the frontend
     CORS(app)
     
+    # Write structured JSON logs from a background thread, with per-request ids
+    register_request_logging(app)
+    
+    # Limit concurrent API requests and shed load once the wait queue is full
+    register_admission_control(app)
+    
+    # Compress JSON responses with the encoding the client prefers
+    register_compression(app)
+    
+    # Profile sampled or admin-requested requests (off unless configured)
+    register_request_profiler(app)
+    
+    # Route /w/<slug> and tenant subdomains to their own repositories
+    register_tenant_routing(app)
+    
     # Register route handlers
     register_rsvp_routes(app)
     register_message_routes(app)
+    register_feature_flag_routes(app)
+    register_config_image_routes(app)
+    register_stats_routes(app)
+    register_diagnostics_routes(app)
+    register_tenant_routes(app)
+    register_upload_routes(app)
     register_static_routes(app)
     
     return app
@@ -40,4 +80,6 @@ app = create_app()
 
 if __name__ == '__main__':
     # Run the app if executed directly
-    app.run(host='0.0.0.0', port=5001, debug=True)
\ No newline at end of file
+    host, port = '0.0.0.0', 5001
+    logger.info("Flask server listening on http://%s:%d", host, port)
+    app.run(host=host, port=port, debug=True)
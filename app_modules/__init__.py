@@ -5,32 +5,73 @@ Base module for the wedding e-invitation application.
 
 # Re-export models for easier imports
 from app_modules.models import (
-    Rsvp, InsertRsvp, 
-    User, InsertUser,
-    Message, InsertMessage
+    ConfigImage,
+    FeatureFlag,
+    Household,
+    InsertConfigImage,
+    InsertFeatureFlag,
+    InsertInvitee,
+    InsertMessage,
+    InsertRsvp,
+    InsertUser,
+    Message,
+    Rsvp,
+    User,
+)
+
+# Re-export repositories for easier imports
+from app_modules.repositories.memory_repositories import (
+    MemoryConfigImageRepository,
+    MemoryFeatureFlagRepository,
+    MemoryInviteeRepository,
+    MemoryMessageRepository,
+    MemoryRsvpRepository,
+    MemoryUploadRepository,
+    MemoryUserRepository,
 )
 
 # Re-export route registration functions for easier imports
-from app_modules.routes.rsvp_routes import register_rsvp_routes
+from app_modules.routes.config_image_routes import register_config_image_routes
+from app_modules.routes.diagnostics_routes import register_diagnostics_routes
+from app_modules.routes.feature_flag_routes import register_feature_flag_routes
 from app_modules.routes.message_routes import register_message_routes
+from app_modules.routes.rsvp_routes import register_rsvp_routes
 from app_modules.routes.static_routes import register_static_routes
+from app_modules.routes.stats_routes import register_stats_routes
+from app_modules.routes.tenant_routes import register_tenant_routes
+from app_modules.routes.upload_routes import register_upload_routes
 
-# Re-export repositories for easier imports
-from app_modules.repositories.memory_repositories import (
-    MemoryRsvpRepository, 
-    MemoryMessageRepository,
-    MemoryUserRepository
+# Re-export the default event's repositories and services
+from app_modules.services import (
+    activity_stats_service,
+    allocation_tracer,
+    config_image_service,
+    diagnostics_service,
+    feature_flag_service,
+    invitee_repository,
+    message_repository,
+    message_service,
+    moderation_service,
+    notification_service,
+    rsvp_repository,
+    rsvp_service,
+    tenant_registry,
+    upload_service,
+    user_repository,
 )
 
 # Re-export services for easier imports
-from app_modules.services.rsvp_service import RsvpService
+from app_modules.services.activity_stats_service import ActivityStatsService
+from app_modules.services.config_image_service import ConfigImageService
+from app_modules.services.container import ServiceContainer
+from app_modules.services.diagnostics_service import (
+    AllocationTracer,
+    DiagnosticsService,
+)
+from app_modules.services.feature_flag_service import FeatureFlagService
 from app_modules.services.message_service import MessageService
-
-# Create instances of repositories
-rsvp_repository = MemoryRsvpRepository()
-message_repository = MemoryMessageRepository()
-user_repository = MemoryUserRepository()
-
-# Create instances of services
-rsvp_service = RsvpService(rsvp_repository)
-message_service = MessageService(message_repository)
\ No newline at end of file
+from app_modules.services.moderation_service import ModerationService
+from app_modules.services.notification_service import NotificationService
+from app_modules.services.rsvp_service import RsvpService
+from app_modules.services.tenant_registry import TenantRegistry
+from app_modules.services.upload_service import UploadService
@@ -0,0 +1,29 @@
+# app_modules/middleware/__init__.py
+"""
+Request middleware for the wedding e-invitation application.
+"""
+
+# Re-export middleware helpers for easier imports
+from app_modules.middleware.admin_auth import (
+    admin_required,
+    hash_admin_password,
+    is_admin_request,
+    is_platform_admin_request,
+    platform_admin_required,
+)
+from app_modules.middleware.admission import (
+    AdmissionController,
+    register_admission_control,
+)
+from app_modules.middleware.compression import ResponseCompressor, register_compression
+from app_modules.middleware.profiler import RequestProfiler, register_request_profiler
+from app_modules.middleware.request_logging import (
+    RequestLogger,
+    configure_logging,
+    register_request_logging,
+)
+from app_modules.middleware.tenant import (
+    TenantPathMiddleware,
+    current_services,
+    register_tenant_routing,
+)
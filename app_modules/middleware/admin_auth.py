@@ -0,0 +1,176 @@
+# app_modules/middleware/admin_auth.py
+"""
+Simple admin authentication for the wedding e-invitation application.
+
+Mirrors the Express admin middleware: credentials are accepted as a basic
+auth header (admin:<password>), an ``adminKey`` in the JSON body, or an
+``adminKey`` query parameter for development and testing.
+
+Each hosted wedding has its own admin password, stored only as a salted
+hash, so its admin cannot administer any other wedding. The ADMIN_PASSWORD
+is the platform admin's: it covers the default event, weddings created
+before they had their own password, and the process-wide routes guarded by
+``platform_admin_required``, which are not available inside a wedding.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import secrets
+from functools import wraps
+from typing import Callable, List, Optional
+
+from flask import g, jsonify, request
+
+from app_modules.middleware.tenant import current_services
+
+# PBKDF2-SHA256 iterations for the hashed admin passwords of hosted weddings
+ADMIN_PASSWORD_ITERATIONS = 100_000
+
+
+def get_admin_password() -> str:
+    """Get the admin password, falling back to the default used for testing."""
+    return os.environ.get('ADMIN_PASSWORD', 'wedding-admin')
+
+
+def hash_admin_password(password: str) -> str:
+    """
+    Hash a hosted wedding's admin password for storage.
+    
+    Args:
+        password: The plain-text password
+        
+    Returns:
+        The salt and PBKDF2 hash, hex encoded and separated by a colon
+    """
+    salt = secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac(
+        'sha256', password.encode('utf-8'), salt, ADMIN_PASSWORD_ITERATIONS
+    )
+    return f"{salt.hex()}:{digest.hex()}"
+
+
+def verify_admin_password(password: str, password_hash: str) -> bool:
+    """
+    Check a password against a hash made by hash_admin_password.
+    
+    Args:
+        password: The plain-text password to check
+        password_hash: The stored hash
+        
+    Returns:
+        True if the password matches
+    """
+    salt, _, expected = password_hash.partition(':')
+    digest = hashlib.pbkdf2_hmac(
+        'sha256',
+        password.encode('utf-8'),
+        bytes.fromhex(salt),
+        ADMIN_PASSWORD_ITERATIONS
+    )
+    return hmac.compare_digest(digest.hex(), expected)
+
+
+def _supplied_passwords() -> List[str]:
+    """Get the admin passwords the current request carries, in order of precedence."""
+    passwords = []
+    
+    auth_header = request.headers.get('Authorization')
+    if auth_header:
+        parts = auth_header.split(' ', 1)
+        if len(parts) == 2:
+            try:
+                credentials = base64.b64decode(parts[1]).decode('utf-8')
+            except (binascii.Error, UnicodeDecodeError):
+                credentials = ''
+            username, _, password = credentials.partition(':')
+            if username == 'admin':
+                passwords.append(password)
+    
+    # Check for adminKey in the request body (for validation endpoint)
+    body = request.get_json(silent=True)
+    if isinstance(body, dict) and isinstance(body.get('adminKey'), str):
+        passwords.append(body['adminKey'])
+    
+    # Alternative: allow using a query parameter for development/testing
+    if request.args.get('adminKey'):
+        passwords.append(request.args['adminKey'])
+    
+    return passwords
+
+
+def is_admin_request() -> bool:
+    """
+    Check whether the current request carries valid admin credentials.
+    
+    Inside a hosted wedding with its own admin password, only that password
+    is accepted.
+    
+    Returns:
+        True if the request is authenticated as the event's admin
+    """
+    password_hash: Optional[str] = (
+        current_services().admin_password_hash if g.get('tenant') is not None else None
+    )
+    if password_hash is not None:
+        return any(
+            verify_admin_password(password, password_hash)
+            for password in _supplied_passwords()
+        )
+    return is_platform_admin_request()
+
+
+def is_platform_admin_request() -> bool:
+    """
+    Check whether the current request carries the platform admin password.
+    
+    Returns:
+        True if the request is authenticated as the platform admin
+    """
+    admin_password = get_admin_password()
+    return any(password == admin_password for password in _supplied_passwords())
+
+
+def admin_required(view: Callable) -> Callable:
+    """
+    Decorator that rejects requests without valid admin credentials.
+    
+    Args:
+        view: The Flask view function to protect
+        
+    Returns:
+        The wrapped view function
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not is_admin_request():
+            return jsonify({"message": "Unauthorized access to admin area"}), 401
+        return view(*args, **kwargs)
+    
+    return wrapper
+
+
+def platform_admin_required(view: Callable) -> Callable:
+    """
+    Decorator for process-wide admin routes, which only the platform admin may use.
+    
+    They are not served inside a hosted wedding, whose admin could otherwise
+    act on every wedding.
+    
+    Args:
+        view: The Flask view function to protect
+        
+    Returns:
+        The wrapped view function
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if g.get('tenant') is not None:
+            return jsonify({"message": "Not found"}), 404
+        if not is_platform_admin_request():
+            return jsonify({"message": "Unauthorized access to admin area"}), 401
+        return view(*args, **kwargs)
+    
+    return wrapper
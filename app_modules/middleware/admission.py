@@ -0,0 +1,361 @@
+# app_modules/middleware/admission.py
+"""
+Admission control and load shedding for the API routes.
+
+At most ``max_concurrent`` API requests run at once, of which at most
+``max_concurrent_writes`` may be writes, so reads always have headroom.
+Further requests wait in a bounded queue where waiting reads are admitted
+before waiting writes. Once the queue is full, or a request has waited
+longer than ``queue_timeout``, it is rejected immediately with 503 and a
+Retry-After header. Writes are additionally limited per client with a
+token bucket and rejected with 429 when the bucket is empty.
+
+Upload part PUTs stream for a long time and a single file sends many of
+them, so they neither take write tokens nor the shared slots. They have a
+pool of their own, ``max_concurrent_parts``, and are shed with 503 at once
+when it is full; clients resume the part later.
+
+Requests normally reach Flask through the Express server on loopback, so the
+client is taken from X-Forwarded-For: the rightmost address that is not a
+trusted proxy. Requests made by a trusted proxy on its own behalf are not
+limited per client.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from flask import Flask, g, jsonify, request
+
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+UPLOAD_PART_PREFIX = '/api/uploads/'
+DEFAULT_TRUSTED_PROXIES = '127.0.0.1,::1'
+
+
+class AdmissionController:
+    """
+    Concurrency limiter with a bounded, read-first wait queue.
+    
+    Attributes:
+        max_concurrent: Maximum number of requests running at once
+        max_concurrent_writes: Maximum number of writes running at once
+        max_queue: Maximum number of requests waiting for a slot
+        queue_timeout: Seconds a request may wait before it is shed
+        client_rate: Writes per second each client may sustain
+        client_burst: Writes a client may send in a burst
+        max_clients: Number of client token buckets kept
+        max_concurrent_parts: Maximum number of upload parts streaming at once
+        trusted_proxies: Addresses whose X-Forwarded-For header is believed
+    """
+    
+    def __init__(
+        self,
+        max_concurrent: int = 32,
+        max_concurrent_writes: Optional[int] = None,
+        max_queue: int = 64,
+        queue_timeout: float = 2.0,
+        client_rate: float = 2.0,
+        client_burst: int = 10,
+        max_clients: int = 10000,
+        max_concurrent_parts: int = 8,
+        trusted_proxies: Iterable[str] = ('127.0.0.1', '::1')
+    ):
+        """Initialize the limiter settings and counters."""
+        self.max_concurrent = max_concurrent
+        self.max_concurrent_writes = (
+            max_concurrent_writes if max_concurrent_writes is not None
+            else max(1, max_concurrent * 3 // 4)
+        )
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.max_clients = max_clients
+        self.max_concurrent_parts = max_concurrent_parts
+        self.trusted_proxies: FrozenSet[str] = frozenset(trusted_proxies)
+        
+        self._condition = threading.Condition()
+        self._running = 0
+        self._running_writes = 0
+        self._waiting_reads = 0
+        self._waiting_writes = 0
+        self._running_parts = 0
+        
+        self._buckets_lock = threading.Lock()
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        
+        self.counters: Dict[str, int] = {
+            "admitted": 0,
+            "queued": 0,
+            "shedQueueFull": 0,
+            "shedTimeout": 0,
+            "rateLimited": 0,
+            "shedParts": 0,
+            "peakWaiting": 0,
+        }
+    
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the admission hooks with the Flask app.
+        
+        Args:
+            app: The Flask application instance
+        """
+        app.extensions['admission_control'] = self
+        app.before_request(self._admit)
+        app.teardown_request(self._release)
+    
+    def take_token(self, client: str) -> float:
+        """
+        Take one write token from a client's bucket.
+        
+        Args:
+            client: The client identifier
+            
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.monotonic()
+        with self._buckets_lock:
+            tokens, updated = self._buckets.pop(client, (float(self.client_burst), now))
+            refilled = tokens + (now - updated) * self.client_rate
+            tokens = min(float(self.client_burst), refilled)
+            
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / self.client_rate
+                self.counters["rateLimited"] += 1
+            
+            # Re-insert as most recently used and forget the least recent clients
+            self._buckets[client] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        
+        return wait
+    
+    def client_address(self) -> Optional[str]:
+        """
+        Identify the client of the current request for rate limiting.
+        
+        Returns:
+            The nearest address not belonging to a trusted proxy, or None if
+            every hop is a trusted proxy
+        """
+        forwarded = request.headers.get('X-Forwarded-For', '')
+        hops = [hop.strip() for hop in forwarded.split(',') if hop.strip()]
+        hops.append(request.remote_addr or 'unknown')
+        
+        # Only the entries appended by trusted proxies can be believed
+        for address in reversed(hops):
+            if address not in self.trusted_proxies:
+                return address
+        return None
+    
+    def _can_run(self, is_write: bool) -> bool:
+        """Check whether a request may take a slot now. Caller holds the condition."""
+        if self._running >= self.max_concurrent:
+            return False
+        if is_write:
+            # Waiting reads go first, and writes never take the reserved read slots
+            return (
+                self._waiting_reads == 0
+                and self._running_writes < self.max_concurrent_writes
+            )
+        return True
+    
+    def acquire(self, is_write: bool) -> Optional[str]:
+        """
+        Wait for a slot to run a request.
+        
+        Args:
+            is_write: Whether the request is a write
+            
+        Returns:
+            None if admitted, otherwise the counter naming why it was shed
+        """
+        with self._condition:
+            if not self._can_run(is_write):
+                waiting = self._waiting_reads + self._waiting_writes
+                if waiting >= self.max_queue:
+                    self.counters["shedQueueFull"] += 1
+                    return "shedQueueFull"
+                
+                self.counters["queued"] += 1
+                self.counters["peakWaiting"] = max(
+                    self.counters["peakWaiting"], waiting + 1
+                )
+                if is_write:
+                    self._waiting_writes += 1
+                else:
+                    self._waiting_reads += 1
+                
+                deadline = time.monotonic() + self.queue_timeout
+                try:
+                    while not self._can_run(is_write):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.counters["shedTimeout"] += 1
+                            return "shedTimeout"
+                        self._condition.wait(remaining)
+                finally:
+                    if is_write:
+                        self._waiting_writes -= 1
+                    else:
+                        self._waiting_reads -= 1
+                    # A write that gave up may unblock others waiting behind it
+                    self._condition.notify_all()
+            
+            self._running += 1
+            if is_write:
+                self._running_writes += 1
+            self.counters["admitted"] += 1
+            return None
+    
+    def release(self, is_write: bool) -> None:
+        """
+        Give back a slot taken by acquire.
+        
+        Args:
+            is_write: Whether the finished request was a write
+        """
+        with self._condition:
+            self._running -= 1
+            if is_write:
+                self._running_writes -= 1
+            self._condition.notify_all()
+    
+    def acquire_part(self) -> bool:
+        """
+        Take a slot from the upload part pool without waiting.
+        
+        Returns:
+            True if a slot was taken, False if the pool is full
+        """
+        with self._condition:
+            if self._running_parts >= self.max_concurrent_parts:
+                self.counters["shedParts"] += 1
+                return False
+            self._running_parts += 1
+            return True
+    
+    def release_part(self) -> None:
+        """Give back a slot taken by acquire_part."""
+        with self._condition:
+            self._running_parts -= 1
+    
+    def _retry_after(self) -> str:
+        """Estimate how long a shed client should wait before retrying."""
+        return str(max(1, math.ceil(self.queue_timeout)))
+    
+    def _admit(self):
+        """Apply rate limits and wait for a slot before an API request runs."""
+        if not request.path.startswith('/api/'):
+            return None
+        
+        if request.method == 'PUT' and request.path.startswith(UPLOAD_PART_PREFIX):
+            if not self.acquire_part():
+                response = jsonify({
+                    "message": (
+                        "Too many uploads in progress, please retry this part shortly"
+                    )
+                })
+                response.status_code = 503
+                response.headers['Retry-After'] = self._retry_after()
+                return response
+            g.admission_upload_part = True
+            return None
+        
+        is_write = request.method in WRITE_METHODS
+        client = self.client_address() if is_write else None
+        if client is not None:
+            wait = self.take_token(client)
+            if wait:
+                response = jsonify(
+                    {"message": "Too many requests, please try again shortly"}
+                )
+                response.status_code = 429
+                response.headers['Retry-After'] = str(max(1, math.ceil(wait)))
+                return response
+        
+        if self.acquire(is_write) is not None:
+            response = jsonify(
+                {"message": "The server is busy, please try again shortly"}
+            )
+            response.status_code = 503
+            response.headers['Retry-After'] = self._retry_after()
+            return response
+        
+        g.admission_is_write = is_write
+        return None
+    
+    def _release(self, exc: Optional[BaseException]) -> None:
+        """Free the request's slot once it has finished."""
+        if g.pop('admission_upload_part', False):
+            self.release_part()
+        is_write = g.pop('admission_is_write', None)
+        if is_write is not None:
+            self.release(is_write)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the limiter's settings, current load and counters.
+        
+        Returns:
+            The admission control statistics
+        """
+        with self._condition:
+            return {
+                "running": self._running,
+                "runningWrites": self._running_writes,
+                "waitingReads": self._waiting_reads,
+                "waitingWrites": self._waiting_writes,
+                "runningParts": self._running_parts,
+                "trackedClients": len(self._buckets),
+                "counters": dict(self.counters),
+                "limits": {
+                    "maxConcurrent": self.max_concurrent,
+                    "maxConcurrentWrites": self.max_concurrent_writes,
+                    "maxQueue": self.max_queue,
+                    "queueTimeout": self.queue_timeout,
+                    "clientRate": self.client_rate,
+                    "clientBurst": self.client_burst,
+                    "maxConcurrentParts": self.max_concurrent_parts
+                }
+            }
+
+
+def register_admission_control(app: Flask) -> AdmissionController:
+    """
+    Register admission control with the Flask app, configured from the environment.
+    
+    Args:
+        app: The Flask application instance
+        
+    Returns:
+        The registered admission controller
+    """
+    max_writes = os.environ.get('ADMISSION_MAX_CONCURRENT_WRITES')
+    trusted_proxies = os.environ.get(
+        'ADMISSION_TRUSTED_PROXIES', DEFAULT_TRUSTED_PROXIES
+    )
+    controller = AdmissionController(
+        max_concurrent=int(os.environ.get('ADMISSION_MAX_CONCURRENT', '32')),
+        max_concurrent_writes=int(max_writes) if max_writes else None,
+        max_queue=int(os.environ.get('ADMISSION_MAX_QUEUE', '64')),
+        queue_timeout=float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', '2.0')),
+        client_rate=float(os.environ.get('ADMISSION_CLIENT_RATE', '2.0')),
+        client_burst=int(os.environ.get('ADMISSION_CLIENT_BURST', '10')),
+        max_concurrent_parts=int(os.environ.get('ADMISSION_MAX_CONCURRENT_PARTS', '8')),
+        trusted_proxies=[
+            address.strip()
+            for address in trusted_proxies.split(',')
+            if address.strip()
+        ]
+    )
+    controller.init_app(app)
+    return controller
@@ -0,0 +1,180 @@
+# app_modules/middleware/compression.py
+"""
+Negotiated response compression for the wedding e-invitation application.
+
+JSON and text responses above a size threshold are compressed with brotli
+(when the optional ``brotli`` package is installed) or gzip, whichever the
+client prefers in Accept-Encoding. Bodies with a strong ETag are cached by
+that ETag, so a cached payload is compressed once rather than on every
+request; other bodies are compressed without caching.
+
+A compressed body is a different representation from the identity one, so
+its strong ETag gets the encoding appended (``"<etag>-gzip"``). Handlers
+answering If-None-Match should accept these variants via ``encoded_etags``.
+"""
+
+import gzip
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; fall back to gzip only
+    brotli = None
+
+
+# Mimetypes worth compressing
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/javascript',
+    'image/svg+xml',
+    'text/css',
+    'text/html',
+    'text/javascript',
+    'text/plain',
+}
+
+# Compression levels per encoding, used for routes without an override
+DEFAULT_LEVELS = {'br': 4, 'gzip': 5}
+
+# Per-endpoint levels. Precomputed payloads are compressed once per version,
+# so they can afford the strongest settings; the RSVP and message lists
+# change on every write and use cheaper ones.
+ROUTE_LEVELS: Dict[str, Dict[str, int]] = {
+    'get_feature_flags': {'br': 11, 'gzip': 9},
+    'get_config_images': {'br': 11, 'gzip': 9},
+    'get_config_images_by_type': {'br': 11, 'gzip': 9},
+    'get_rsvps': {'br': 5, 'gzip': 6},
+    'get_messages': {'br': 5, 'gzip': 6},
+}
+
+
+def encoded_etags(etag: str) -> List[str]:
+    """
+    List the ETags a payload may be sent with.
+    
+    Args:
+        etag: The payload's ETag before compression
+        
+    Returns:
+        The identity ETag followed by its per-encoding variants
+    """
+    return [etag, f"{etag}-br", f"{etag}-gzip"]
+
+
+def _compress(body: bytes, encoding: str, level: int) -> bytes:
+    """Compress a body with the given encoding and level."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class ResponseCompressor:
+    """
+    Flask hook that compresses responses and caches the compressed bodies.
+    
+    Attributes:
+        min_size: Bodies smaller than this many bytes are sent uncompressed
+        cache_size: Number of compressed bodies kept in the cache
+    """
+    
+    def __init__(self, min_size: int = 1024, cache_size: int = 256):
+        """Initialize the compressor settings."""
+        self.min_size = min_size
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, str, int], bytes]" = OrderedDict()
+    
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the compression hook with the Flask app.
+        
+        Args:
+            app: The Flask application instance
+        """
+        app.after_request(self.compress_response)
+    
+    def _negotiate(self) -> Optional[str]:
+        """Pick the encoding the client prefers among the supported ones."""
+        accept = request.accept_encodings
+        br_quality = accept['br'] if brotli is not None else 0
+        gzip_quality = accept['gzip']
+        
+        if br_quality <= 0 and gzip_quality <= 0:
+            return None
+        return 'br' if br_quality >= gzip_quality else 'gzip'
+    
+    def _compress_cached(
+        self, body: bytes, version: str, encoding: str, level: int
+    ) -> bytes:
+        """Compress a body, reusing the result for the same payload version."""
+        key = (version, encoding, level)
+        with self._lock:
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                return compressed
+        
+        compressed = _compress(body, encoding, level)
+        
+        with self._lock:
+            self._cache[key] = compressed
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return compressed
+    
+    def compress_response(self, response: Response) -> Response:
+        """Compress the response if the client accepts it and it is worth it."""
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        
+        encoding = self._negotiate()
+        if encoding is None:
+            return response
+        
+        body = response.get_data()
+        if len(body) < self.min_size:
+            return response
+        
+        etag, weak = response.get_etag()
+        level = ROUTE_LEVELS.get(request.endpoint, DEFAULT_LEVELS)[encoding]
+        
+        if etag and not weak:
+            response.set_data(self._compress_cached(body, etag, encoding, level))
+            response.set_etag(f"{etag}-{encoding}")
+        else:
+            # Without a version to key on, caching would only cost a hash per request
+            response.set_data(_compress(body, encoding, level))
+            if etag:
+                response.set_etag(etag, weak=True)
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+def register_compression(app: Flask) -> ResponseCompressor:
+    """
+    Register response compression with the Flask app, configured from the environment.
+    
+    Args:
+        app: The Flask application instance
+        
+    Returns:
+        The registered response compressor
+    """
+    compressor = ResponseCompressor(
+        min_size=int(os.environ.get('COMPRESSION_MIN_SIZE', '1024')),
+        cache_size=int(os.environ.get('COMPRESSION_CACHE_SIZE', '256'))
+    )
+    compressor.init_app(app)
+    return compressor
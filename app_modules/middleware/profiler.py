@@ -0,0 +1,146 @@
+# app_modules/middleware/profiler.py
+"""
+On-demand request profiling for the wedding e-invitation application.
+
+A request is profiled with cProfile when it is picked by random sampling
+(PROFILE_SAMPLE_RATE, a fraction between 0 and 1) or when an admin sends the
+``X-Profile: 1`` header. Each profile is written as a pstats file to
+PROFILE_DIR. Old files are pruned every ROTATE_EVERY profiles, keeping
+roughly the newest PROFILE_MAX_FILES. Only requests an admin explicitly asked
+to profile get the file name back in the X-Profile-File header. When sampling
+is off, the only per-request cost is a header lookup.
+"""
+
+import cProfile
+import itertools
+import logging
+import os
+import random
+import re
+import time
+from typing import Optional
+
+from flask import Flask, Response, g, request
+
+from app_modules.middleware.admin_auth import is_admin_request
+
+logger = logging.getLogger(__name__)
+
+
+PROFILE_HEADER = 'X-Profile'
+
+# Old profile files are pruned after this many profiles are written
+ROTATE_EVERY = 10
+
+
+class RequestProfiler:
+    """
+    Flask hooks that profile sampled or explicitly requested requests.
+    
+    Attributes:
+        sample_rate: Fraction of requests to profile at random
+        output_dir: Directory the pstats files are written to
+        max_files: Number of profile files kept before the oldest are removed
+    """
+    
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        output_dir: str = 'profiles',
+        max_files: int = 50
+    ):
+        """Initialize the profiler settings."""
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+        self.max_files = max_files
+        self._written = itertools.count(1)
+    
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the profiling hooks with the Flask app.
+        
+        Args:
+            app: The Flask application instance
+        """
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+    
+    def _start(self) -> None:
+        """Start profiling the current request if it was selected."""
+        requested = request.headers.get(PROFILE_HEADER) == '1' and is_admin_request()
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not requested and not sampled:
+            return
+        
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active (e.g. a concurrent request)
+            return
+        g.request_profiler = profiler
+        g.profile_requested = requested
+    
+    def _finish(self, response: Response) -> Response:
+        """Stop profiling and write the profile for the current request."""
+        profiler: Optional[cProfile.Profile] = g.pop('request_profiler', None)
+        if profiler is None:
+            return response
+        
+        profiler.disable()
+        try:
+            path = self._write(profiler)
+            # Sampled guest requests must not learn internal file names
+            if g.pop('profile_requested', False):
+                response.headers['X-Profile-File'] = os.path.basename(path)
+        except OSError as e:
+            logger.warning("Failed to write request profile: %s", e)
+        return response
+    
+    def _teardown(self, exc: Optional[BaseException]) -> None:
+        """Make sure the profiler is disabled if the response was never finished."""
+        profiler: Optional[cProfile.Profile] = g.pop('request_profiler', None)
+        if profiler is not None:
+            profiler.disable()
+    
+    def _write(self, profiler: cProfile.Profile) -> str:
+        """Dump the profile to the output directory, rotating old files now and then."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        endpoint = re.sub(r'[^A-Za-z0-9]+', '_', request.path).strip('_') or 'root'
+        filename = f"{time.time_ns()}-{request.method}-{endpoint}.prof"
+        path = os.path.join(self.output_dir, filename)
+        profiler.dump_stats(path)
+        
+        if next(self._written) % ROTATE_EVERY:
+            return path
+        
+        # File names start with a nanosecond timestamp, so they sort oldest first
+        profiles = sorted(f for f in os.listdir(self.output_dir) if f.endswith('.prof'))
+        for old_file in profiles[:max(len(profiles) - self.max_files, 0)]:
+            try:
+                os.remove(os.path.join(self.output_dir, old_file))
+            except OSError:
+                pass
+        
+        return path
+
+
+def register_request_profiler(app: Flask) -> RequestProfiler:
+    """
+    Register request profiling with the Flask app, configured from the environment.
+    
+    Args:
+        app: The Flask application instance
+        
+    Returns:
+        The registered request profiler
+    """
+    profiler = RequestProfiler(
+        sample_rate=float(os.environ.get('PROFILE_SAMPLE_RATE', '0')),
+        output_dir=os.environ.get('PROFILE_DIR', 'profiles'),
+        max_files=int(os.environ.get('PROFILE_MAX_FILES', '50'))
+    )
+    profiler.init_app(app)
+    return profiler
@@ -0,0 +1,269 @@
+# app_modules/middleware/request_logging.py
+"""
+Structured, non-blocking logging for the wedding e-invitation application.
+
+Log records are written as one JSON object per line. Request threads only put
+records on a bounded in-memory queue; a background listener thread formats and
+writes them, so a slow stdout never holds up a request. If the queue fills up,
+records are dropped and counted instead of blocking.
+
+Every request gets a correlation id, taken from a valid incoming X-Request-ID
+header or generated, which is attached to each record logged while handling
+the request and echoed back in the response. Requests are sampled as a whole
+at LOG_SUCCESS_SAMPLE_RATE: info and debug records of unsampled requests are
+dropped, while warnings and errors are always kept.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+import traceback
+import uuid
+from typing import Any, Dict, Optional
+
+from flask import Flask, Response, g, has_request_context, request
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+# Incoming request ids are echoed into logs and headers, so keep them tame
+REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,128}$')
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime'
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as a single-line JSON object, including ``extra`` fields."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": (
+                self.formatTime(record, '%Y-%m-%dT%H:%M:%S')
+                + f".{int(record.msecs):03d}"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Adds the request's correlation id to records and drops unsampled low-level records.
+    
+    Runs in the thread that logs the record, before it is queued, so the
+    request context is still available.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not has_request_context():
+            return True
+        
+        record.requestId = g.get('request_id')
+        record.method = request.method
+        record.path = request.path
+        tenant = g.get('tenant')
+        if tenant:
+            record.tenant = tenant
+        
+        return record.levelno >= logging.WARNING or g.get('log_sampled', True)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks: records are dropped when the queue is full.
+    
+    Attributes:
+        dropped: Number of records dropped because the queue was full
+    """
+    
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        """Initialize the handler with a bounded queue."""
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy the record with its message and traceback rendered.
+        
+        The traceback is rendered now, since the exception is gone by the time
+        the record is written. The original is left intact for other handlers.
+        """
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = ''.join(
+                traceback.format_exception(*record.exc_info)
+            ).rstrip()
+        record.exc_info = None
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the queue's fill level and drop counter.
+        
+        Returns:
+            The dropped, queued and maximum number of records
+        """
+        with self._dropped_lock:
+            dropped = self.dropped
+        return {
+            "dropped": dropped,
+            "queued": self.queue.qsize(),
+            "maxQueue": self.queue.maxsize,
+        }
+
+
+class RequestLogger:
+    """
+    Flask hooks assigning correlation ids, sampling requests and logging their outcome.
+    
+    Attributes:
+        sample_rate: Fraction of successful requests whose info logs are kept
+        logger: Logger the request outcome is written to
+    """
+    
+    def __init__(self, sample_rate: float = 1.0):
+        """Initialize the request logging settings."""
+        self.sample_rate = sample_rate
+        self.logger = logging.getLogger('app_modules.requests')
+    
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the request logging hooks with the Flask app.
+        
+        Args:
+            app: The Flask application instance
+        """
+        # Run before the other hooks, so every request has an id even if one
+        # of them rejects it
+        app.before_request_funcs.setdefault(None, []).insert(0, self._start)
+        app.after_request(self._finish)
+    
+    def _start(self) -> None:
+        """Assign the request's correlation id and sampling decision."""
+        incoming = request.headers.get(REQUEST_ID_HEADER, '')
+        if REQUEST_ID_PATTERN.match(incoming):
+            g.request_id = incoming
+        else:
+            g.request_id = uuid.uuid4().hex
+        g.log_sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        g.request_started = time.perf_counter()
+    
+    def _finish(self, response: Response) -> Response:
+        """Echo the correlation id and log the request's outcome."""
+        request_id = g.get('request_id')
+        if request_id is None:
+            return response
+        
+        response.headers[REQUEST_ID_HEADER] = request_id
+        started = g.get('request_started', time.perf_counter())
+        duration_ms = (time.perf_counter() - started) * 1000
+        # 503 is load shedding working as intended rather than a failure
+        if response.status_code == 503:
+            level = logging.WARNING
+        elif response.status_code >= 500:
+            level = logging.ERROR
+        else:
+            level = logging.INFO
+        self.logger.log(
+            level,
+            "request completed",
+            extra={"status": response.status_code, "durationMs": round(duration_ms, 2)}
+        )
+        return response
+
+
+# The process-wide listener, started once by configure_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
+def configure_logging(
+    level: str = 'INFO', queue_size: int = 10000
+) -> DroppingQueueHandler:
+    """
+    Route all logging through the JSON queue handler and start the writer thread.
+    
+    Safe to call more than once; only the first call configures logging.
+    
+    Args:
+        level: Root log level name
+        queue_size: Maximum number of records waiting to be written
+    
+    Returns:
+        The queue handler installed on the root logger
+    """
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        return _queue_handler
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+    
+    _queue_handler = DroppingQueueHandler(queue.Queue(queue_size))
+    _queue_handler.addFilter(RequestContextFilter())
+    
+    root = logging.getLogger()
+    root.handlers = [_queue_handler]
+    root.setLevel(level.upper())
+    
+    # Requests are already logged by RequestLogger; this also hides werkzeug's
+    # startup banner, so entry points log the address they bind to themselves
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _queue_handler
+
+
+def register_request_logging(app: Flask) -> RequestLogger:
+    """
+    Register structured request logging with the Flask app.
+    
+    The logger is configured from the environment.
+    
+    Args:
+        app: The Flask application instance
+    
+    Returns:
+        The registered request logger
+    """
+    app.extensions['log_queue_handler'] = configure_logging(
+        level=os.environ.get('LOG_LEVEL', 'INFO'),
+        queue_size=int(os.environ.get('LOG_QUEUE_SIZE', '10000'))
+    )
+    request_logger = RequestLogger(
+        sample_rate=float(os.environ.get('LOG_SUCCESS_SAMPLE_RATE', '1'))
+    )
+    request_logger.init_app(app)
+    return request_logger
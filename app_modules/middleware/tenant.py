@@ -0,0 +1,136 @@
+# app_modules/middleware/tenant.py
+"""
+Tenant routing for hosting several weddings in one process.
+
+A request selects a tenant either with a ``/w/<slug>`` path prefix, which is
+stripped before routing so the regular routes match, or with a subdomain of
+TENANT_BASE_DOMAIN (``<slug>.<base domain>``). Subdomains listed in
+TENANT_RESERVED_SUBDOMAINS (``www`` by default) are not tenants. Requests
+without a tenant use the default event's services.
+"""
+
+import atexit
+import os
+from typing import FrozenSet, Optional
+
+from flask import Flask, g, has_request_context, jsonify, request
+
+from app_modules.services import default_services, tenant_registry
+from app_modules.services.container import ServiceContainer
+from app_modules.services.tenant_registry import TenantRegistry
+
+TENANT_PATH_PREFIX = '/w/'
+TENANT_ENVIRON_KEY = 'wedding.tenant'
+DEFAULT_RESERVED_SUBDOMAINS = 'www'
+
+
+class TenantPathMiddleware:
+    """
+    WSGI middleware that moves a ``/w/<slug>`` path prefix into the environ.
+    
+    Attributes:
+        wsgi_app: The wrapped WSGI application
+    """
+    
+    def __init__(self, wsgi_app):
+        """Wrap a WSGI application."""
+        self.wsgi_app = wsgi_app
+    
+    def __call__(self, environ, start_response):
+        """Strip the tenant prefix from PATH_INFO before dispatching."""
+        path = environ.get('PATH_INFO', '')
+        if path.startswith(TENANT_PATH_PREFIX):
+            slug, _, rest = path[len(TENANT_PATH_PREFIX):].partition('/')
+            environ[TENANT_ENVIRON_KEY] = slug
+            script_name = environ.get('SCRIPT_NAME', '')
+            environ['SCRIPT_NAME'] = script_name + TENANT_PATH_PREFIX + slug
+            environ['PATH_INFO'] = '/' + rest
+        return self.wsgi_app(environ, start_response)
+
+
+def resolve_tenant_slug(
+    base_domain: Optional[str],
+    reserved_subdomains: FrozenSet[str] = frozenset()
+) -> Optional[str]:
+    """
+    Get the tenant slug selected by the current request.
+    
+    Args:
+        base_domain: Domain whose subdomains name tenants, if host routing is enabled
+        reserved_subdomains: Subdomains of the base domain that serve the default event
+        
+    Returns:
+        The tenant slug, or None for the default event
+    """
+    slug = request.environ.get(TENANT_ENVIRON_KEY)
+    if slug is not None:
+        return slug
+    
+    if base_domain:
+        host = request.host.split(':', 1)[0].lower()
+        suffix = '.' + base_domain
+        if host.endswith(suffix):
+            subdomain = host[:-len(suffix)]
+            if subdomain not in reserved_subdomains:
+                return subdomain
+    
+    return None
+
+
+def current_services() -> ServiceContainer:
+    """
+    Get the services of the tenant selected by the current request.
+    
+    Returns:
+        The tenant's service container, or the default event's outside a tenant
+    """
+    if has_request_context():
+        return g.get('services', default_services)
+    return default_services
+
+
+def register_tenant_routing(
+    app: Flask, registry: TenantRegistry = tenant_registry
+) -> None:
+    """
+    Register tenant resolution with the Flask app.
+    
+    Args:
+        app: The Flask application instance
+        registry: The registry holding the hosted tenants
+    """
+    base_domain = os.environ.get('TENANT_BASE_DOMAIN', '').lower().strip('.') or None
+    reserved_subdomains = frozenset(
+        name.strip().lower()
+        for name in os.environ.get(
+            'TENANT_RESERVED_SUBDOMAINS', DEFAULT_RESERVED_SUBDOMAINS
+        ).split(',')
+        if name.strip()
+    )
+    app.wsgi_app = TenantPathMiddleware(app.wsgi_app)
+    
+    @app.before_request
+    def select_tenant():
+        """Attach the selected tenant's services to the request."""
+        slug = resolve_tenant_slug(base_domain, reserved_subdomains)
+        if slug is None:
+            return None
+        
+        container = registry.acquire(slug)
+        if container is None:
+            return jsonify({"message": f"Wedding '{slug}' not found"}), 404
+        
+        g.tenant = slug
+        g.services = container
+        return None
+    
+    @app.teardown_request
+    def release_tenant(exc):
+        """Let the registry evict the tenant again once the request is done."""
+        slug = g.pop('tenant', None)
+        if slug is not None:
+            g.pop('services', None)
+            registry.release(slug)
+    
+    # Keep hosted events across restarts
+    atexit.register(registry.persist_all)
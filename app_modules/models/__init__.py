@@ -4,6 +4,29 @@ Models package for the wedding e-invitation application.
 """
 
 # Re-export all model classes for easier imports
-from app_modules.models.rsvp import Rsvp, InsertRsvp
-from app_modules.models.user import User, InsertUser
-from app_modules.models.message import Message, InsertMessage
\ No newline at end of file
+from app_modules.models.config_image import ConfigImage, InsertConfigImage
+from app_modules.models.feature_flag import FeatureFlag, InsertFeatureFlag
+from app_modules.models.invitee import (
+    Household,
+    InsertInvitee,
+    normalize_email,
+    normalize_invite_code,
+)
+from app_modules.models.message import (
+    MESSAGE_APPROVED,
+    MESSAGE_FLAGGED,
+    MESSAGE_PENDING,
+    MESSAGE_STATUSES,
+    InsertMessage,
+    Message,
+)
+from app_modules.models.rsvp import InsertRsvp, Rsvp
+from app_modules.models.upload import (
+    UPLOAD_COMPLETE,
+    UPLOAD_FAILED,
+    UPLOAD_FORWARDING,
+    UPLOAD_RECEIVING,
+    InsertUpload,
+    Upload,
+)
+from app_modules.models.user import InsertUser, User
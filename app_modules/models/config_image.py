@@ -0,0 +1,66 @@
+# app_modules/models/config_image.py
+"""
+Configurable image models for the wedding e-invitation application.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class InsertConfigImage(BaseModel):
+    """
+    Schema for creating or updating a configurable image.
+    
+    Attributes:
+        imageKey: Unique key of the image ("banner", "gallery_default_1", etc.)
+        imageUrl: URL of the image
+        imageType: Type of the image ("banner" or "gallery")
+        title: Title of the image (optional)
+        description: Description of the image (optional)
+        isActive: Whether the image is shown on the site
+    """
+    imageKey: str = Field(..., description="Unique key of the image")
+    imageUrl: str = Field(..., description="URL of the image")
+    imageType: str = Field(..., description="Type of the image")
+    title: Optional[str] = Field(None, description="Title of the image")
+    description: Optional[str] = Field(None, description="Description of the image")
+    isActive: bool = Field(True, description="Whether the image is shown on the site")
+
+
+class ConfigImage(InsertConfigImage):
+    """
+    Complete configurable image model including the ID and timestamp.
+    
+    Attributes:
+        id: Unique identifier for the image
+        updatedAt: Timestamp when the image was last updated
+    """
+    id: int = Field(..., description="Unique identifier for the image")
+    updatedAt: str = Field(..., description="Timestamp when the image was last updated")
+    
+    @classmethod
+    def from_insert(
+        cls, id: int, insert_config_image: InsertConfigImage, updated_at: str
+    ) -> "ConfigImage":
+        """
+        Build a stored image from already validated data without re-validating.
+        
+        Args:
+            id: Unique identifier for the image
+            insert_config_image: Image data validated at the request boundary
+            updated_at: Timestamp when the image was last updated
+            
+        Returns:
+            The stored image
+        """
+        return cls.model_construct(
+            id=id,
+            imageKey=insert_config_image.imageKey,
+            imageUrl=insert_config_image.imageUrl,
+            imageType=insert_config_image.imageType,
+            title=insert_config_image.title,
+            description=insert_config_image.description,
+            isActive=insert_config_image.isActive,
+            updatedAt=updated_at
+        )
@@ -0,0 +1,58 @@
+# app_modules/models/feature_flag.py
+"""
+Feature flag models for the wedding e-invitation application.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class InsertFeatureFlag(BaseModel):
+    """
+    Schema for creating a new feature flag.
+    
+    Attributes:
+        featureKey: Unique key of the feature ("rsvp", "messages", "gallery", etc.)
+        featureName: Human readable name of the feature
+        description: Description of what the feature controls
+        enabled: Whether the feature is enabled
+    """
+    featureKey: str = Field(..., description="Unique key of the feature")
+    featureName: str = Field(..., description="Human readable name of the feature")
+    description: str = Field(..., description="Description of the feature")
+    enabled: bool = Field(True, description="Whether the feature is enabled")
+
+
+class FeatureFlag(InsertFeatureFlag):
+    """
+    Complete feature flag model including the ID and timestamp.
+    
+    Attributes:
+        id: Unique identifier for the feature flag
+        updatedAt: Timestamp when the feature flag was last updated
+    """
+    id: int = Field(..., description="Unique identifier for the feature flag")
+    updatedAt: str = Field(..., description="Timestamp when the flag was last updated")
+    
+    @classmethod
+    def from_insert(
+        cls, id: int, insert_feature_flag: InsertFeatureFlag, updated_at: str
+    ) -> "FeatureFlag":
+        """
+        Build a stored feature flag from already validated data without re-validating.
+        
+        Args:
+            id: Unique identifier for the feature flag
+            insert_feature_flag: Feature flag data validated at the request boundary
+            updated_at: Timestamp when the feature flag was last updated
+            
+        Returns:
+            The stored feature flag
+        """
+        return cls.model_construct(
+            id=id,
+            featureKey=insert_feature_flag.featureKey,
+            featureName=insert_feature_flag.featureName,
+            description=insert_feature_flag.description,
+            enabled=insert_feature_flag.enabled,
+            updatedAt=updated_at
+        )
@@ -0,0 +1,52 @@
+# app_modules/models/invitee.py
+"""
+Invitee and household models for the wedding e-invitation application.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for case-insensitive lookups."""
+    return email.strip().lower()
+
+
+def normalize_invite_code(invite_code: str) -> str:
+    """Normalize an invite code for case-insensitive lookups."""
+    return invite_code.strip().upper()
+
+
+class InsertInvitee(BaseModel):
+    """
+    Schema for one row of the invitee list.
+    
+    Invitees sharing an invite code form a household.
+    
+    Attributes:
+        name: Full name of the invitee
+        email: Email address of the invitee
+        inviteCode: Invite code of the invitee's household
+        seats: Number of seats offered to the invitee, including themselves
+    """
+    name: str = Field(..., description="Full name of the invitee")
+    email: str = Field(..., description="Email address of the invitee")
+    inviteCode: str = Field(..., description="Invite code of the invitee's household")
+    seats: int = Field(1, ge=0, description="Number of seats offered to the invitee")
+
+
+class Household(BaseModel):
+    """
+    A group of invitees sharing an invite code.
+    
+    Attributes:
+        inviteCode: Normalized invite code of the household
+        emails: Normalized email addresses of the household's invitees
+        allowedSeats: Total seats offered to the household
+    """
+    inviteCode: str = Field(..., description="Normalized invite code of the household")
+    emails: List[str] = Field(
+        ..., description="Email addresses of the household's invitees"
+    )
+    allowedSeats: int = Field(..., description="Total seats offered to the household")
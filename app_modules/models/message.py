@@ -3,9 +3,16 @@
 Message models for the wedding e-invitation application.
 """
 
-from typing import Optional
+from typing import List
+
 from pydantic import BaseModel, Field
 
+# Moderation states of a message
+MESSAGE_PENDING = "pending"
+MESSAGE_APPROVED = "approved"
+MESSAGE_FLAGGED = "flagged"
+MESSAGE_STATUSES = (MESSAGE_PENDING, MESSAGE_APPROVED, MESSAGE_FLAGGED)
+
 
 class InsertMessage(BaseModel):
     """
@@ -23,7 +30,7 @@ class InsertMessage(BaseModel):
 
 class Message(BaseModel):
     """
-    Complete message model including the ID and timestamp.
+    Complete message model including the ID, timestamp and moderation state.
     
     Attributes:
         id: Unique identifier for the message
@@ -31,9 +38,45 @@ class Message(BaseModel):
         email: Email address of the person
         content: Content of the message
         created_at: Timestamp when the message was created
+        status: Moderation status ("pending", "approved" or "flagged")
+        flagReasons: Why moderation flagged the message
     """
     id: int = Field(..., description="Unique identifier for the message")
     name: str = Field(..., description="Name of the person")
     email: str = Field(..., description="Email address of the person")
     content: str = Field(..., description="Content of the message")
-    created_at: str = Field(..., description="Timestamp when the message was created")
\ No newline at end of file
+    created_at: str = Field(..., description="Timestamp when the message was created")
+    status: str = Field(MESSAGE_PENDING, description="Moderation status of the message")
+    flagReasons: List[str] = Field(
+        default_factory=list, description="Why the message was flagged"
+    )
+    
+    @classmethod
+    def from_insert(
+        cls,
+        id: int,
+        insert_message: InsertMessage,
+        created_at: str,
+        status: str = MESSAGE_PENDING
+    ) -> "Message":
+        """
+        Build a stored message from already validated data without re-validating.
+        
+        Args:
+            id: Unique identifier for the message
+            insert_message: Message data validated at the request boundary
+            created_at: Timestamp when the message was created
+            status: Initial moderation status
+            
+        Returns:
+            The stored message
+        """
+        return cls.model_construct(
+            id=id,
+            name=insert_message.name,
+            email=insert_message.email,
+            content=insert_message.content,
+            created_at=created_at,
+            status=status,
+            flagReasons=[]
+        )
@@ -4,8 +4,12 @@ RSVP models for the wedding e-invitation application.
 """
 
 from typing import Optional
+
 from pydantic import BaseModel, Field
 
+# One address without whitespace, so it can be used in mail headers as is
+EMAIL_PATTERN = r'^[^@\s,;<>"]+@[^@\s,;<>"]+\.[^@\s,;<>"]+$'
+
 
 class InsertRsvp(BaseModel):
     """
@@ -15,19 +19,72 @@ class InsertRsvp(BaseModel):
         name: Full name of the guest
         email: Email address of the guest
         attending: Whether the guest is attending the wedding
-        guestCount: Number of guests including themselves (optional)
+        guestCount: Number of guests including themselves, at least 1 (optional)
+        inviteCode: Invite code of the guest's household (optional)
     """
-    name: str = Field(..., description="Full name of the guest")
-    email: str = Field(..., description="Email address of the guest")
+    name: str = Field(
+        ..., min_length=1, max_length=200, description="Full name of the guest"
+    )
+    email: str = Field(
+        ...,
+        max_length=254,
+        pattern=EMAIL_PATTERN,
+        description="Email address of the guest"
+    )
     attending: bool = Field(..., description="Whether the guest is attending")
-    guestCount: Optional[int] = Field(None, description="Number of guests including themselves")
+    guestCount: Optional[int] = Field(
+        None, ge=1, description="Number of guests including themselves"
+    )
+    inviteCode: Optional[str] = Field(
+        None, description="Invite code of the guest's household"
+    )
+    
+    @property
+    def seats(self) -> int:
+        """Number of seats this RSVP holds, including the guest themselves."""
+        return (self.guestCount or 1) if self.attending else 0
 
 
 class Rsvp(InsertRsvp):
     """
-    Complete RSVP model including the ID.
+    Complete RSVP model including the ID and timestamps.
     
     Attributes:
         id: Unique identifier for the RSVP
+        created_at: Timestamp when the RSVP was first submitted
+        updated_at: Timestamp when the RSVP was last submitted
     """
-    id: int = Field(..., description="Unique identifier for the RSVP")
\ No newline at end of file
+    id: int = Field(..., description="Unique identifier for the RSVP")
+    created_at: str = Field(
+        ..., description="Timestamp when the RSVP was first submitted"
+    )
+    updated_at: str = Field(
+        ..., description="Timestamp when the RSVP was last submitted"
+    )
+    
+    @classmethod
+    def from_insert(
+        cls, id: int, insert_rsvp: InsertRsvp, created_at: str, updated_at: str
+    ) -> "Rsvp":
+        """
+        Build a stored RSVP from already validated data without re-validating.
+        
+        Args:
+            id: Unique identifier for the RSVP
+            insert_rsvp: RSVP data validated at the request boundary
+            created_at: Timestamp when the RSVP was first submitted
+            updated_at: Timestamp when the RSVP was last submitted
+            
+        Returns:
+            The stored RSVP
+        """
+        return cls.model_construct(
+            id=id,
+            name=insert_rsvp.name,
+            email=insert_rsvp.email,
+            attending=insert_rsvp.attending,
+            guestCount=insert_rsvp.guestCount,
+            inviteCode=insert_rsvp.inviteCode,
+            created_at=created_at,
+            updated_at=updated_at
+        )
@@ -0,0 +1,114 @@
+# app_modules/models/upload.py
+"""
+Resumable upload models for the wedding e-invitation application.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+# States of an upload session
+UPLOAD_RECEIVING = "receiving"
+UPLOAD_FORWARDING = "forwarding"
+UPLOAD_COMPLETE = "complete"
+UPLOAD_FAILED = "failed"
+
+
+class InsertUpload(BaseModel):
+    """
+    Schema for starting a resumable upload.
+    
+    Attributes:
+        fileName: Name of the file being uploaded
+        size: Total size of the file in bytes
+        contentType: MIME type of the file
+        sha256: Hex SHA-256 of the whole file, checked before forwarding (optional)
+        guestName: Name of the guest uploading the file (optional)
+    """
+    fileName: str = Field(
+        ..., min_length=1, max_length=255, description="Name of the file"
+    )
+    size: int = Field(..., gt=0, description="Total size of the file in bytes")
+    contentType: str = Field(
+        "application/octet-stream", description="MIME type of the file"
+    )
+    sha256: Optional[str] = Field(
+        None, pattern=r'^[0-9a-fA-F]{64}$', description="Hex SHA-256 of the whole file"
+    )
+    guestName: Optional[str] = Field(
+        None, max_length=255, description="Name of the guest"
+    )
+
+
+class Upload(InsertUpload):
+    """
+    Complete upload session including its parts and forwarding state.
+    
+    Attributes:
+        id: Unguessable identifier of the upload session
+        tenant: Slug of the hosted wedding the upload belongs to, None for the
+            default event
+        partSize: Size of every part except the last, in bytes
+        partCount: Number of parts the file is split into
+        receivedParts: Indexes of the parts received and verified so far
+        status: Upload state ("receiving", "forwarding", "complete" or "failed")
+        remoteFileId: ID of the file in the remote store once forwarded
+        webViewLink: Link to the file in the remote store once forwarded
+        error: Why the upload failed, if it did
+        created_at: Timestamp when the upload was started
+        updated_at: Timestamp when the upload last changed
+    """
+    id: str = Field(..., description="Identifier of the upload session")
+    tenant: Optional[str] = Field(None, description="Slug of the hosted wedding")
+    partSize: int = Field(..., description="Size of every part except the last")
+    partCount: int = Field(..., description="Number of parts")
+    receivedParts: List[int] = Field(
+        default_factory=list, description="Parts received so far"
+    )
+    status: str = Field(UPLOAD_RECEIVING, description="Upload state")
+    remoteFileId: Optional[str] = Field(
+        None, description="ID of the file in the remote store"
+    )
+    webViewLink: Optional[str] = Field(
+        None, description="Link to the file in the remote store"
+    )
+    error: Optional[str] = Field(None, description="Why the upload failed")
+    created_at: str = Field(..., description="Timestamp when the upload was started")
+    updated_at: str = Field(..., description="Timestamp when the upload last changed")
+    
+    @classmethod
+    def from_insert(
+        cls,
+        id: str,
+        insert_upload: InsertUpload,
+        part_size: int,
+        created_at: str,
+        tenant: Optional[str] = None
+    ) -> "Upload":
+        """
+        Build a new upload session from already validated data without re-validating.
+        
+        Args:
+            id: Identifier of the upload session
+            insert_upload: Upload data validated at the request boundary
+            part_size: Size of every part except the last
+            created_at: Timestamp when the upload was started
+            tenant: Slug of the hosted wedding, None for the default event
+            
+        Returns:
+            The new upload session
+        """
+        return cls.model_construct(
+            **insert_upload.model_dump(),
+            id=id,
+            tenant=tenant,
+            partSize=part_size,
+            partCount=-(-insert_upload.size // part_size),
+            receivedParts=[],
+            status=UPLOAD_RECEIVING,
+            remoteFileId=None,
+            webViewLink=None,
+            error=None,
+            created_at=created_at,
+            updated_at=created_at
+        )
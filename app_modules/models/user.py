@@ -3,7 +3,6 @@
 User models for the wedding e-invitation application.
 """
 
-from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -26,4 +25,22 @@ class User(InsertUser):
     Attributes:
         id: Unique identifier for the user
     """
-    id: int = Field(..., description="Unique identifier for the user")
\ No newline at end of file
+    id: int = Field(..., description="Unique identifier for the user")
+    
+    @classmethod
+    def from_insert(cls, id: int, insert_user: InsertUser) -> "User":
+        """
+        Build a stored user from already validated data without re-validating.
+        
+        Args:
+            id: Unique identifier for the user
+            insert_user: User data validated at the request boundary
+            
+        Returns:
+            The stored user
+        """
+        return cls.model_construct(
+            id=id,
+            username=insert_user.username,
+            password=insert_user.password
+        )
@@ -5,13 +5,20 @@ Repository interfaces and implementations for the wedding e-invitation applicati
 
 # Re-export all repository interfaces and implementations for easier imports
 from app_modules.repositories.interfaces import (
-    IUserRepository,
+    IConfigImageRepository,
+    IFeatureFlagRepository,
+    IInviteeRepository,
+    IMessageRepository,
     IRsvpRepository,
-    IMessageRepository
+    IUploadRepository,
+    IUserRepository,
 )
-
 from app_modules.repositories.memory_repositories import (
-    MemoryUserRepository,
+    MemoryConfigImageRepository,
+    MemoryFeatureFlagRepository,
+    MemoryInviteeRepository,
+    MemoryMessageRepository,
     MemoryRsvpRepository,
-    MemoryMessageRepository
-)
\ No newline at end of file
+    MemoryUploadRepository,
+    MemoryUserRepository,
+)
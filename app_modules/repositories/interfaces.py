@@ -7,9 +7,24 @@ must fulfill to interact with the application's data models.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from app_modules.models import User, InsertUser, Rsvp, InsertRsvp, Message, InsertMessage
+from app_modules.models import (
+    ConfigImage,
+    FeatureFlag,
+    Household,
+    InsertConfigImage,
+    InsertFeatureFlag,
+    InsertInvitee,
+    InsertMessage,
+    InsertRsvp,
+    InsertUpload,
+    InsertUser,
+    Message,
+    Rsvp,
+    Upload,
+    User,
+)
 
 
 class IUserRepository(ABC):
@@ -76,4 +91,128 @@ class IMessageRepository(ABC):
     @abstractmethod
     def create(self, insert_message: InsertMessage) -> Message:
         """Create a new message."""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def set_status(
+        self, id: int, status: str, flag_reasons: List[str]
+    ) -> Optional[Message]:
+        """Set the moderation status of a message."""
+        pass
+
+
+class IFeatureFlagRepository(ABC):
+    """Interface for feature flag repository operations."""
+    
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Counter that changes whenever any feature flag is written."""
+        pass
+    
+    @abstractmethod
+    def get_by_key(self, feature_key: str) -> Optional[FeatureFlag]:
+        """Get a feature flag by key."""
+        pass
+    
+    @abstractmethod
+    def get_all(self) -> List[FeatureFlag]:
+        """Get all feature flags."""
+        pass
+    
+    @abstractmethod
+    def create(self, insert_feature_flag: InsertFeatureFlag) -> FeatureFlag:
+        """Create a new feature flag."""
+        pass
+    
+    @abstractmethod
+    def update_enabled(self, feature_key: str, enabled: bool) -> Optional[FeatureFlag]:
+        """Enable or disable an existing feature flag."""
+        pass
+
+
+class IConfigImageRepository(ABC):
+    """Interface for configurable image repository operations."""
+    
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Counter that changes whenever any configurable image is written."""
+        pass
+    
+    @abstractmethod
+    def get_by_key(self, image_key: str) -> Optional[ConfigImage]:
+        """Get a configurable image by key."""
+        pass
+    
+    @abstractmethod
+    def get_all(self) -> List[ConfigImage]:
+        """Get all configurable images."""
+        pass
+    
+    @abstractmethod
+    def upsert(
+        self, image_key: str, insert_config_image: InsertConfigImage
+    ) -> ConfigImage:
+        """Create a configurable image or replace the one stored under the key."""
+        pass
+    
+    @abstractmethod
+    def delete(self, image_key: str) -> bool:
+        """Delete a configurable image."""
+        pass
+
+
+class IInviteeRepository(ABC):
+    """Interface for invitee list repository operations."""
+    
+    @abstractmethod
+    def bulk_load(self, invitees: List[InsertInvitee]) -> int:
+        """Replace the invitee list and return the number of households."""
+        pass
+    
+    @abstractmethod
+    def is_empty(self) -> bool:
+        """Check whether no invitee list has been loaded."""
+        pass
+    
+    @abstractmethod
+    def get_household_by_code(self, invite_code: str) -> Optional[Household]:
+        """Get a household by invite code."""
+        pass
+    
+    @abstractmethod
+    def get_household_by_email(self, email: str) -> Optional[Household]:
+        """Get the household of an invitee by email."""
+        pass
+
+
+class IUploadRepository(ABC):
+    """Interface for resumable upload session repository operations."""
+    
+    @abstractmethod
+    def get_by_id(self, id: str) -> Optional[Upload]:
+        """Get an upload session by ID."""
+        pass
+    
+    @abstractmethod
+    def get_all(self) -> List[Upload]:
+        """Get all upload sessions."""
+        pass
+    
+    @abstractmethod
+    def create(
+        self, insert_upload: InsertUpload, part_size: int, tenant: Optional[str] = None
+    ) -> Upload:
+        """Start a new upload session."""
+        pass
+    
+    @abstractmethod
+    def update(self, id: str, **fields: Any) -> Optional[Upload]:
+        """Update fields of an upload session."""
+        pass
+    
+    @abstractmethod
+    def delete(self, id: str) -> bool:
+        """Delete an upload session."""
+        pass
@@ -6,11 +6,35 @@ These implementations store data in memory for development and testing purposes.
 """
 
 import datetime
-from typing import Dict, List, Optional
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 
-from app_modules.models import User, InsertUser, Rsvp, InsertRsvp, Message, InsertMessage
+from app_modules.models import (
+    ConfigImage,
+    FeatureFlag,
+    Household,
+    InsertConfigImage,
+    InsertFeatureFlag,
+    InsertInvitee,
+    InsertMessage,
+    InsertRsvp,
+    InsertUpload,
+    InsertUser,
+    Message,
+    Rsvp,
+    Upload,
+    User,
+    normalize_email,
+    normalize_invite_code,
+)
 from app_modules.repositories.interfaces import (
-    IUserRepository, IRsvpRepository, IMessageRepository
+    IConfigImageRepository,
+    IFeatureFlagRepository,
+    IInviteeRepository,
+    IMessageRepository,
+    IRsvpRepository,
+    IUploadRepository,
+    IUserRepository,
 )
 
 
@@ -22,6 +46,10 @@ class MemoryUserRepository(IUserRepository):
         self.users: Dict[int, User] = {}
         self.current_id = 1
     
+    def __len__(self) -> int:
+        """Get the number of stored records."""
+        return len(self.users)
+    
     def get_by_id(self, id: int) -> Optional[User]:
         """Get a user by ID."""
         return self.users.get(id)
@@ -38,7 +66,7 @@ class MemoryUserRepository(IUserRepository):
         id = self.current_id
         self.current_id += 1
         
-        user = User(id=id, **insert_user.dict())
+        user = User.from_insert(id, insert_user)
         self.users[id] = user
         return user
 
@@ -49,18 +77,21 @@ class MemoryRsvpRepository(IRsvpRepository):
     def __init__(self):
         """Initialize the repository with an empty dict."""
         self.rsvps: Dict[int, Rsvp] = {}
+        self.ids_by_email: Dict[str, int] = {}
         self.current_id = 1
     
+    def __len__(self) -> int:
+        """Get the number of stored records."""
+        return len(self.rsvps)
+    
     def get_by_id(self, id: int) -> Optional[Rsvp]:
         """Get an RSVP by ID."""
         return self.rsvps.get(id)
     
     def get_by_email(self, email: str) -> Optional[Rsvp]:
         """Get an RSVP by email."""
-        for rsvp in self.rsvps.values():
-            if rsvp.email.lower() == email.lower():
-                return rsvp
-        return None
+        id = self.ids_by_email.get(normalize_email(email))
+        return None if id is None else self.rsvps.get(id)
     
     def get_all(self) -> List[Rsvp]:
         """Get all RSVPs."""
@@ -71,17 +102,25 @@ class MemoryRsvpRepository(IRsvpRepository):
         id = self.current_id
         self.current_id += 1
         
-        rsvp = Rsvp(id=id, **insert_rsvp.dict())
+        # Generate a timestamp for the current time
+        timestamp = datetime.datetime.now().isoformat()
+        
+        rsvp = Rsvp.from_insert(id, insert_rsvp, timestamp, timestamp)
         self.rsvps[id] = rsvp
+        self.ids_by_email[normalize_email(rsvp.email)] = id
         return rsvp
     
     def update(self, id: int, insert_rsvp: InsertRsvp) -> Rsvp:
         """Update an existing RSVP."""
-        if id not in self.rsvps:
+        existing = self.rsvps.get(id)
+        if existing is None:
             raise ValueError(f"RSVP with ID {id} not found")
         
-        rsvp = Rsvp(id=id, **insert_rsvp.dict())
+        rsvp = Rsvp.from_insert(
+            id, insert_rsvp, existing.created_at, datetime.datetime.now().isoformat()
+        )
         self.rsvps[id] = rsvp
+        self.ids_by_email[normalize_email(rsvp.email)] = id
         return rsvp
 
 
@@ -93,6 +132,10 @@ class MemoryMessageRepository(IMessageRepository):
         self.messages: Dict[int, Message] = {}
         self.current_id = 1
     
+    def __len__(self) -> int:
+        """Get the number of stored records."""
+        return len(self.messages)
+    
     def get_by_id(self, id: int) -> Optional[Message]:
         """Get a message by ID."""
         return self.messages.get(id)
@@ -110,10 +153,289 @@ class MemoryMessageRepository(IMessageRepository):
         # Generate a timestamp for the current time
         timestamp = datetime.datetime.now().isoformat()
         
-        message = Message(
-            id=id,
-            created_at=timestamp,
-            **insert_message.dict()
+        message = Message.from_insert(id, insert_message, timestamp)
+        self.messages[id] = message
+        return message
+    
+    def set_status(
+        self, id: int, status: str, flag_reasons: List[str]
+    ) -> Optional[Message]:
+        """Set the moderation status of a message."""
+        existing = self.messages.get(id)
+        if existing is None:
+            return None
+        
+        message = existing.model_copy(
+            update={"status": status, "flagReasons": flag_reasons}
         )
         self.messages[id] = message
-        return message
\ No newline at end of file
+        return message
+
+
+# Feature flags that exist out of the box, matching the Express storage defaults
+DEFAULT_FEATURE_FLAGS = [
+    InsertFeatureFlag(
+        featureKey='rsvp',
+        featureName='RSVP Form',
+        description='Allow guests to submit their attendance confirmation',
+    ),
+    InsertFeatureFlag(
+        featureKey='messages',
+        featureName='Message Board',
+        description='Allow guests to leave congratulatory messages',
+    ),
+    InsertFeatureFlag(
+        featureKey='gallery',
+        featureName='Photo Gallery',
+        description='Display wedding memories and allow photo uploads',
+    ),
+    InsertFeatureFlag(
+        featureKey='music',
+        featureName='Background Music',
+        description='Play background music on the invitation page',
+    ),
+    InsertFeatureFlag(
+        featureKey='countdown',
+        featureName='Wedding Countdown',
+        description='Show countdown timer to wedding date',
+    ),
+]
+
+
+class MemoryFeatureFlagRepository(IFeatureFlagRepository):
+    """In-memory implementation of the feature flag repository."""
+    
+    def __init__(self, defaults: Optional[List[InsertFeatureFlag]] = None):
+        """Initialize the repository with the default feature flags."""
+        self.feature_flags: Dict[str, FeatureFlag] = {}
+        self.current_id = 1
+        self._version = 0
+        
+        if defaults is None:
+            defaults = DEFAULT_FEATURE_FLAGS
+        for insert_feature_flag in defaults:
+            self.create(insert_feature_flag)
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever any feature flag is written."""
+        return self._version
+    
+    def get_by_key(self, feature_key: str) -> Optional[FeatureFlag]:
+        """Get a feature flag by key."""
+        return self.feature_flags.get(feature_key)
+    
+    def get_all(self) -> List[FeatureFlag]:
+        """Get all feature flags sorted by name."""
+        return sorted(self.feature_flags.values(), key=lambda f: f.featureName)
+    
+    def create(self, insert_feature_flag: InsertFeatureFlag) -> FeatureFlag:
+        """Create a new feature flag."""
+        id = self.current_id
+        self.current_id += 1
+        
+        feature_flag = FeatureFlag.from_insert(
+            id, insert_feature_flag, datetime.datetime.now().isoformat()
+        )
+        self.feature_flags[feature_flag.featureKey] = feature_flag
+        self._version += 1
+        return feature_flag
+    
+    def update_enabled(self, feature_key: str, enabled: bool) -> Optional[FeatureFlag]:
+        """Enable or disable an existing feature flag."""
+        existing = self.feature_flags.get(feature_key)
+        if existing is None:
+            return None
+        
+        feature_flag = existing.model_copy(update={
+            "enabled": enabled,
+            "updatedAt": datetime.datetime.now().isoformat()
+        })
+        self.feature_flags[feature_key] = feature_flag
+        self._version += 1
+        return feature_flag
+
+
+# Images that exist out of the box, matching the Express storage defaults
+DEFAULT_GALLERY_IMAGE_URLS = [
+    "https://images.unsplash.com/photo-1522673607200-164d1b3ce475?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+    "https://images.unsplash.com/photo-1494774157365-9e04c6720e47?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+    "https://images.unsplash.com/photo-1469371670807-013ccf25f16a?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+    "https://images.unsplash.com/photo-1583939003579-730e3918a45a?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+    "https://images.unsplash.com/photo-1537633552985-df8429e8048b?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+    "https://images.unsplash.com/photo-1519494026892-80bbd2d6fd0d?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+    "https://images.unsplash.com/photo-1545232979-8bf68ee9b1af?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+    "https://images.unsplash.com/photo-1530268729831-4b0b9e170218?ixlib=rb-4.0.3&auto=format&fit=crop&w=500&q=80",  # noqa: E501
+]
+
+DEFAULT_CONFIG_IMAGES = [
+    InsertConfigImage(
+        imageKey='banner',
+        imageUrl='https://images.unsplash.com/photo-1469371670807-013ccf25f16a?ixlib=rb-4.0.3&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&w=1920&q=80',  # noqa: E501
+        imageType='banner',
+        title='Main Banner',
+        description='Hero section background image',
+    ),
+] + [
+    InsertConfigImage(
+        imageKey=f'gallery_default_{index}',
+        imageUrl=url,
+        imageType='gallery',
+        title=f'Gallery Image {index}',
+        description=f'Default gallery image {index}',
+    )
+    for index, url in enumerate(DEFAULT_GALLERY_IMAGE_URLS, start=1)
+]
+
+
+class MemoryConfigImageRepository(IConfigImageRepository):
+    """In-memory implementation of the configurable image repository."""
+    
+    def __init__(self, defaults: Optional[List[InsertConfigImage]] = None):
+        """Initialize the repository with the default images."""
+        self.config_images: Dict[str, ConfigImage] = {}
+        self.current_id = 1
+        self._version = 0
+        
+        if defaults is None:
+            defaults = DEFAULT_CONFIG_IMAGES
+        for insert_config_image in defaults:
+            self.upsert(insert_config_image.imageKey, insert_config_image)
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever any configurable image is written."""
+        return self._version
+    
+    def get_by_key(self, image_key: str) -> Optional[ConfigImage]:
+        """Get a configurable image by key."""
+        return self.config_images.get(image_key)
+    
+    def get_all(self) -> List[ConfigImage]:
+        """Get all configurable images sorted by most recently updated."""
+        return sorted(
+            self.config_images.values(), key=lambda i: i.updatedAt, reverse=True
+        )
+    
+    def upsert(
+        self, image_key: str, insert_config_image: InsertConfigImage
+    ) -> ConfigImage:
+        """Create a configurable image or replace the one stored under the key."""
+        if image_key != insert_config_image.imageKey:
+            raise ValueError("Image key cannot be changed")
+        
+        existing = self.config_images.get(image_key)
+        if existing:
+            id = existing.id
+        else:
+            id = self.current_id
+            self.current_id += 1
+        
+        config_image = ConfigImage.from_insert(
+            id, insert_config_image, datetime.datetime.now().isoformat()
+        )
+        self.config_images[image_key] = config_image
+        self._version += 1
+        return config_image
+    
+    def delete(self, image_key: str) -> bool:
+        """Delete a configurable image."""
+        if self.config_images.pop(image_key, None) is None:
+            return False
+        
+        self._version += 1
+        return True
+
+
+class MemoryInviteeRepository(IInviteeRepository):
+    """In-memory implementation of the invitee list repository."""
+    
+    def __init__(self):
+        """Initialize the repository with an empty invitee list."""
+        # Households indexed by invite code and by invitee email, kept in one
+        # tuple so a bulk load can replace both with a single assignment
+        self.indexes: Tuple[Dict[str, Household], Dict[str, Household]] = ({}, {})
+    
+    def bulk_load(self, invitees: List[InsertInvitee]) -> int:
+        """Replace the invitee list and return the number of households."""
+        emails_by_code: Dict[str, List[str]] = {}
+        seats_by_code: Dict[str, int] = {}
+        for invitee in invitees:
+            code = normalize_invite_code(invitee.inviteCode)
+            emails_by_code.setdefault(code, []).append(normalize_email(invitee.email))
+            seats_by_code[code] = seats_by_code.get(code, 0) + invitee.seats
+        
+        households_by_code: Dict[str, Household] = {}
+        households_by_email: Dict[str, Household] = {}
+        for code, emails in emails_by_code.items():
+            household = Household.model_construct(
+                inviteCode=code,
+                emails=emails,
+                allowedSeats=seats_by_code[code]
+            )
+            households_by_code[code] = household
+            for email in emails:
+                households_by_email[email] = household
+        
+        self.indexes = (households_by_code, households_by_email)
+        return len(households_by_code)
+    
+    def is_empty(self) -> bool:
+        """Check whether no invitee list has been loaded."""
+        return not self.indexes[0]
+    
+    def get_household_by_code(self, invite_code: str) -> Optional[Household]:
+        """Get a household by invite code."""
+        return self.indexes[0].get(normalize_invite_code(invite_code))
+    
+    def get_household_by_email(self, email: str) -> Optional[Household]:
+        """Get the household of an invitee by email."""
+        return self.indexes[1].get(normalize_email(email))
+
+
+class MemoryUploadRepository(IUploadRepository):
+    """In-memory implementation of the upload session repository."""
+    
+    def __init__(self):
+        """Initialize the repository with an empty dict."""
+        self.uploads: Dict[str, Upload] = {}
+    
+    def __len__(self) -> int:
+        """Get the number of stored records."""
+        return len(self.uploads)
+    
+    def get_by_id(self, id: str) -> Optional[Upload]:
+        """Get an upload session by ID."""
+        return self.uploads.get(id)
+    
+    def get_all(self) -> List[Upload]:
+        """Get all upload sessions."""
+        return list(self.uploads.values())
+    
+    def create(
+        self, insert_upload: InsertUpload, part_size: int, tenant: Optional[str] = None
+    ) -> Upload:
+        """Start a new upload session."""
+        # Session IDs grant write access to the upload, so they must not be guessable
+        id = uuid.uuid4().hex
+        upload = Upload.from_insert(
+            id, insert_upload, part_size, datetime.datetime.now().isoformat(), tenant
+        )
+        self.uploads[id] = upload
+        return upload
+    
+    def update(self, id: str, **fields: Any) -> Optional[Upload]:
+        """Update fields of an upload session."""
+        existing = self.uploads.get(id)
+        if existing is None:
+            return None
+        
+        upload = existing.model_copy(
+            update={**fields, "updated_at": datetime.datetime.now().isoformat()}
+        )
+        self.uploads[id] = upload
+        return upload
+    
+    def delete(self, id: str) -> bool:
+        """Delete an upload session."""
+        return self.uploads.pop(id, None) is not None
@@ -6,7 +6,14 @@ These handlers process HTTP requests, interact with services,
 and return appropriate HTTP responses.
 """
 
+from app_modules.routes.config_image_routes import register_config_image_routes
+from app_modules.routes.diagnostics_routes import register_diagnostics_routes
+from app_modules.routes.feature_flag_routes import register_feature_flag_routes
+from app_modules.routes.message_routes import register_message_routes
+
 # Re-export route registration functions for easier imports
 from app_modules.routes.rsvp_routes import register_rsvp_routes
-from app_modules.routes.message_routes import register_message_routes
-from app_modules.routes.static_routes import register_static_routes
\ No newline at end of file
+from app_modules.routes.static_routes import register_static_routes
+from app_modules.routes.stats_routes import register_stats_routes
+from app_modules.routes.tenant_routes import register_tenant_routes
+from app_modules.routes.upload_routes import register_upload_routes
@@ -0,0 +1,107 @@
+# app_modules/routes/config_image_routes.py
+"""
+Configurable image route handlers for the wedding e-invitation application.
+"""
+
+import logging
+
+from flask import Flask, jsonify, request
+
+from app_modules.middleware import admin_required, current_services
+from app_modules.models import InsertConfigImage
+from app_modules.routes.responses import cached_json_response
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_config_image():
+    """Validate the request body as a configurable image."""
+    data = dict(request.json or {})
+    data.pop('adminKey', None)
+    return InsertConfigImage(**data)
+
+
+def register_config_image_routes(app: Flask) -> None:
+    """
+    Register configurable image routes with the Flask app.
+    
+    Args:
+        app: The Flask application instance
+    """
+    
+    @app.route('/api/config-images', methods=['GET'])
+    def get_config_images():
+        """Get all configurable images (public endpoint)."""
+        try:
+            config_image_service = current_services().config_image_service
+            return cached_json_response(config_image_service.get_all_images())
+        
+        except Exception:
+            logger.exception("Error fetching config images")
+            return jsonify({"message": "Failed to fetch images"}), 500
+    
+    @app.route('/api/config-images/<image_type>', methods=['GET'])
+    def get_config_images_by_type(image_type):
+        """Get active configurable images of a type (public endpoint)."""
+        try:
+            config_image_service = current_services().config_image_service
+            return cached_json_response(
+                config_image_service.get_images_by_type(image_type)
+            )
+        
+        except Exception:
+            logger.exception("Error fetching config images by type")
+            return jsonify({"message": "Failed to fetch images"}), 500
+    
+    @app.route('/api/admin/config-images', methods=['POST'])
+    @admin_required
+    def save_config_image():
+        """Create or update a configurable image (admin only)."""
+        try:
+            validated_data = _parse_config_image()
+        except Exception as e:
+            logger.warning("Config image validation error: %s", e)
+            return jsonify({"message": f"Invalid image configuration: {str(e)}"}), 400
+        
+        try:
+            config_image_service = current_services().config_image_service
+            response_data, status_code = config_image_service.save_image(validated_data)
+            return jsonify(response_data), status_code
+        
+        except Exception:
+            logger.exception("Config image update error")
+            return jsonify({"message": "Failed to update image configuration"}), 500
+    
+    @app.route('/api/admin/config-images/<image_key>', methods=['PUT'])
+    @admin_required
+    def update_config_image(image_key):
+        """Update an existing configurable image (admin only)."""
+        try:
+            validated_data = _parse_config_image()
+        except Exception as e:
+            logger.warning("Config image validation error: %s", e)
+            return jsonify({"message": f"Invalid image configuration: {str(e)}"}), 400
+        
+        try:
+            config_image_service = current_services().config_image_service
+            response_data, status_code = config_image_service.update_image(
+                image_key, validated_data
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception:
+            logger.exception("Config image update error")
+            return jsonify({"message": "Failed to update image configuration"}), 500
+    
+    @app.route('/api/admin/config-images/<image_key>', methods=['DELETE'])
+    @admin_required
+    def delete_config_image(image_key):
+        """Delete a configurable image (admin only)."""
+        try:
+            config_image_service = current_services().config_image_service
+            response_data, status_code = config_image_service.delete_image(image_key)
+            return jsonify(response_data), status_code
+        
+        except Exception:
+            logger.exception("Config image delete error")
+            return jsonify({"message": "Failed to delete image configuration"}), 500
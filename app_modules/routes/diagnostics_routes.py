@@ -0,0 +1,132 @@
+# app_modules/routes/diagnostics_routes.py
+"""
+Admin diagnostics route handlers for the wedding e-invitation application.
+"""
+
+import logging
+
+from flask import Flask, current_app, jsonify, request
+
+from app_modules.middleware import (
+    admin_required,
+    current_services,
+    platform_admin_required,
+)
+from app_modules.services import (
+    allocation_tracer,
+    moderation_service,
+    notification_service,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def register_diagnostics_routes(app: Flask) -> None:
+    """
+    Register admin diagnostics routes with the Flask app.
+    
+    Args:
+        app: The Flask application instance
+    """
+    
+    @app.route('/api/admin/diagnostics/memory', methods=['GET'])
+    @admin_required
+    def get_memory_report():
+        """Report record counts and deep byte sizes per repository."""
+        try:
+            diagnostics_service = current_services().diagnostics_service
+            response_data, status_code = diagnostics_service.get_memory_report()
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error building memory report")
+            return jsonify({"message": f"Failed to build memory report: {str(e)}"}), 500
+    
+    @app.route('/api/admin/diagnostics/memory/snapshot', methods=['POST'])
+    @platform_admin_required
+    def take_allocation_snapshot():
+        """Take a tracemalloc snapshot and report the top-N diff to the previous one."""
+        try:
+            top = request.args.get('top', 10, type=int)
+            response_data, status_code = allocation_tracer.take_allocation_snapshot(top)
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error taking allocation snapshot")
+            return jsonify({
+                "message": f"Failed to take allocation snapshot: {str(e)}"
+            }), 500
+    
+    @app.route('/api/admin/diagnostics/memory/snapshot', methods=['DELETE'])
+    @platform_admin_required
+    def stop_allocation_tracing():
+        """Stop allocation tracing."""
+        try:
+            response_data, status_code = allocation_tracer.stop_allocation_tracing()
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error stopping allocation tracing")
+            return jsonify({
+                "message": f"Failed to stop allocation tracing: {str(e)}"
+            }), 500
+    
+    @app.route('/api/admin/diagnostics/admission', methods=['GET'])
+    @platform_admin_required
+    def get_admission_stats():
+        """Report admission control load and shedding counters."""
+        try:
+            controller = current_app.extensions.get('admission_control')
+            if controller is None:
+                return jsonify({"message": "Admission control is not enabled"}), 404
+            return jsonify(controller.get_stats()), 200
+        
+        except Exception as e:
+            logger.exception("Error fetching admission stats")
+            return jsonify({
+                "message": f"Failed to fetch admission stats: {str(e)}"
+            }), 500
+    
+    @app.route('/api/admin/diagnostics/logging', methods=['GET'])
+    @platform_admin_required
+    def get_logging_stats():
+        """Report the log queue's fill level and dropped records."""
+        try:
+            handler = current_app.extensions.get('log_queue_handler')
+            if handler is None:
+                return jsonify({"message": "Structured logging is not enabled"}), 404
+            return jsonify(handler.get_stats()), 200
+        
+        except Exception as e:
+            logger.exception("Error fetching logging stats")
+            return jsonify({"message": f"Failed to fetch logging stats: {str(e)}"}), 500
+    
+    @app.route('/api/admin/diagnostics/moderation', methods=['GET'])
+    @platform_admin_required
+    def get_moderation_stats():
+        """Report the message moderation pipeline counters."""
+        try:
+            return jsonify(moderation_service.get_stats()), 200
+        
+        except Exception as e:
+            logger.exception("Error fetching moderation stats")
+            return jsonify({
+                "message": f"Failed to fetch moderation stats: {str(e)}"
+            }), 500
+    
+    @app.route('/api/admin/diagnostics/notifications', methods=['GET'])
+    @platform_admin_required
+    def get_notification_stats():
+        """Report the RSVP email queue counters."""
+        try:
+            if notification_service is None:
+                return jsonify({
+                    "message": "Email notifications are not configured"
+                }), 404
+            return jsonify(notification_service.get_stats()), 200
+        
+        except Exception as e:
+            logger.exception("Error fetching notification stats")
+            return jsonify({
+                "message": f"Failed to fetch notification stats: {str(e)}"
+            }), 500
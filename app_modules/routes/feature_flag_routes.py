@@ -0,0 +1,90 @@
+# app_modules/routes/feature_flag_routes.py
+"""
+Feature flag route handlers for the wedding e-invitation application.
+"""
+
+import logging
+
+from flask import Flask, jsonify, request
+
+from app_modules.middleware import admin_required, current_services
+from app_modules.models import InsertFeatureFlag
+from app_modules.routes.responses import cached_json_response
+
+logger = logging.getLogger(__name__)
+
+
+def register_feature_flag_routes(app: Flask) -> None:
+    """
+    Register feature flag routes with the Flask app.
+    
+    Args:
+        app: The Flask application instance
+    """
+    
+    @app.route('/api/feature-flags', methods=['GET'])
+    def get_feature_flags():
+        """Get all feature flags (public endpoint for the frontend)."""
+        try:
+            feature_flag_service = current_services().feature_flag_service
+            return cached_json_response(feature_flag_service.get_all_feature_flags())
+        
+        except Exception:
+            logger.exception("Error fetching feature flags")
+            return jsonify({"message": "Failed to fetch feature flags"}), 500
+    
+    @app.route('/api/feature-flags/<feature_key>', methods=['GET'])
+    def get_feature_flag(feature_key):
+        """Get a specific feature flag (public endpoint)."""
+        try:
+            feature_flag_service = current_services().feature_flag_service
+            response_data, status_code = feature_flag_service.get_feature_flag(
+                feature_key
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception:
+            logger.exception("Error fetching feature flag")
+            return jsonify({"message": "Failed to fetch feature flag"}), 500
+    
+    @app.route('/api/admin/feature-flags/<feature_key>', methods=['PATCH'])
+    @admin_required
+    def update_feature_flag(feature_key):
+        """Enable or disable a feature flag (admin only)."""
+        try:
+            enabled = (request.json or {}).get('enabled')
+            if not isinstance(enabled, bool):
+                return jsonify({"message": "Enabled status must be a boolean"}), 400
+            
+            feature_flag_service = current_services().feature_flag_service
+            response_data, status_code = feature_flag_service.update_feature_flag(
+                feature_key, enabled
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception:
+            logger.exception("Error updating feature flag")
+            return jsonify({"message": "Failed to update feature flag"}), 500
+    
+    @app.route('/api/admin/feature-flags', methods=['POST'])
+    @admin_required
+    def create_feature_flag():
+        """Create a new feature flag (admin only)."""
+        try:
+            data = dict(request.json or {})
+            data.pop('adminKey', None)
+            validated_data = InsertFeatureFlag(**data)
+        except Exception as e:
+            logger.warning("Feature flag validation error: %s", e)
+            return jsonify({"message": f"Failed to create feature flag: {str(e)}"}), 400
+        
+        try:
+            feature_flag_service = current_services().feature_flag_service
+            response_data, status_code = feature_flag_service.create_feature_flag(
+                validated_data
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception:
+            logger.exception("Feature flag creation error")
+            return jsonify({"message": "Failed to create feature flag"}), 500
@@ -3,9 +3,15 @@
 Message route handlers for the wedding e-invitation application.
 """
 
-from flask import Blueprint, request, jsonify, Flask
+import logging
+
+from flask import Flask, jsonify, request
+
+from app_modules.middleware import admin_required, current_services
 from app_modules.models import InsertMessage
-from app_modules.services import message_service
+from app_modules.routes.responses import cached_json_response
+
+logger = logging.getLogger(__name__)
 
 
 def register_message_routes(app: Flask) -> None:
@@ -24,20 +30,57 @@ def register_message_routes(app: Flask) -> None:
             validated_data = InsertMessage(**data)
             
             # Process the message
+            message_service = current_services().message_service
             response_data, status_code = message_service.submit_message(validated_data)
             return jsonify(response_data), status_code
         
         except Exception as e:
-            print(f"Message submission error: {str(e)}")
+            logger.warning("Message submission error: %s", e)
             return jsonify({"message": f"Failed to submit message: {str(e)}"}), 400
     
     @app.route('/api/messages', methods=['GET'])
     def get_messages():
-        """Get all messages from the message board."""
+        """Get the approved messages from the message board."""
+        try:
+            message_service = current_services().message_service
+            return cached_json_response(message_service.get_approved_response())
+        
+        except Exception as e:
+            logger.exception("Error fetching messages")
+            return jsonify({"message": f"Failed to fetch messages: {str(e)}"}), 500
+    
+    @app.route('/api/admin/messages', methods=['GET'])
+    @admin_required
+    def get_messages_admin():
+        """Get all messages with their moderation status (admin only)."""
         try:
-            response_data, status_code = message_service.get_all_messages()
+            message_service = current_services().message_service
+            response_data, status_code = message_service.get_all_messages_admin(
+                request.args.get('status')
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error fetching messages")
+            return jsonify({"message": f"Failed to fetch messages: {str(e)}"}), 500
+    
+    @app.route('/api/admin/messages/<int:message_id>', methods=['PATCH'])
+    @admin_required
+    def update_message_status(message_id):
+        """Approve or flag a message (admin only)."""
+        try:
+            status = (request.json or {}).get('status')
+            if not isinstance(status, str):
+                return jsonify({"message": "Status must be a string"}), 400
+            
+            message_service = current_services().message_service
+            response_data, status_code = message_service.set_message_status(
+                message_id, status
+            )
             return jsonify(response_data), status_code
         
         except Exception as e:
-            print(f"Error fetching messages: {str(e)}")
-            return jsonify({"message": f"Failed to fetch messages: {str(e)}"}), 500
\ No newline at end of file
+            logger.exception("Error updating message status")
+            return jsonify({
+                "message": f"Failed to update message status: {str(e)}"
+            }), 500
@@ -0,0 +1,38 @@
+# app_modules/routes/responses.py
+"""
+Shared response helpers for the route handlers.
+"""
+
+from flask import Response, request
+
+from app_modules.middleware.compression import encoded_etags
+from app_modules.services.response_cache import CachedResponse
+
+
+def cached_json_response(cached: CachedResponse) -> Response:
+    """
+    Serve a precomputed JSON body, honouring If-None-Match.
+    
+    The ETags of compressed copies of the body also match, so clients that
+    received one get a 304 too.
+    
+    Args:
+        cached: The cached response body and ETag
+        
+    Returns:
+        A 304 response if the client already has this body, otherwise a 200
+    """
+    matched = next(
+        (
+            etag for etag in encoded_etags(cached.etag)
+            if etag in request.if_none_match
+        ),
+        None
+    )
+    if matched is not None:
+        response = Response(status=304)
+        response.set_etag(matched)
+    else:
+        response = Response(cached.body, status=200, mimetype='application/json')
+        response.set_etag(cached.etag)
+    return response
@@ -3,9 +3,15 @@
 RSVP route handlers for the wedding e-invitation application.
 """
 
-from flask import Blueprint, request, jsonify, Flask
-from app_modules.models import InsertRsvp
-from app_modules.services import rsvp_service
+import logging
+
+from flask import Flask, jsonify, request
+
+from app_modules.middleware import admin_required, current_services
+from app_modules.models import InsertInvitee, InsertRsvp
+from app_modules.routes.responses import cached_json_response
+
+logger = logging.getLogger(__name__)
 
 
 def register_rsvp_routes(app: Flask) -> None:
@@ -24,31 +30,55 @@ def register_rsvp_routes(app: Flask) -> None:
             validated_data = InsertRsvp(**data)
             
             # Process the RSVP
+            rsvp_service = current_services().rsvp_service
             response_data, status_code = rsvp_service.submit_rsvp(validated_data)
             return jsonify(response_data), status_code
         
         except Exception as e:
-            print(f"RSVP submission error: {str(e)}")
+            logger.warning("RSVP submission error: %s", e)
             return jsonify({"message": f"Failed to submit RSVP: {str(e)}"}), 400
     
     @app.route('/api/rsvp', methods=['GET'])
     def get_rsvps():
         """Get all RSVPs with statistics."""
         try:
-            response_data, status_code = rsvp_service.get_all_rsvps()
-            return jsonify(response_data), status_code
+            rsvp_service = current_services().rsvp_service
+            return cached_json_response(rsvp_service.get_all_rsvps_response())
         
         except Exception as e:
-            print(f"Error fetching RSVPs: {str(e)}")
+            logger.exception("Error fetching RSVPs")
             return jsonify({"message": f"Failed to fetch RSVPs: {str(e)}"}), 500
     
     @app.route('/api/rsvp/<email>', methods=['GET'])
     def get_rsvp_by_email(email):
         """Get an RSVP by email address."""
         try:
+            rsvp_service = current_services().rsvp_service
             response_data, status_code = rsvp_service.get_rsvp_by_email(email)
             return jsonify(response_data), status_code
         
         except Exception as e:
-            print(f"Error fetching RSVP: {str(e)}")
-            return jsonify({"message": f"Failed to fetch RSVP: {str(e)}"}), 500
\ No newline at end of file
+            logger.exception("Error fetching RSVP")
+            return jsonify({"message": f"Failed to fetch RSVP: {str(e)}"}), 500
+    
+    @app.route('/api/admin/invitees', methods=['POST'])
+    @admin_required
+    def load_invitees():
+        """Replace the invitee list used to match RSVPs to households (admin only)."""
+        try:
+            data = request.json or {}
+            invitees = [
+                InsertInvitee(**invitee) for invitee in data.get('invitees', [])
+            ]
+        except Exception as e:
+            logger.warning("Invitee list validation error: %s", e)
+            return jsonify({"message": f"Invalid invitee list: {str(e)}"}), 400
+        
+        try:
+            rsvp_service = current_services().rsvp_service
+            response_data, status_code = rsvp_service.load_invitees(invitees)
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error loading invitee list")
+            return jsonify({"message": f"Failed to load invitee list: {str(e)}"}), 500
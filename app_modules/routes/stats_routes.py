@@ -0,0 +1,36 @@
+# app_modules/routes/stats_routes.py
+"""
+Statistics route handlers for the wedding e-invitation application.
+"""
+
+import logging
+
+from flask import Flask, jsonify, request
+
+from app_modules.middleware import current_services
+
+logger = logging.getLogger(__name__)
+
+
+def register_stats_routes(app: Flask) -> None:
+    """
+    Register statistics routes with the Flask app.
+    
+    Args:
+        app: The Flask application instance
+    """
+    
+    @app.route('/api/stats/timeseries', methods=['GET'])
+    def get_timeseries():
+        """Get RSVP and message activity bucketed by minute, hour or day."""
+        try:
+            bucket = request.args.get('bucket', 'hour')
+            activity_stats_service = current_services().activity_stats_service
+            response_data, status_code = activity_stats_service.get_timeseries(bucket)
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error fetching activity stats")
+            return jsonify({
+                "message": f"Failed to fetch activity stats: {str(e)}"
+            }), 500
@@ -0,0 +1,84 @@
+# app_modules/routes/tenant_routes.py
+"""
+Hosted wedding (tenant) admin route handlers for the wedding e-invitation application.
+"""
+
+import logging
+
+from flask import Flask, jsonify, request
+
+from app_modules.middleware import hash_admin_password, platform_admin_required
+from app_modules.services import tenant_registry
+
+logger = logging.getLogger(__name__)
+
+# Shortest admin password accepted for a hosted wedding
+MIN_ADMIN_PASSWORD_LENGTH = 8
+
+
+def register_tenant_routes(app: Flask) -> None:
+    """
+    Register tenant administration routes with the Flask app.
+    
+    Args:
+        app: The Flask application instance
+    """
+    
+    @app.route('/api/admin/tenants', methods=['POST'])
+    @platform_admin_required
+    def create_tenant():
+        """Create a new hosted wedding with its own admin password.
+        
+        Only the platform admin can create weddings.
+        """
+        try:
+            data = request.json or {}
+            slug = str(data.get('slug', '')).strip().lower()
+            couple_email = data.get('coupleEmail')
+            if couple_email is not None and (
+                not isinstance(couple_email, str) or '@' not in couple_email
+            ):
+                return jsonify({"message": "coupleEmail must be an email address"}), 400
+            
+            admin_password = data.get('adminPassword')
+            if (
+                not isinstance(admin_password, str)
+                or len(admin_password) < MIN_ADMIN_PASSWORD_LENGTH
+            ):
+                return jsonify({
+                    "message": (
+                        f"adminPassword must be at least "
+                        f"{MIN_ADMIN_PASSWORD_LENGTH} characters"
+                    )
+                }), 400
+            
+            created = tenant_registry.create(
+                slug,
+                couple_email=couple_email,
+                admin_password_hash=hash_admin_password(admin_password)
+            )
+            if not created:
+                return jsonify({"message": f"Wedding '{slug}' already exists"}), 409
+            
+            return jsonify({
+                "message": "Wedding created successfully",
+                "slug": slug
+            }), 201
+        
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        
+        except Exception as e:
+            logger.exception("Tenant creation error")
+            return jsonify({"message": f"Failed to create wedding: {str(e)}"}), 500
+    
+    @app.route('/api/admin/tenants', methods=['GET'])
+    @platform_admin_required
+    def get_tenant_stats():
+        """Get the active tenants and eviction counters (platform admin only)."""
+        try:
+            return jsonify(tenant_registry.get_stats()), 200
+        
+        except Exception as e:
+            logger.exception("Error fetching tenant stats")
+            return jsonify({"message": f"Failed to fetch tenant stats: {str(e)}"}), 500
@@ -0,0 +1,142 @@
+# app_modules/routes/upload_routes.py
+"""
+Resumable upload route handlers for the wedding e-invitation application.
+
+Protocol:
+    POST   /api/uploads                 start an upload with the file's size
+    PUT    /api/uploads/<id>            send one part, with Content-Range and
+                                        X-Part-SHA256
+    GET    /api/uploads/<id>            get the received and missing parts
+    POST   /api/uploads/<id>/complete   finish and forward the upload
+    DELETE /api/uploads/<id>            cancel the upload
+"""
+
+import logging
+import re
+from typing import Optional, Tuple
+
+from flask import Flask, g, jsonify, request
+
+from app_modules.models import InsertUpload
+from app_modules.services import upload_service
+
+logger = logging.getLogger(__name__)
+
+CONTENT_RANGE_PATTERN = re.compile(r'^bytes (\d+)-(\d+)/(\d+|\*)$')
+CHECKSUM_PATTERN = re.compile(r'^[0-9a-fA-F]{64}$')
+
+
+def _parse_content_range(
+    header: Optional[str]
+) -> Optional[Tuple[int, int, Optional[int]]]:
+    """Parse a Content-Range header into a part's offset, length and total size.
+    
+    The total is None when the header gives it as ``*``.
+    """
+    match = CONTENT_RANGE_PATTERN.match(header or '')
+    if not match:
+        return None
+    start, end = int(match.group(1)), int(match.group(2))
+    if end < start:
+        return None
+    total = None if match.group(3) == '*' else int(match.group(3))
+    return start, end - start + 1, total
+
+
+def register_upload_routes(app: Flask) -> None:
+    """
+    Register resumable upload routes with the Flask app.
+    
+    Args:
+        app: The Flask application instance
+    """
+    
+    @app.route('/api/uploads', methods=['POST'])
+    def start_upload():
+        """Start a resumable upload."""
+        try:
+            validated_data = InsertUpload(**(request.json or {}))
+        except Exception as e:
+            logger.warning("Upload validation error: %s", e)
+            return jsonify({"message": f"Invalid upload: {str(e)}"}), 400
+        
+        try:
+            response_data, status_code = upload_service.initiate(
+                validated_data, g.get('tenant')
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error starting upload")
+            return jsonify({"message": f"Failed to start upload: {str(e)}"}), 500
+    
+    @app.route('/api/uploads/<upload_id>', methods=['PUT'])
+    def upload_part(upload_id):
+        """Receive one part of an upload."""
+        part_range = _parse_content_range(request.headers.get('Content-Range'))
+        if part_range is None:
+            return jsonify({
+                "message": "Content-Range header must be 'bytes start-end/total'"
+            }), 400
+        
+        checksum = request.headers.get('X-Part-SHA256', '')
+        if not CHECKSUM_PATTERN.match(checksum):
+            return jsonify({
+                "message": "X-Part-SHA256 header must be the part's hex SHA-256"
+            }), 400
+        
+        try:
+            offset, length, total = part_range
+            response_data, status_code = upload_service.write_part(
+                upload_id,
+                offset,
+                length,
+                total,
+                request.stream,
+                checksum,
+                g.get('tenant')
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error receiving upload part")
+            return jsonify({"message": f"Failed to receive part: {str(e)}"}), 500
+    
+    @app.route('/api/uploads/<upload_id>', methods=['GET'])
+    def get_upload(upload_id):
+        """Get the progress of an upload."""
+        try:
+            response_data, status_code = upload_service.get_status(
+                upload_id, g.get('tenant')
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error fetching upload")
+            return jsonify({"message": f"Failed to fetch upload: {str(e)}"}), 500
+    
+    @app.route('/api/uploads/<upload_id>/complete', methods=['POST'])
+    def complete_upload(upload_id):
+        """Finish an upload and forward it to the remote store."""
+        try:
+            response_data, status_code = upload_service.complete(
+                upload_id, g.get('tenant')
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error completing upload")
+            return jsonify({"message": f"Failed to complete upload: {str(e)}"}), 500
+    
+    @app.route('/api/uploads/<upload_id>', methods=['DELETE'])
+    def cancel_upload(upload_id):
+        """Cancel an upload."""
+        try:
+            response_data, status_code = upload_service.abort(
+                upload_id, g.get('tenant')
+            )
+            return jsonify(response_data), status_code
+        
+        except Exception as e:
+            logger.exception("Error cancelling upload")
+            return jsonify({"message": f"Failed to cancel upload: {str(e)}"}), 500
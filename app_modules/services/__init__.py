@@ -6,16 +6,162 @@ The service layer contains business logic and orchestrates interactions
 between repositories and the application's routes.
 """
 
+import os
+
 # Re-export service classes for easier imports
-from app_modules.services.rsvp_service import RsvpService
+from app_modules.repositories.memory_repositories import MemoryUploadRepository
+from app_modules.services.activity_stats_service import ActivityStatsService
+from app_modules.services.config_image_service import ConfigImageService
+from app_modules.services.container import RepositorySet, ServiceContainer
+from app_modules.services.diagnostics_service import (
+    AllocationTracer,
+    DiagnosticsService,
+)
+from app_modules.services.feature_flag_service import FeatureFlagService
 from app_modules.services.message_service import MessageService
+from app_modules.services.moderation_service import (
+    BlockedWordsCheck,
+    EmailRateCheck,
+    LinkCheck,
+    ModerationService,
+    SpamHeuristicsCheck,
+)
+from app_modules.services.notification_service import (
+    NotificationService,
+    SmtpConnectionPool,
+)
+from app_modules.services.remote_store import (
+    GoogleDriveStore,
+    LocalDirectoryStore,
+    RemoteStore,
+)
+from app_modules.services.rsvp_service import RsvpService
+from app_modules.services.tenant_registry import TenantRegistry
+from app_modules.services.upload_service import UploadService
+
+
+def _env_flag(name: str) -> bool:
+    """Read a boolean switch such as ``SMTP_STARTTLS=1`` from the environment."""
+    return os.environ.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+# Venue capacity applied to every event, if configured
+VENUE_CAPACITY = (
+    int(os.environ['VENUE_CAPACITY']) if os.environ.get('VENUE_CAPACITY') else None
+)
 
-# Import repository implementations
-from app_modules.repositories.memory_repositories import (
-    MemoryRsvpRepository,
-    MemoryMessageRepository
+# Create the moderation pipeline shared by every event's message board
+moderation_service = ModerationService(
+    checks=[
+        BlockedWordsCheck(os.environ.get('MODERATION_BLOCKED_WORDS', '').split(',')),
+        LinkCheck(max_links=int(os.environ.get('MODERATION_MAX_LINKS', '0'))),
+        SpamHeuristicsCheck(),
+        EmailRateCheck(
+            max_messages=int(os.environ.get('MODERATION_EMAIL_RATE', '3')),
+            window_seconds=float(os.environ.get('MODERATION_EMAIL_WINDOW', '600'))
+        ),
+    ],
+    batch_size=int(os.environ.get('MODERATION_BATCH_SIZE', '50')),
+    max_workers=int(os.environ.get('MODERATION_WORKERS', '2'))
 )
 
-# Create service instances for use throughout the application
-rsvp_service = RsvpService(MemoryRsvpRepository())
-message_service = MessageService(MemoryMessageRepository())
\ No newline at end of file
+# Create the allocation tracer; tracemalloc is process-wide, so every event
+# shares this one
+allocation_tracer = AllocationTracer()
+
+# Create the RSVP email queue shared by every event, if an SMTP server is
+# configured
+notification_service = None
+if os.environ.get('SMTP_HOST'):
+    notification_workers = int(os.environ.get('NOTIFICATION_WORKERS', '2'))
+    notification_service = NotificationService(
+        pool=SmtpConnectionPool(
+            host=os.environ['SMTP_HOST'],
+            port=int(os.environ.get('SMTP_PORT', '25')),
+            username=os.environ.get('SMTP_USERNAME'),
+            password=os.environ.get('SMTP_PASSWORD'),
+            starttls=_env_flag('SMTP_STARTTLS'),
+            size=notification_workers
+        ),
+        sender=os.environ.get('NOTIFICATION_FROM', 'noreply@localhost'),
+        db_path=os.environ.get('NOTIFICATION_DB', 'notifications.sqlite3'),
+        coalesce_delay=float(os.environ.get('NOTIFICATION_COALESCE_SECONDS', '60')),
+        digest_interval=float(
+            os.environ.get('NOTIFICATION_DIGEST_SECONDS', '3600')
+        ),
+        workers=notification_workers,
+        confirm_unlisted=_env_flag('NOTIFICATION_CONFIRM_UNLISTED'),
+        max_per_recipient=int(os.environ.get('NOTIFICATION_MAX_PER_RECIPIENT', '5'))
+    )
+
+# Forward resumable uploads to Google Drive when OAuth2 credentials are configured,
+# otherwise keep them in the directory the Express server serves uploads from
+if os.environ.get('GOOGLE_REFRESH_TOKEN'):
+    upload_remote_store: RemoteStore = GoogleDriveStore(
+        folder_id=os.environ.get(
+            'GOOGLE_DRIVE_FOLDER_ID', '1InY5WMWJ4OOQZFv3SXEljD0JnSP5eEQC'
+        ),
+        client_id=os.environ.get('GOOGLE_CLIENT_ID', ''),
+        client_secret=os.environ.get('GOOGLE_CLIENT_SECRET', ''),
+        refresh_token=os.environ['GOOGLE_REFRESH_TOKEN'],
+        api_base=os.environ.get('GOOGLE_DRIVE_API_BASE', 'https://www.googleapis.com'),
+        token_url=os.environ.get(
+            'GOOGLE_TOKEN_URL', 'https://oauth2.googleapis.com/token'
+        )
+    )
+else:
+    upload_remote_store = LocalDirectoryStore(
+        os.environ.get('UPLOAD_LOCAL_DIR', 'public/uploads')
+    )
+
+# Create the resumable upload service shared by every event
+upload_service = UploadService(
+    repository=MemoryUploadRepository(),
+    remote_store=upload_remote_store,
+    storage_dir=os.environ.get('UPLOAD_STATE_DIR', 'upload_state'),
+    part_size=int(os.environ.get('UPLOAD_PART_SIZE', str(8 * 1024 * 1024))),
+    max_size=int(os.environ.get('UPLOAD_MAX_SIZE', str(2 * 1024 * 1024 * 1024))),
+    max_pending_bytes=int(
+        os.environ.get('UPLOAD_MAX_PENDING_BYTES', str(20 * 1024 * 1024 * 1024))
+    ),
+    workers=int(os.environ.get('UPLOAD_WORKERS', '2'))
+)
+
+# Options for the services of every event, default or hosted
+container_options = {
+    "venue_capacity": VENUE_CAPACITY,
+    "moderation_service": moderation_service,
+    "notification_service": notification_service,
+}
+
+# Create the services of the default event, used when no tenant is selected
+default_services = ServiceContainer(
+    **container_options, couple_email=os.environ.get('NOTIFICATION_COUPLE_EMAIL')
+)
+
+# Create the registry of additional hosted events
+tenant_registry = TenantRegistry(
+    state_dir=os.environ.get('TENANT_STATE_DIR', 'tenant_state'),
+    max_active=int(os.environ.get('TENANT_MAX_ACTIVE', '100')),
+    container_factory=lambda **settings: ServiceContainer(
+        **container_options, **settings
+    ),
+    state_loader=lambda state: ServiceContainer.from_state(
+        state,
+        moderation_service=moderation_service,
+        notification_service=notification_service
+    )
+)
+
+# Expose the default event's repositories and services for direct use
+rsvp_repository = default_services.repositories.rsvps
+message_repository = default_services.repositories.messages
+user_repository = default_services.repositories.users
+invitee_repository = default_services.repositories.invitees
+
+activity_stats_service = default_services.activity_stats_service
+rsvp_service = default_services.rsvp_service
+message_service = default_services.message_service
+feature_flag_service = default_services.feature_flag_service
+config_image_service = default_services.config_image_service
+diagnostics_service = default_services.diagnostics_service
@@ -0,0 +1,112 @@
+# app_modules/services/activity_stats_service.py
+"""
+Activity statistics service for charting when RSVPs and messages arrived.
+
+Counters are maintained incrementally at write time for minute, hour and day
+buckets, so reading a time series costs O(buckets) instead of O(records).
+"""
+
+import datetime
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# How many buckets of each granularity are retained before the oldest is dropped
+BUCKET_RETENTION = {
+    "minute": 24 * 60,
+    "hour": 90 * 24,
+    "day": 5 * 365,
+}
+
+
+def bucket_start(timestamp: datetime.datetime, bucket: str) -> datetime.datetime:
+    """
+    Truncate a timestamp to the start of its bucket.
+    
+    Args:
+        timestamp: The timestamp to truncate
+        bucket: The bucket granularity ("minute", "hour" or "day")
+        
+    Returns:
+        The start of the bucket containing the timestamp
+    """
+    if bucket == "minute":
+        return timestamp.replace(second=0, microsecond=0)
+    if bucket == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if bucket == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unknown bucket '{bucket}'")
+
+
+class ActivityStatsService:
+    """
+    Service for maintaining per-bucket activity counters.
+    
+    Attributes:
+        counters: Counts per series, bucket granularity and bucket start
+    """
+    
+    def __init__(self):
+        """Initialize the service with empty counters."""
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[str, Dict[datetime.datetime, int]]] = {}
+    
+    def record(
+        self, series: str, timestamp: Optional[datetime.datetime] = None
+    ) -> None:
+        """
+        Count one event in every bucket granularity.
+        
+        Args:
+            series: Name of the series ("rsvps", "messages", etc.)
+            timestamp: When the event happened, defaults to now
+        """
+        timestamp = timestamp or datetime.datetime.now()
+        
+        with self._lock:
+            buckets = self.counters.setdefault(
+                series, {bucket: {} for bucket in BUCKET_RETENTION}
+            )
+            for bucket, retention in BUCKET_RETENTION.items():
+                counts = buckets[bucket]
+                start = bucket_start(timestamp, bucket)
+                counts[start] = counts.get(start, 0) + 1
+                
+                # Buckets are created in time order, so the first key is the oldest
+                if len(counts) > retention:
+                    del counts[next(iter(counts))]
+    
+    def get_timeseries(self, bucket: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Get the activity time series for a bucket granularity.
+        
+        Args:
+            bucket: The bucket granularity ("minute", "hour" or "day")
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        if bucket not in BUCKET_RETENTION:
+            allowed = ", ".join(BUCKET_RETENTION)
+            return {
+                "message": f"Invalid bucket '{bucket}', expected one of: {allowed}"
+            }, 400
+        
+        with self._lock:
+            snapshot = {
+                series: sorted(buckets[bucket].items())
+                for series, buckets in self.counters.items()
+            }
+        
+        response_data = {
+            "bucket": bucket,
+            "series": {
+                series: [
+                    {"timestamp": start.isoformat(), "count": count}
+                    for start, count in points
+                ]
+                for series, points in snapshot.items()
+            }
+        }
+        
+        return response_data, 200
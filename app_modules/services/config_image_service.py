@@ -0,0 +1,195 @@
+# app_modules/services/config_image_service.py
+"""
+Configurable image service for handling banner and gallery image logic.
+
+Images are read on every homepage load, so the service keeps an immutable
+snapshot holding a per-key index and a serialized response per image type.
+Admin writes rebuild the snapshot and swap it in with a single assignment,
+so readers never scan or re-serialize the image configuration. A write holds
+the service lock from its existence check through the rebuild, so concurrent
+writes cannot interleave between them.
+"""
+
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from app_modules.models import InsertConfigImage
+from app_modules.repositories.interfaces import IConfigImageRepository
+from app_modules.services.response_cache import CachedResponse, build_cached_response
+
+# Response served for image types that have no active images
+EMPTY_IMAGES_RESPONSE = build_cached_response({"images": []})
+
+
+class ConfigImageSnapshot(NamedTuple):
+    """
+    Immutable view of all configurable images at a given repository version.
+    
+    Attributes:
+        version: Repository version the snapshot was built from
+        images: Serialized images keyed by image key
+        all_images: Precomputed response listing every image
+        by_type: Precomputed responses listing the active images of each type
+    """
+    version: int
+    images: Dict[str, Dict[str, Any]]
+    all_images: CachedResponse
+    by_type: Dict[str, CachedResponse]
+
+
+class ConfigImageService:
+    """
+    Service for managing configurable image operations.
+    
+    Attributes:
+        repository: The configurable image repository interface implementation
+    """
+    
+    def __init__(self, repository: IConfigImageRepository):
+        """Initialize the configurable image service with a repository."""
+        self.repository = repository
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ConfigImageSnapshot] = None
+    
+    def snapshot(self) -> ConfigImageSnapshot:
+        """
+        Get the current image snapshot, rebuilding it if stale.
+        
+        Returns:
+            The snapshot matching the repository's current version
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.repository.version:
+            return snapshot
+        
+        return self._refresh()
+    
+    def _refresh(self) -> ConfigImageSnapshot:
+        """Rebuild the snapshot if needed and atomically swap it in."""
+        with self._lock:
+            return self._refresh_locked()
+    
+    def _refresh_locked(self) -> ConfigImageSnapshot:
+        """Rebuild the snapshot if needed and swap it in. Caller holds the lock."""
+        version = self.repository.version
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != version:
+            snapshot = self._build_snapshot(version)
+            self._snapshot = snapshot
+        return snapshot
+    
+    def _build_snapshot(self, version: int) -> ConfigImageSnapshot:
+        """Index and serialize all images into a new snapshot."""
+        images = [image.model_dump() for image in self.repository.get_all()]
+        
+        # Group active images per type, keeping the most-recent-first order
+        active_by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for image in images:
+            if image["isActive"]:
+                active_by_type.setdefault(image["imageType"], []).append(image)
+        
+        return ConfigImageSnapshot(
+            version=version,
+            images={image["imageKey"]: image for image in images},
+            all_images=build_cached_response({"images": images}),
+            by_type={
+                image_type: build_cached_response({"images": typed_images})
+                for image_type, typed_images in active_by_type.items()
+            }
+        )
+    
+    def get_all_images(self) -> CachedResponse:
+        """
+        Get the precomputed response listing every configurable image.
+        
+        Returns:
+            The cached JSON response body and its ETag
+        """
+        return self.snapshot().all_images
+    
+    def get_images_by_type(self, image_type: str) -> CachedResponse:
+        """
+        Get the precomputed response listing the active images of a type.
+        
+        Args:
+            image_type: The image type ("banner" or "gallery")
+            
+        Returns:
+            The cached JSON response body and its ETag
+        """
+        return self.snapshot().by_type.get(image_type, EMPTY_IMAGES_RESPONSE)
+    
+    def get_image(self, image_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single configurable image by key.
+        
+        Args:
+            image_key: The key of the image
+            
+        Returns:
+            The serialized image, or None if it does not exist
+        """
+        return self.snapshot().images.get(image_key)
+    
+    def save_image(self, image_data: InsertConfigImage) -> Tuple[Dict[str, Any], int]:
+        """
+        Create a configurable image or update the one with the same key.
+        
+        Args:
+            image_data: The image data to save
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        with self._lock:
+            image = self.repository.upsert(image_data.imageKey, image_data)
+            self._refresh_locked()
+        return {
+            "message": "Image configuration updated successfully",
+            "image": image.model_dump()
+        }, 201
+    
+    def update_image(
+        self, image_key: str, image_data: InsertConfigImage
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Update the configurable image stored under a key.
+        
+        The image must already exist and its key cannot be changed; use
+        save_image to create an image.
+        
+        Args:
+            image_key: The key of the image to update
+            image_data: The new image data
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        if image_data.imageKey != image_key:
+            return {"message": "Image key in the body must match the URL"}, 400
+        with self._lock:
+            if self.repository.get_by_key(image_key) is None:
+                return {"message": "Image not found"}, 404
+            
+            image = self.repository.upsert(image_key, image_data)
+            self._refresh_locked()
+        return {
+            "message": "Image configuration updated successfully",
+            "image": image.model_dump()
+        }, 200
+    
+    def delete_image(self, image_key: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Delete a configurable image.
+        
+        Args:
+            image_key: The key of the image to delete
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        with self._lock:
+            if not self.repository.delete(image_key):
+                return {"message": "Image not found"}, 404
+            self._refresh_locked()
+        return {"message": "Image deleted successfully"}, 200
@@ -0,0 +1,156 @@
+# app_modules/services/container.py
+"""
+Service container holding one event's repositories and services.
+
+Each hosted wedding (tenant) gets its own container, so events never share
+guests, messages or configuration.
+"""
+
+from typing import Any, Dict, Optional
+
+from app_modules.repositories.memory_repositories import (
+    MemoryConfigImageRepository,
+    MemoryFeatureFlagRepository,
+    MemoryInviteeRepository,
+    MemoryMessageRepository,
+    MemoryRsvpRepository,
+    MemoryUserRepository,
+)
+from app_modules.services.activity_stats_service import ActivityStatsService
+from app_modules.services.config_image_service import ConfigImageService
+from app_modules.services.diagnostics_service import DiagnosticsService
+from app_modules.services.feature_flag_service import FeatureFlagService
+from app_modules.services.message_service import MessageService
+from app_modules.services.moderation_service import ModerationService
+from app_modules.services.notification_service import NotificationService
+from app_modules.services.rsvp_service import RsvpService
+
+
+class RepositorySet:
+    """
+    The repositories backing one event.
+    
+    Holds only plain data, so it can be pickled when a tenant is evicted.
+    
+    Attributes:
+        rsvps: The RSVP repository
+        messages: The message repository
+        users: The user repository
+        invitees: The invitee list repository
+        feature_flags: The feature flag repository
+        config_images: The configurable image repository
+    """
+    
+    def __init__(self):
+        """Initialize an empty set of in-memory repositories."""
+        self.rsvps = MemoryRsvpRepository()
+        self.messages = MemoryMessageRepository()
+        self.users = MemoryUserRepository()
+        self.invitees = MemoryInviteeRepository()
+        self.feature_flags = MemoryFeatureFlagRepository()
+        self.config_images = MemoryConfigImageRepository()
+
+
+class ServiceContainer:
+    """
+    The services for one event, built on top of its repositories.
+    
+    Attributes:
+        repositories: The event's repositories
+        tenant: Slug of the hosted wedding, or None for the default event
+        couple_email: Recipient of the event's RSVP digest, if any
+        admin_password_hash: Hash of the event's own admin password, if it has one
+        activity_stats_service: Activity counters for the event
+        rsvp_service: RSVP service
+        message_service: Message service
+        feature_flag_service: Feature flag service
+        config_image_service: Configurable image service
+        diagnostics_service: Memory diagnostics for the event's repositories
+    """
+    
+    def __init__(
+        self,
+        repositories: Optional[RepositorySet] = None,
+        activity_stats_service: Optional[ActivityStatsService] = None,
+        venue_capacity: Optional[int] = None,
+        moderation_service: Optional[ModerationService] = None,
+        notification_service: Optional[NotificationService] = None,
+        tenant: Optional[str] = None,
+        couple_email: Optional[str] = None,
+        admin_password_hash: Optional[str] = None
+    ):
+        """Initialize the services, creating fresh repositories if none are given."""
+        self.repositories = repositories or RepositorySet()
+        self.venue_capacity = venue_capacity
+        self.tenant = tenant
+        self.couple_email = couple_email
+        self.admin_password_hash = admin_password_hash
+        self.activity_stats_service = activity_stats_service or ActivityStatsService()
+        
+        self.rsvp_service = RsvpService(
+            self.repositories.rsvps,
+            self.activity_stats_service,
+            self.repositories.invitees,
+            venue_capacity=venue_capacity,
+            notifications=notification_service,
+            tenant=tenant,
+            couple_email=couple_email
+        )
+        self.message_service = MessageService(
+            self.repositories.messages, self.activity_stats_service, moderation_service
+        )
+        self.feature_flag_service = FeatureFlagService(self.repositories.feature_flags)
+        self.config_image_service = ConfigImageService(self.repositories.config_images)
+        self.diagnostics_service = DiagnosticsService({
+            "rsvps": self.repositories.rsvps,
+            "messages": self.repositories.messages,
+            "users": self.repositories.users
+        })
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get the picklable state needed to rebuild this container.
+        
+        Returns:
+            The repositories, activity counters and event settings
+        """
+        return {
+            "repositories": self.repositories,
+            "activity_counters": self.activity_stats_service.counters,
+            "venue_capacity": self.venue_capacity,
+            "tenant": self.tenant,
+            "couple_email": self.couple_email,
+            "admin_password_hash": self.admin_password_hash
+        }
+    
+    @classmethod
+    def from_state(
+        cls,
+        state: Dict[str, Any],
+        moderation_service: Optional[ModerationService] = None,
+        notification_service: Optional[NotificationService] = None
+    ) -> "ServiceContainer":
+        """
+        Rebuild a container from state returned by get_state.
+        
+        Args:
+            state: The saved container state
+            moderation_service: Shared moderation pipeline for the rebuilt services
+            notification_service: Shared notification queue for the rebuilt services
+            
+        Returns:
+            The rebuilt container
+        """
+        activity_stats_service = ActivityStatsService()
+        activity_stats_service.counters = state["activity_counters"]
+        return cls(
+            repositories=state["repositories"],
+            activity_stats_service=activity_stats_service,
+            venue_capacity=state["venue_capacity"],
+            moderation_service=moderation_service,
+            notification_service=notification_service,
+            tenant=state["tenant"],
+            couple_email=state["couple_email"],
+            # Tenants saved before they had their own admin password
+            admin_password_hash=state.get("admin_password_hash")
+        )
@@ -0,0 +1,180 @@
+# app_modules/services/diagnostics_service.py
+"""
+Diagnostics service for reporting how much memory the repositories hold.
+
+Repository sizes are reported per event. Allocation tracing uses tracemalloc,
+which is process-wide, so it lives in a single AllocationTracer shared by the
+whole app rather than in each event's services.
+"""
+
+import sys
+import threading
+import tracemalloc
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Dict, Iterator, Optional, Sized, Tuple
+
+# Objects that are shared with the rest of the process and never owned by a repository
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def _referents(obj: Any) -> Iterator[Any]:
+    """Yield the objects directly owned by an object."""
+    # Containers are copied in one C-level call before walking them, so a
+    # request writing to a repository concurrently cannot change them mid-walk
+    if isinstance(obj, dict):
+        for key, value in tuple(obj.items()):
+            yield key
+            yield value
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        yield from tuple(obj)
+    
+    if hasattr(obj, '__dict__') and not isinstance(obj, _SHARED_TYPES):
+        yield vars(obj)
+    
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, '__slots__', ()):
+            if slot != '__dict__' and hasattr(obj, slot):
+                yield getattr(obj, slot)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Get the size in bytes of an object and everything it owns.
+    
+    Objects reachable more than once are only counted once. The walk is
+    retried if a container still changes size while it is being copied.
+    
+    Args:
+        obj: The object to measure
+        
+    Returns:
+        The total size in bytes
+    """
+    for _ in range(2):
+        try:
+            return _deep_sizeof(obj)
+        except RuntimeError:
+            pass
+    # A third failure is raised to the caller
+    return _deep_sizeof(obj)
+
+
+def _deep_sizeof(obj: Any) -> int:
+    """Walk an object graph once and sum the sizes of the objects in it."""
+    seen = set()
+    stack = [obj]
+    total = 0
+    
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        stack.extend(_referents(current))
+    
+    return total
+
+
+class DiagnosticsService:
+    """
+    Service for memory introspection of the repositories.
+    
+    Attributes:
+        repositories: The repositories to report on, keyed by name
+    """
+    
+    def __init__(self, repositories: Dict[str, Sized]):
+        """Initialize the diagnostics service with the repositories to measure."""
+        self.repositories = repositories
+    
+    def get_memory_report(self) -> Tuple[Dict[str, Any], int]:
+        """
+        Get the record count and deep byte size of each repository.
+        
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        report = {}
+        for name, repository in self.repositories.items():
+            records = len(repository)
+            size = deep_sizeof(repository)
+            report[name] = {
+                "records": records,
+                "bytes": size,
+                "bytesPerRecord": round(size / records, 1) if records else None
+            }
+        
+        return {
+            "repositories": report,
+            "tracemalloc": tracemalloc.is_tracing()
+        }, 200
+
+
+class AllocationTracer:
+    """
+    Process-wide tracemalloc tracing with a single baseline snapshot.
+    
+    Snapshots cover every allocation in the process, whichever event caused it.
+    """
+    
+    def __init__(self):
+        """Initialize the tracer; tracing starts with the first snapshot."""
+        self._lock = threading.Lock()
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+    
+    def take_allocation_snapshot(self, top: int = 10) -> Tuple[Dict[str, Any], int]:
+        """
+        Take a tracemalloc snapshot and diff it against the previous one.
+        
+        Tracing is started by the first call, which only records the baseline.
+        Every later call reports the top allocation changes since the previous
+        call and becomes the new baseline.
+        
+        Args:
+            top: Number of allocation sites to report
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._baseline = None
+            
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+            ))
+            baseline, self._baseline = self._baseline, snapshot
+        
+        if baseline is None:
+            return {"message": "Baseline snapshot taken", "diff": []}, 200
+        
+        stats = snapshot.compare_to(baseline, 'lineno')[:top]
+        return {
+            "message": "Snapshot compared to previous baseline",
+            "diff": [
+                {
+                    "location": str(stat.traceback),
+                    "sizeDiff": stat.size_diff,
+                    "size": stat.size,
+                    "countDiff": stat.count_diff,
+                    "count": stat.count
+                }
+                for stat in stats
+            ]
+        }, 200
+    
+    def stop_allocation_tracing(self) -> Tuple[Dict[str, Any], int]:
+        """
+        Stop tracemalloc and discard the baseline snapshot.
+        
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        with self._lock:
+            self._baseline = None
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+        
+        return {"message": "Allocation tracing stopped"}, 200
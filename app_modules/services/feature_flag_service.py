@@ -0,0 +1,159 @@
+# app_modules/services/feature_flag_service.py
+"""
+Feature flag service for handling feature flag business logic.
+
+Flags are read on every page load, so reads are served from an in-process
+snapshot. The snapshot is rebuilt only when the repository's version counter
+changes, and the bulk response body and its ETag are precomputed at that time.
+"""
+
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from app_modules.models import InsertFeatureFlag
+from app_modules.repositories.interfaces import IFeatureFlagRepository
+from app_modules.services.response_cache import CachedResponse, build_cached_response
+
+
+class FeatureFlagSnapshot(NamedTuple):
+    """
+    Immutable view of all feature flags at a given repository version.
+    
+    Attributes:
+        version: Repository version the snapshot was built from
+        flags: Serialized feature flags keyed by feature key
+        response: Precomputed response for the bulk endpoint
+    """
+    version: int
+    flags: Dict[str, Dict[str, Any]]
+    response: CachedResponse
+
+
+class FeatureFlagService:
+    """
+    Service for managing feature flag operations.
+    
+    Attributes:
+        repository: The feature flag repository interface implementation
+    """
+    
+    def __init__(self, repository: IFeatureFlagRepository):
+        """Initialize the feature flag service with a repository."""
+        self.repository = repository
+        self._lock = threading.Lock()
+        self._snapshot: Optional[FeatureFlagSnapshot] = None
+    
+    def snapshot(self) -> FeatureFlagSnapshot:
+        """
+        Get the current feature flag snapshot, rebuilding it if stale.
+        
+        Returns:
+            The snapshot matching the repository's current version
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.repository.version:
+            return snapshot
+        
+        with self._lock:
+            # Another thread may have rebuilt the snapshot while we waited
+            version = self.repository.version
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = self._build_snapshot(version)
+                self._snapshot = snapshot
+            return snapshot
+    
+    def _build_snapshot(self, version: int) -> FeatureFlagSnapshot:
+        """Serialize all feature flags into a new snapshot."""
+        feature_flags = [flag.model_dump() for flag in self.repository.get_all()]
+        
+        return FeatureFlagSnapshot(
+            version=version,
+            flags={flag["featureKey"]: flag for flag in feature_flags},
+            response=build_cached_response({"featureFlags": feature_flags})
+        )
+    
+    def is_enabled(self, feature_key: str, default: bool = False) -> bool:
+        """
+        Check whether a feature is enabled.
+        
+        Args:
+            feature_key: The key of the feature to check
+            default: Value to return when the flag does not exist
+            
+        Returns:
+            True if the feature is enabled
+        """
+        flag = self.snapshot().flags.get(feature_key)
+        return default if flag is None else flag["enabled"]
+    
+    def get_all_feature_flags(self) -> CachedResponse:
+        """
+        Get the precomputed response for all feature flags.
+        
+        Returns:
+            The cached JSON response body and its ETag
+        """
+        return self.snapshot().response
+    
+    def get_feature_flag(self, feature_key: str) -> Tuple[Dict[str, Any], int]:
+        """
+        Get a single feature flag by key.
+        
+        Args:
+            feature_key: The key of the feature flag
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        flag = self.snapshot().flags.get(feature_key)
+        
+        if flag:
+            return {"featureFlag": flag}, 200
+        else:
+            return {"message": "Feature flag not found"}, 404
+    
+    def update_feature_flag(
+        self, feature_key: str, enabled: bool
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Enable or disable a feature flag.
+        
+        Args:
+            feature_key: The key of the feature flag
+            enabled: The new enabled status
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        flag = self.repository.update_enabled(feature_key, enabled)
+        
+        if not flag:
+            return {"message": "Feature flag not found"}, 404
+        
+        state = "enabled" if enabled else "disabled"
+        return {
+            "message": f"Feature flag '{flag.featureName}' {state} successfully",
+            "featureFlag": flag.model_dump()
+        }, 200
+    
+    def create_feature_flag(
+        self, flag_data: InsertFeatureFlag
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Create a new feature flag.
+        
+        Args:
+            flag_data: The feature flag data to create
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        if self.repository.get_by_key(flag_data.featureKey):
+            return {"message": "Feature flag already exists"}, 409
+        
+        flag = self.repository.create(flag_data)
+        return {
+            "message": "Feature flag created successfully",
+            "featureFlag": flag.model_dump()
+        }, 201
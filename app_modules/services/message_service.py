@@ -1,12 +1,27 @@
 # app_modules/services/message_service.py
 """
 Message service for handling message board business logic.
+
+New messages are stored as pending and moderated in the background. Only
+approved messages are shown on the public board; its response body is rebuilt
+whenever a moderation result or admin decision changes what is visible.
 """
 
-from typing import Dict, List, Any, Tuple
+import datetime
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from app_modules.models import Message, InsertMessage
+from app_modules.models import (
+    MESSAGE_APPROVED,
+    MESSAGE_PENDING,
+    MESSAGE_STATUSES,
+    InsertMessage,
+    Message,
+)
 from app_modules.repositories.interfaces import IMessageRepository
+from app_modules.services.activity_stats_service import ActivityStatsService
+from app_modules.services.moderation_service import ModerationResult, ModerationService
+from app_modules.services.response_cache import CachedResponse, build_cached_response
 
 
 class MessageService:
@@ -15,11 +30,73 @@ class MessageService:
     
     Attributes:
         repository: The message repository interface implementation
+        activity_stats: Optional activity counters updated on each new message
+        moderation: Optional moderation pipeline; without it messages are approved
+            immediately
     """
     
-    def __init__(self, repository: IMessageRepository):
+    def __init__(
+        self,
+        repository: IMessageRepository,
+        activity_stats: Optional[ActivityStatsService] = None,
+        moderation: Optional[ModerationService] = None
+    ):
         """Initialize the message service with a repository."""
         self.repository = repository
+        self.activity_stats = activity_stats
+        self.moderation = moderation
+        self._lock = threading.Lock()
+        self._status_lock = threading.Lock()
+        self._approved = self._build_approved()
+        
+        # Messages left pending, e.g. by an evicted tenant, are moderated again
+        for message in self.repository.get_all():
+            if message.status == MESSAGE_PENDING:
+                self._moderate(message, resubmitted=True)
+    
+    def _build_approved(self) -> Tuple[Dict[str, Any], CachedResponse]:
+        """Build the approved messages for the public board and their response."""
+        messages = [
+            message.model_dump() for message in self.repository.get_all()
+            if message.status == MESSAGE_APPROVED
+        ]
+        response_data = {"messages": messages, "count": len(messages)}
+        return response_data, build_cached_response(response_data)
+    
+    def _refresh_approved(self) -> None:
+        """Rebuild the public board response and swap it in."""
+        with self._lock:
+            self._approved = self._build_approved()
+    
+    def _moderate(self, message: Message, resubmitted: bool = False) -> None:
+        """Queue a message for moderation, or approve it if there is no pipeline."""
+        if self.moderation is None:
+            self.apply_moderation([(message.id, MESSAGE_APPROVED, [])])
+        elif not self.moderation.submit(message, self.apply_moderation, resubmitted):
+            # The queue is full: moderate here rather than leave the message pending
+            self.apply_moderation([self.moderation.moderate(message, resubmitted)])
+    
+    def apply_moderation(self, results: List[ModerationResult]) -> None:
+        """
+        Store moderation results and refresh the public board.
+        
+        A result is only applied while its message is still pending, so it
+        never overrides a decision an admin made in the meantime.
+        
+        Args:
+            results: Message IDs with their new status and flag reasons
+        """
+        visible_changed = False
+        with self._status_lock:
+            for message_id, status, reasons in results:
+                existing = self.repository.get_by_id(message_id)
+                if existing is None or existing.status != MESSAGE_PENDING:
+                    continue
+                self.repository.set_status(message_id, status, reasons)
+                visible_changed = visible_changed or status == MESSAGE_APPROVED
+        
+        if visible_changed:
+            self._refresh_approved()
     
     def submit_message(self, message_data: InsertMessage) -> Tuple[Dict[str, Any], int]:
         """
@@ -32,21 +109,89 @@ class MessageService:
             A tuple containing the response data and HTTP status code
         """
         message = self.repository.create(message_data)
-        return {"message": "Message submitted successfully", "data": message.dict()}, 201
+        if self.activity_stats:
+            self.activity_stats.record(
+                "messages", datetime.datetime.fromisoformat(message.created_at)
+            )
+        
+        self._moderate(message)
+        if self.moderation is None:
+            return {
+                "message": "Message submitted successfully",
+                "data": self.repository.get_by_id(message.id).model_dump()
+            }, 201
+        
+        return {
+            "message": "Message submitted and awaiting moderation",
+            "data": message.model_dump()
+        }, 202
     
     def get_all_messages(self) -> Tuple[Dict[str, Any], int]:
         """
-        Get all messages from the message board.
+        Get the approved messages shown on the public board.
         
         Returns:
             A tuple containing the response data and HTTP status code
         """
-        messages = self.repository.get_all()
+        return self._approved[0], 200
+    
+    def get_approved_response(self) -> CachedResponse:
+        """
+        Get the precomputed response for the approved messages.
         
-        # Format response
-        response_data = {
-            "messages": [message.dict() for message in messages],
-            "count": len(messages)
-        }
+        Returns:
+            The cached JSON response body and its ETag
+        """
+        return self._approved[1]
+    
+    def get_all_messages_admin(
+        self, status: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Get all messages regardless of moderation status.
+        
+        Args:
+            status: Only return messages with this status
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        if status is not None and status not in MESSAGE_STATUSES:
+            return {"message": f"Unknown status '{status}'"}, 400
+        
+        messages = [
+            message.model_dump() for message in self.repository.get_all()
+            if status is None or message.status == status
+        ]
+        return {"messages": messages, "count": len(messages)}, 200
+    
+    def set_message_status(
+        self, message_id: int, status: str
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Approve or flag a message by hand.
+        
+        Args:
+            message_id: The ID of the message
+            status: The new moderation status
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        if status not in MESSAGE_STATUSES:
+            return {"message": f"Unknown status '{status}'"}, 400
+        
+        with self._status_lock:
+            existing = self.repository.get_by_id(message_id)
+            if existing is None:
+                return {"message": "Message not found"}, 404
+            
+            reasons = existing.flagReasons if status != MESSAGE_APPROVED else []
+            message = self.repository.set_status(message_id, status, reasons)
+        if MESSAGE_APPROVED in (existing.status, status):
+            self._refresh_approved()
         
-        return response_data, 200
\ No newline at end of file
+        return {
+            "message": f"Message marked as {status}",
+            "data": message.model_dump()
+        }, 200
@@ -0,0 +1,281 @@
+# app_modules/services/moderation_service.py
+"""
+Background moderation of message-wall posts.
+
+New messages are queued without blocking the request. A dispatcher thread
+groups queued messages into batches and hands each batch to a bounded thread
+pool, which runs the configured checks and reports the approve/flag results
+back through the callback given at submission time.
+"""
+
+import logging
+import queue
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from app_modules.models import MESSAGE_APPROVED, MESSAGE_FLAGGED, Message
+
+logger = logging.getLogger(__name__)
+
+
+# A check returns a reason when the message should be flagged, otherwise None.
+# Checks with a true ``counts_submissions`` attribute record every message they
+# see, so they are skipped for messages moderated again after a reload.
+ModerationCheck = Callable[[Message], Optional[str]]
+
+# A moderation result: message ID, new status and flag reasons
+ModerationResult = Tuple[int, str, List[str]]
+
+# Receives the results of a batch for the messages it submitted
+ResultCallback = Callable[[List[ModerationResult]], None]
+
+
+class BlockedWordsCheck:
+    """Flags messages containing any word from a block list."""
+    
+    def __init__(self, words: Iterable[str]):
+        """Compile the block list into a single case-insensitive pattern."""
+        words = [re.escape(word.strip().lower()) for word in words if word.strip()]
+        self.pattern = (
+            re.compile(r'\b(?:' + '|'.join(words) + r')\b', re.IGNORECASE)
+            if words else None
+        )
+    
+    def __call__(self, message: Message) -> Optional[str]:
+        if self.pattern is not None and self.pattern.search(message.content):
+            return "Contains a blocked word"
+        return None
+
+
+class LinkCheck:
+    """Flags messages with more links than allowed."""
+    
+    LINK_PATTERN = re.compile(r'(?:https?://|www\.)\S+', re.IGNORECASE)
+    
+    def __init__(self, max_links: int = 0):
+        """Set how many links a message may contain."""
+        self.max_links = max_links
+    
+    def __call__(self, message: Message) -> Optional[str]:
+        if len(self.LINK_PATTERN.findall(message.content)) > self.max_links:
+            return "Contains links"
+        return None
+
+
+class SpamHeuristicsCheck:
+    """Flags messages that look like spam: shouting, long runs or excessive length."""
+    
+    REPEATED_PATTERN = re.compile(r'(.)\1{9,}')
+    
+    def __init__(self, max_length: int = 2000, max_caps_ratio: float = 0.7):
+        """Set the spam thresholds."""
+        self.max_length = max_length
+        self.max_caps_ratio = max_caps_ratio
+    
+    def __call__(self, message: Message) -> Optional[str]:
+        content = message.content
+        if len(content) > self.max_length:
+            return "Message is too long"
+        if self.REPEATED_PATTERN.search(content):
+            return "Contains repeated characters"
+        
+        letters = [c for c in content if c.isalpha()]
+        if (
+            len(letters) >= 20
+            and sum(c.isupper() for c in letters) / len(letters) > self.max_caps_ratio
+        ):
+            return "Mostly capital letters"
+        return None
+
+
+class EmailRateCheck:
+    """Flags messages from an email that posted too often within a time window."""
+    
+    counts_submissions = True
+    
+    def __init__(self, max_messages: int = 3, window_seconds: float = 600.0):
+        """Set the allowed number of messages per email and window."""
+        self.max_messages = max_messages
+        self.window_seconds = window_seconds
+        self._lock = threading.Lock()
+        self._recent: Dict[str, Deque[float]] = {}
+        self._last_sweep = time.monotonic()
+    
+    def _sweep(self, now: float) -> None:
+        """Forget emails with no message inside the window. Caller holds the lock."""
+        self._recent = {
+            email: recent for email, recent in self._recent.items()
+            if now - recent[-1] <= self.window_seconds
+        }
+        self._last_sweep = now
+    
+    def __call__(self, message: Message) -> Optional[str]:
+        now = time.monotonic()
+        email = message.email.strip().lower()
+        
+        with self._lock:
+            if now - self._last_sweep > self.window_seconds:
+                self._sweep(now)
+            
+            recent = self._recent.setdefault(email, deque())
+            while recent and now - recent[0] > self.window_seconds:
+                recent.popleft()
+            recent.append(now)
+            over_limit = len(recent) > self.max_messages
+        
+        return "Too many messages from this email" if over_limit else None
+
+
+class ModerationService:
+    """
+    Asynchronous moderation pipeline shared by all message services.
+    
+    Attributes:
+        checks: The checks run on each message
+        batch_size: Maximum number of messages moderated together
+        batch_delay: Seconds the dispatcher waits to fill a batch
+        max_workers: Number of pool threads running batches
+        counters: Submission and result counters
+    """
+    
+    def __init__(
+        self,
+        checks: List[ModerationCheck],
+        batch_size: int = 50,
+        batch_delay: float = 0.2,
+        max_workers: int = 2,
+        max_queue: int = 10000
+    ):
+        """Initialize the pipeline; threads start on the first submission."""
+        self.checks = checks
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_workers = max_workers
+        self._queue: "queue.Queue[Tuple[Message, ResultCallback, bool]]" = queue.Queue(
+            max_queue
+        )
+        self._start_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._counters_lock = threading.Lock()
+        self.counters: Dict[str, int] = {
+            "submitted": 0,
+            "dropped": 0,
+            "approved": 0,
+            "flagged": 0,
+            "batches": 0,
+        }
+    
+    def _count(self, counter: str) -> None:
+        """Increment a counter; pool and request threads update them concurrently."""
+        with self._counters_lock:
+            self.counters[counter] += 1
+    
+    def _ensure_started(self) -> None:
+        """Start the dispatcher thread and worker pool if needed."""
+        if self._executor is not None:
+            return
+        with self._start_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='moderation'
+                )
+                threading.Thread(
+                    target=self._dispatch, name='moderation-dispatcher', daemon=True
+                ).start()
+    
+    def submit(
+        self, message: Message, callback: ResultCallback, resubmitted: bool = False
+    ) -> bool:
+        """
+        Queue a message for moderation without blocking.
+        
+        Args:
+            message: The message to moderate
+            callback: Receives the results for this message
+            resubmitted: Whether the message was already submitted once, e.g.
+                before its tenant was evicted
+            
+        Returns:
+            True if queued, False if the queue is full and the message stays pending
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((message, callback, resubmitted))
+        except queue.Full:
+            self._count("dropped")
+            return False
+        
+        self._count("submitted")
+        return True
+    
+    def _dispatch(self) -> None:
+        """Collect queued messages into batches and hand them to the pool."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_delay
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._executor.submit(self._moderate_batch, batch)
+    
+    def moderate(self, message: Message, resubmitted: bool = False) -> ModerationResult:
+        """
+        Run every check on a message.
+        
+        Args:
+            message: The message to moderate
+            resubmitted: Skip the checks that count submissions, as this
+                message was already counted
+            
+        Returns:
+            The message ID, its new status and the reasons it was flagged
+        """
+        checks = [
+            check for check in self.checks
+            if not (resubmitted and getattr(check, 'counts_submissions', False))
+        ]
+        reasons = [reason for reason in (check(message) for check in checks) if reason]
+        self._count("flagged" if reasons else "approved")
+        return message.id, MESSAGE_FLAGGED if reasons else MESSAGE_APPROVED, reasons
+    
+    def _moderate_batch(
+        self, batch: List[Tuple[Message, ResultCallback, bool]]
+    ) -> None:
+        """Moderate a batch and deliver the results grouped per callback."""
+        results_by_callback: Dict[ResultCallback, List[ModerationResult]] = {}
+        for message, callback, resubmitted in batch:
+            try:
+                result = self.moderate(message, resubmitted)
+            except Exception:
+                logger.exception(
+                    "Moderation check error", extra={"messageId": message.id}
+                )
+                continue
+            results_by_callback.setdefault(callback, []).append(result)
+        
+        for callback, results in results_by_callback.items():
+            try:
+                callback(results)
+            except Exception:
+                logger.exception("Error applying moderation results")
+        self._count("batches")
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get the pipeline counters.
+        
+        Returns:
+            The counters and current queue length
+        """
+        with self._counters_lock:
+            counters = dict(self.counters)
+        return {**counters, "queued": self._queue.qsize()}
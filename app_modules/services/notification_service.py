@@ -0,0 +1,563 @@
+# app_modules/services/notification_service.py
+"""
+Outbound email notifications for RSVPs.
+
+Notifications are written to a SQLite outbox instead of being sent inline, so
+SMTP latency never reaches the request path and queued mail survives a
+restart. Worker threads claim due notifications in batches and send each batch
+over a pooled SMTP connection. Failed sends are retried with exponential
+backoff.
+
+Notifications wait a short coalescing window before they are due. Another
+update for the same key during that window replaces the queued one, so a
+guest who edits their RSVP several times gets a single confirmation. All
+updates within the digest interval are merged into one digest for the couple.
+
+RSVPs can be posted anonymously, so confirmations are only sent to guests
+found on the invitee list unless unlisted guests are allowed, and each
+address gets at most ``max_per_recipient`` confirmations per window. A
+notification that cannot be rendered is marked failed rather than retried.
+
+One outbox serves every hosted wedding. Coalescing keys are prefixed with the
+tenant slug, and each event passes its own couple's address, so guests and
+digests of different weddings are never merged.
+"""
+
+import json
+import logging
+import smtplib
+import sqlite3
+import threading
+import time
+from collections import deque
+from email.message import EmailMessage
+from typing import Any, Deque, Dict, List, Optional
+
+from app_modules.models import Rsvp
+
+logger = logging.getLogger(__name__)
+
+
+# Notification kinds
+CONFIRMATION = "confirmation"
+DIGEST = "digest"
+
+
+class SmtpConnectionPool:
+    """
+    Pool of reusable SMTP connections.
+    
+    Attributes:
+        host: SMTP server host
+        port: SMTP server port
+        username: Optional login user
+        password: Optional login password
+        starttls: Whether to upgrade connections with STARTTLS
+        size: Maximum number of idle connections kept open
+        timeout: Socket timeout in seconds
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int = 25,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = False,
+        size: int = 2,
+        timeout: float = 10.0
+    ):
+        """Initialize an empty pool; connections are opened on demand."""
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.size = size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle: List[smtplib.SMTP] = []
+        self.connections_opened = 0
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new connection."""
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password or "")
+        self.connections_opened += 1
+        return connection
+    
+    def acquire(self) -> smtplib.SMTP:
+        """
+        Get a live connection, reusing an idle one when possible.
+        
+        Returns:
+            An open SMTP connection
+        """
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                return self._connect()
+            
+            # The server may have dropped an idle connection
+            try:
+                if connection.noop()[0] == 250:
+                    return connection
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(connection)
+    
+    def release(self, connection: smtplib.SMTP, broken: bool = False) -> None:
+        """
+        Return a connection to the pool.
+        
+        Args:
+            connection: The connection to return
+            broken: Close the connection instead of keeping it
+        """
+        with self._lock:
+            if not broken and len(self._idle) < self.size:
+                self._idle.append(connection)
+                return
+        self._close(connection)
+    
+    def _close(self, connection: smtplib.SMTP) -> None:
+        """Close a connection, ignoring errors from a dead socket."""
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+    
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            self._close(connection)
+
+
+class NotificationService:
+    """
+    Persistent, batched notification queue drained by worker threads.
+    
+    Attributes:
+        pool: SMTP connections used to send notifications
+        sender: From address of outgoing mail
+        coalesce_delay: Seconds a confirmation waits for further updates
+        digest_interval: Seconds updates are collected into one digest
+        batch_size: Maximum notifications sent per claimed batch
+        workers: Number of worker threads
+        max_attempts: Sends attempted before a notification is given up on
+        retry_base: First retry delay in seconds, doubled on every attempt
+        retry_max: Upper bound of the retry delay in seconds
+        confirm_unlisted: Whether guests not on the invitee list get confirmations
+        max_per_recipient: Confirmations one address may receive per window
+        recipient_window: Seconds the per-address confirmation cap applies to
+        counters: Send and retry counters
+    """
+    
+    def __init__(
+        self,
+        pool: SmtpConnectionPool,
+        sender: str,
+        db_path: str = 'notifications.sqlite3',
+        coalesce_delay: float = 60.0,
+        digest_interval: float = 3600.0,
+        batch_size: int = 20,
+        workers: int = 2,
+        max_attempts: int = 8,
+        retry_base: float = 30.0,
+        retry_max: float = 3600.0,
+        poll_interval: float = 1.0,
+        confirm_unlisted: bool = False,
+        max_per_recipient: int = 5,
+        recipient_window: float = 24 * 3600
+    ):
+        """Open the outbox and requeue notifications claimed before a restart."""
+        self.pool = pool
+        self.sender = sender
+        self.coalesce_delay = coalesce_delay
+        self.digest_interval = digest_interval
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.poll_interval = poll_interval
+        self.confirm_unlisted = confirm_unlisted
+        self.max_per_recipient = max_per_recipient
+        self.recipient_window = recipient_window
+        self.counters: Dict[str, int] = {
+            "queued": 0,
+            "coalesced": 0,
+            "sent": 0,
+            "retried": 0,
+            "failed": 0,
+            "batches": 0,
+            "skippedUnlisted": 0,
+            "capped": 0,
+        }
+        self._recent_confirmations: Dict[str, Deque[float]] = {}
+        self._last_sweep = time.monotonic()
+        
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._started = False
+        self._db = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                recipient TEXT NOT NULL,
+                coalesce_key TEXT,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                claimed_at REAL,
+                failed_at REAL,
+                last_error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS outbox_due
+                ON outbox (claimed_at, failed_at, next_attempt_at);
+            CREATE INDEX IF NOT EXISTS outbox_coalesce ON outbox (coalesce_key);
+        """)
+        
+        # Sends interrupted by a restart are retried; they no longer coalesce,
+        # since an update may already have been queued behind them
+        with self._lock:
+            recovered = self._db.execute(
+                "UPDATE outbox SET claimed_at = NULL, coalesce_key = NULL "
+                "WHERE claimed_at IS NOT NULL"
+            ).rowcount
+            pending = self._db.execute(
+                "SELECT COUNT(*) FROM outbox WHERE failed_at IS NULL"
+            ).fetchone()[0]
+        if recovered:
+            logger.info(
+                "Requeued %d notification(s) interrupted by a restart", recovered
+            )
+        if pending:
+            self._ensure_started()
+    
+    def _ensure_started(self) -> None:
+        """Start the worker threads if needed."""
+        if self._started:
+            return
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        for index in range(self.workers):
+            threading.Thread(
+                target=self._work, name=f'notification-worker-{index}', daemon=True
+            ).start()
+    
+    def enqueue(
+        self,
+        kind: str,
+        recipient: str,
+        payload: Dict[str, Any],
+        coalesce_key: Optional[str] = None,
+        delay: float = 0.0
+    ) -> None:
+        """
+        Queue a notification, merging it into a queued one with the same key.
+        
+        Args:
+            kind: The notification kind, which selects how it is rendered
+            recipient: The email address to send to
+            payload: Data the message is rendered from
+            coalesce_key: Queued notifications with this key are merged
+            delay: Seconds before the notification is due
+        """
+        now = time.time()
+        with self._lock:
+            row = None
+            if coalesce_key is not None:
+                row = self._db.execute(
+                    "SELECT id, payload FROM outbox WHERE coalesce_key = ? "
+                    "AND claimed_at IS NULL AND failed_at IS NULL",
+                    (coalesce_key,)
+                ).fetchone()
+            
+            if row is None:
+                self._db.execute(
+                    "INSERT INTO outbox "
+                    "(kind, recipient, coalesce_key, payload, next_attempt_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (kind, recipient, coalesce_key, json.dumps(payload), now + delay)
+                )
+                self.counters["queued"] += 1
+            else:
+                merged = self._merge(kind, json.loads(row[1]), payload)
+                self._db.execute(
+                    "UPDATE outbox SET payload = ? WHERE id = ?",
+                    (json.dumps(merged), row[0])
+                )
+                self.counters["coalesced"] += 1
+        
+        self._ensure_started()
+        if delay <= 0:
+            self._wakeup.set()
+    
+    def _merge(
+        self, kind: str, queued: Dict[str, Any], update: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge an update into the payload of a queued notification."""
+        if kind == DIGEST:
+            return {"entries": {**queued["entries"], **update["entries"]}}
+        
+        # A confirmation shows the latest state, but is only an update if the
+        # guest had been confirmed before the queued one
+        return {**update, "updated": queued["updated"]}
+    
+    def _take_confirmation(self, email: str) -> bool:
+        """Count a confirmation against the address's cap; False if it is used up."""
+        now = time.monotonic()
+        with self._lock:
+            # Forget addresses with nothing inside the window, so the map stays bounded
+            if now - self._last_sweep > self.recipient_window:
+                self._recent_confirmations = {
+                    address: recent
+                    for address, recent in self._recent_confirmations.items()
+                    if now - recent[-1] <= self.recipient_window
+                }
+                self._last_sweep = now
+            
+            recent = self._recent_confirmations.setdefault(email, deque())
+            while recent and now - recent[0] > self.recipient_window:
+                recent.popleft()
+            if len(recent) >= self.max_per_recipient:
+                self.counters["capped"] += 1
+                return False
+            recent.append(now)
+            return True
+    
+    def rsvp_received(
+        self,
+        rsvp: Rsvp,
+        updated: bool,
+        tenant: Optional[str] = None,
+        couple_email: Optional[str] = None,
+        listed: bool = False
+    ) -> None:
+        """
+        Queue the guest's confirmation and add the RSVP to the couple's digest.
+        
+        Args:
+            rsvp: The stored RSVP
+            updated: Whether the RSVP replaced an earlier one
+            tenant: Slug of the hosted wedding, or None for the default event
+            couple_email: Recipient of the event's RSVP digest, if any
+            listed: Whether the guest's email was matched on the invitee list
+        """
+        # Slugs never contain '/', so keys of different events cannot collide
+        scope = f"{tenant}/" if tenant else ""
+        email = rsvp.email.strip().lower()
+        
+        if not (listed or self.confirm_unlisted):
+            with self._lock:
+                self.counters["skippedUnlisted"] += 1
+        elif self._take_confirmation(email):
+            self.enqueue(
+                CONFIRMATION,
+                rsvp.email,
+                {
+                    "name": rsvp.name,
+                    "attending": rsvp.attending,
+                    "seats": rsvp.seats,
+                    "updated": updated,
+                },
+                coalesce_key=f"{scope}{CONFIRMATION}:{email}",
+                delay=self.coalesce_delay
+            )
+        
+        if couple_email:
+            self.enqueue(
+                DIGEST,
+                couple_email,
+                {"entries": {email: {
+                    "name": rsvp.name,
+                    "email": rsvp.email,
+                    "attending": rsvp.attending,
+                    "seats": rsvp.seats,
+                }}},
+                coalesce_key=f"{scope}{DIGEST}",
+                delay=self.digest_interval
+            )
+    
+    def _render(
+        self, kind: str, recipient: str, payload: Dict[str, Any]
+    ) -> EmailMessage:
+        """Build the email for a queued notification."""
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        
+        if kind == DIGEST:
+            entries = sorted(
+                payload["entries"].values(), key=lambda entry: entry["name"].lower()
+            )
+            message["Subject"] = f"RSVP digest: {len(entries)} new response(s)"
+            lines = [
+                f"- {entry['name']} <{entry['email']}>: "
+                + (
+                    f"attending ({entry['seats']} seat(s))"
+                    if entry["attending"] else "not attending"
+                )
+                for entry in entries
+            ]
+            message.set_content("New and updated RSVPs:\n\n" + "\n".join(lines) + "\n")
+            return message
+        
+        action = "updated" if payload["updated"] else "received"
+        message["Subject"] = f"We've {action} your RSVP"
+        if payload["attending"]:
+            seats = payload["seats"]
+            detail = "We're delighted you can make it" + (
+                f", with {seats} seats reserved in total." if seats > 1 else "."
+            )
+        else:
+            detail = "We're sorry you can't make it, and thank you for letting us know."
+        message.set_content(f"Dear {payload['name']},\n\n{detail}\n")
+        return message
+    
+    def _claim_batch(self) -> List[tuple]:
+        """Claim the next due notifications for this worker."""
+        now = time.time()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, kind, recipient, payload, attempts FROM outbox "
+                "WHERE claimed_at IS NULL AND failed_at IS NULL "
+                "AND next_attempt_at <= ? "
+                "ORDER BY next_attempt_at LIMIT ?",
+                (now, self.batch_size)
+            ).fetchall()
+            if rows:
+                self._db.executemany(
+                    "UPDATE outbox SET claimed_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows]
+                )
+        return rows
+    
+    def _seconds_until_due(self) -> float:
+        """Seconds until the next notification is due, capped by the poll interval."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox "
+                "WHERE claimed_at IS NULL AND failed_at IS NULL"
+            ).fetchone()
+        if row[0] is None:
+            return self.poll_interval
+        return min(max(row[0] - time.time(), 0.0), self.poll_interval)
+    
+    def _work(self) -> None:
+        """Worker loop: claim due batches and send them."""
+        while True:
+            try:
+                batch = self._claim_batch()
+                if batch:
+                    self._send_batch(batch)
+                    continue
+            except Exception:
+                # Keep the worker alive; claimed rows are retried after a restart
+                logger.exception("Notification worker error")
+            
+            self._wakeup.wait(self._seconds_until_due())
+            self._wakeup.clear()
+    
+    def _send_batch(self, batch: List[tuple]) -> None:
+        """Send a claimed batch over one pooled connection."""
+        with self._lock:
+            self.counters["batches"] += 1
+        try:
+            connection = self.pool.acquire()
+        except (smtplib.SMTPException, OSError) as e:
+            for row in batch:
+                self._reschedule(row, e)
+            return
+        
+        broken = False
+        try:
+            for index, row in enumerate(batch):
+                row_id, kind, recipient, payload, _ = row
+                try:
+                    message = self._render(kind, recipient, json.loads(payload))
+                except Exception as e:
+                    # Rendering is deterministic, so retrying would fail the same way
+                    self._give_up(row, row[4] + 1, e)
+                    continue
+                
+                try:
+                    connection.send_message(message)
+                except (smtplib.SMTPServerDisconnected, OSError) as e:
+                    # The connection is gone; retry the rest of the batch later
+                    broken = True
+                    for remaining in batch[index:]:
+                        self._reschedule(remaining, e)
+                    break
+                except smtplib.SMTPException as e:
+                    self._reschedule(row, e)
+                    continue
+                except Exception as e:
+                    self._give_up(row, row[4] + 1, e)
+                    continue
+                
+                with self._lock:
+                    self._db.execute("DELETE FROM outbox WHERE id = ?", (row_id,))
+                    self.counters["sent"] += 1
+        finally:
+            self.pool.release(connection, broken=broken)
+    
+    def _give_up(self, row: tuple, attempts: int, error: Exception) -> None:
+        """Mark a notification as failed so it is never claimed again."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET attempts = ?, failed_at = ?, claimed_at = NULL, "
+                "coalesce_key = NULL, last_error = ? WHERE id = ?",
+                (attempts, time.time(), str(error), row[0])
+            )
+            self.counters["failed"] += 1
+        logger.error("Giving up on notification %d: %s", row[0], error)
+    
+    def _reschedule(self, row: tuple, error: Exception) -> None:
+        """Schedule a failed notification for retry, or give up on it."""
+        row_id, attempts = row[0], row[4] + 1
+        if attempts >= self.max_attempts:
+            self._give_up(row, attempts, error)
+            return
+        
+        now = time.time()
+        with self._lock:
+            delay = min(self.retry_base * 2 ** (attempts - 1), self.retry_max)
+            self._db.execute(
+                "UPDATE outbox SET attempts = ?, next_attempt_at = ?, "
+                "claimed_at = NULL, last_error = ? WHERE id = ?",
+                (attempts, now + delay, str(error), row_id)
+            )
+            self.counters["retried"] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the queue counters and outbox size.
+        
+        Returns:
+            The counters with the number of pending and failed notifications
+        """
+        with self._lock:
+            pending, failed = self._db.execute(
+                "SELECT COUNT(*) - COUNT(failed_at), COUNT(failed_at) FROM outbox"
+            ).fetchone()
+        return {
+            **self.counters,
+            "pending": pending,
+            "failedInOutbox": failed,
+            "connectionsOpened": self.pool.connections_opened,
+        }
@@ -0,0 +1,281 @@
+# app_modules/services/remote_store.py
+"""
+Remote stores that completed uploads are forwarded to.
+
+Uploads of a hosted wedding are kept apart from other events: each store
+puts them in a subdirectory or subfolder named after the tenant slug.
+
+The Google Drive store speaks the Drive v3 resumable upload protocol over
+plain HTTP, so it needs no client library. Its API and token URLs can be
+pointed at a local stand-in server for testing.
+"""
+
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+from app_modules.models import Upload
+
+
+class RemoteStore(ABC):
+    """Interface for stores that receive completed uploads."""
+    
+    @abstractmethod
+    def upload(self, path: str, upload: Upload) -> Tuple[str, Optional[str]]:
+        """
+        Store an assembled file.
+        
+        Args:
+            path: Local path of the assembled file
+            upload: The upload session the file belongs to
+        
+        Returns:
+            The file's ID in the store and a link to it, if the store has one
+        """
+        pass
+
+
+class LocalDirectoryStore(RemoteStore):
+    """
+    Store that moves completed uploads into a local directory.
+    
+    Attributes:
+        directory: Directory the files are moved to
+        url_prefix: URL prefix the directory is served under
+    """
+    
+    def __init__(self, directory: str, url_prefix: str = '/uploads'):
+        """Initialize the store."""
+        self.directory = directory
+        self.url_prefix = url_prefix.rstrip('/')
+    
+    def upload(self, path: str, upload: Upload) -> Tuple[str, Optional[str]]:
+        # Tenant slugs are restricted to [a-z0-9-], so they are safe path segments
+        subdirectory = f"{upload.tenant}/" if upload.tenant else ""
+        directory = os.path.join(self.directory, subdirectory)
+        os.makedirs(directory, exist_ok=True)
+        safe_name = (
+            re.sub(r'[^A-Za-z0-9._-]+', '_', upload.fileName).strip('._') or 'upload'
+        )
+        file_id = f"{upload.id}-{safe_name}"
+        
+        # A rename on the same filesystem, so the file is not copied
+        shutil.move(path, os.path.join(directory, file_id))
+        return f"{subdirectory}{file_id}", f"{self.url_prefix}/{subdirectory}{file_id}"
+
+
+class GoogleDriveStore(RemoteStore):
+    """
+    Store that uploads files to a Google Drive folder with resumable uploads.
+    
+    Attributes:
+        folder_id: ID of the Drive folder files are uploaded to
+        client_id: OAuth2 client ID
+        client_secret: OAuth2 client secret
+        refresh_token: OAuth2 refresh token with the drive.file scope
+        api_base: Base URL of the Drive API
+        token_url: URL of the OAuth2 token endpoint
+        chunk_size: Bytes sent per request, a multiple of 256 KiB
+        max_retries: Consecutive failed requests tolerated per upload
+        timeout: Socket timeout in seconds
+    """
+    
+    def __init__(
+        self,
+        folder_id: str,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        api_base: str = 'https://www.googleapis.com',
+        token_url: str = 'https://oauth2.googleapis.com/token',
+        chunk_size: int = 8 * 1024 * 1024,
+        max_retries: int = 5,
+        timeout: float = 60.0
+    ):
+        """Initialize the store; an access token is fetched on first use."""
+        self.folder_id = folder_id
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self.api_base = api_base.rstrip('/')
+        self.token_url = token_url
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._token_lock = threading.Lock()
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._folder_lock = threading.Lock()
+        self._tenant_folders: Dict[str, str] = {}
+    
+    def _get_access_token(self) -> str:
+        """Get a cached access token, refreshing it shortly before it expires."""
+        with self._token_lock:
+            if self._access_token and time.time() < self._token_expires_at - 60:
+                return self._access_token
+            
+            body = urllib.parse.urlencode({
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": self.refresh_token,
+                "grant_type": "refresh_token",
+            }).encode()
+            with urllib.request.urlopen(
+                self.token_url, body, timeout=self.timeout
+            ) as response:
+                token = json.load(response)
+            
+            self._access_token = token["access_token"]
+            self._token_expires_at = time.time() + token.get("expires_in", 3600)
+            return self._access_token
+    
+    def _request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Send an authorized request and return its status, headers and body."""
+        request = urllib.request.Request(url, data=body, method=method, headers={
+            **(headers or {}),
+            "Authorization": f"Bearer {self._get_access_token()}",
+        })
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.status, dict(response.headers), response.read()
+        except urllib.error.HTTPError as e:
+            # 308 Resume Incomplete is how Drive acknowledges a chunk
+            if e.code == 308:
+                return e.code, dict(e.headers), b""
+            if e.code == 401:
+                self._access_token = None
+            raise
+    
+    def _folder_for(self, tenant: Optional[str]) -> str:
+        """Get the ID of the folder a tenant's uploads go to, creating it if needed."""
+        if not tenant:
+            return self.folder_id
+        
+        with self._folder_lock:
+            folder_id = self._tenant_folders.get(tenant)
+            if folder_id is not None:
+                return folder_id
+            
+            query = (
+                f"name = '{tenant}' and '{self.folder_id}' in parents and "
+                "mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+            )
+            params = urllib.parse.urlencode({
+                "q": query,
+                "fields": "files(id)",
+                "supportsAllDrives": "true",
+                "includeItemsFromAllDrives": "true",
+            })
+            _, _, body = self._request(
+                'GET', f"{self.api_base}/drive/v3/files?{params}"
+            )
+            files = json.loads(body).get("files", [])
+            if files:
+                folder_id = files[0]["id"]
+            else:
+                _, _, body = self._request(
+                    'POST',
+                    f"{self.api_base}/drive/v3/files?supportsAllDrives=true&fields=id",
+                    json.dumps({
+                        "name": tenant,
+                        "mimeType": "application/vnd.google-apps.folder",
+                        "parents": [self.folder_id],
+                    }).encode(),
+                    {"Content-Type": "application/json; charset=UTF-8"}
+                )
+                folder_id = json.loads(body)["id"]
+            
+            self._tenant_folders[tenant] = folder_id
+            return folder_id
+    
+    def _start_session(self, upload: Upload) -> str:
+        """Create a resumable upload session and return its URL."""
+        metadata = {
+            "name": upload.fileName,
+            "parents": [self._folder_for(upload.tenant)],
+        }
+        if upload.guestName:
+            metadata["description"] = f"Uploaded by {upload.guestName}"
+        
+        _, headers, _ = self._request(
+            'POST',
+            f"{self.api_base}/upload/drive/v3/files"
+            "?uploadType=resumable&supportsAllDrives=true&fields=id,webViewLink",
+            json.dumps(metadata).encode(),
+            {
+                "Content-Type": "application/json; charset=UTF-8",
+                "X-Upload-Content-Type": upload.contentType,
+                "X-Upload-Content-Length": str(upload.size),
+            }
+        )
+        return headers["Location"]
+    
+    def _query_offset(self, session_url: str, size: int) -> Tuple[int, Optional[dict]]:
+        """Ask Drive how many bytes it has, or get the file if the upload finished."""
+        status, headers, body = self._request(
+            'PUT', session_url, b"", {"Content-Range": f"bytes */{size}"}
+        )
+        if status in (200, 201):
+            return size, json.loads(body)
+        return self._next_offset(headers), None
+    
+    @staticmethod
+    def _next_offset(headers: Dict[str, str]) -> int:
+        """Read the next offset from a 308 response's Range header."""
+        match = re.match(r'bytes=0-(\d+)', headers.get("Range", ""))
+        return int(match.group(1)) + 1 if match else 0
+    
+    def upload(self, path: str, upload: Upload) -> Tuple[str, Optional[str]]:
+        session_url = self._start_session(upload)
+        offset, result, failures = 0, None, 0
+        
+        with open(path, 'rb') as file:
+            while result is None:
+                try:
+                    if failures:
+                        # Drive may have kept part of the failed chunk
+                        offset, result = self._query_offset(session_url, upload.size)
+                        if result is not None:
+                            break
+                    
+                    file.seek(offset)
+                    chunk = file.read(self.chunk_size)
+                    end = offset + len(chunk) - 1
+                    status, headers, body = self._request('PUT', session_url, chunk, {
+                        "Content-Length": str(len(chunk)),
+                        "Content-Range": f"bytes {offset}-{end}/{upload.size}",
+                    })
+                    if status in (200, 201):
+                        result = json.loads(body)
+                    else:
+                        offset = self._next_offset(headers)
+                    failures = 0
+                
+                except urllib.error.HTTPError as e:
+                    # Client errors other than auth will not succeed on retry
+                    if 400 <= e.code < 500 and e.code not in (401, 408, 429):
+                        raise
+                    failures += 1
+                except OSError:
+                    failures += 1
+                
+                if failures > self.max_retries:
+                    raise RuntimeError("Too many failed requests to Google Drive")
+                if failures:
+                    time.sleep(min(2 ** failures, 30))
+        
+        return result["id"], result.get("webViewLink")
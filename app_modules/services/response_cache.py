@@ -0,0 +1,34 @@
+# app_modules/services/response_cache.py
+"""
+Helpers for precomputed, immutable JSON response bodies.
+"""
+
+import hashlib
+import json
+from typing import Any, NamedTuple
+
+
+class CachedResponse(NamedTuple):
+    """
+    A serialized JSON response body with its ETag.
+    
+    Attributes:
+        body: The encoded JSON body
+        etag: Strong ETag derived from the body
+    """
+    body: bytes
+    etag: str
+
+
+def build_cached_response(payload: Any) -> CachedResponse:
+    """
+    Serialize a payload once so it can be served repeatedly as-is.
+    
+    Args:
+        payload: A JSON-serializable object
+        
+    Returns:
+        The cached response for the payload
+    """
+    body = json.dumps(payload).encode('utf-8')
+    return CachedResponse(body=body, etag=hashlib.sha1(body).hexdigest())
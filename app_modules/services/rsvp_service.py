@@ -1,25 +1,142 @@
 # app_modules/services/rsvp_service.py
 """
 RSVP service for handling RSVP-related business logic.
+
+The RSVP list with its statistics is serialized once and reused until the
+next accepted RSVP, so repeated reads are served with an ETag instead of
+being rebuilt and re-encoded each time.
 """
 
-from typing import Dict, List, Any, Tuple
+import datetime
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from app_modules.models import Household, InsertInvitee, InsertRsvp, normalize_email
+from app_modules.repositories.interfaces import IInviteeRepository, IRsvpRepository
+from app_modules.services.activity_stats_service import ActivityStatsService
+from app_modules.services.notification_service import NotificationService
+from app_modules.services.response_cache import CachedResponse, build_cached_response
 
-from app_modules.models import Rsvp, InsertRsvp
-from app_modules.repositories.interfaces import IRsvpRepository
+logger = logging.getLogger(__name__)
 
 
 class RsvpService:
     """
     Service for managing RSVP operations.
     
+    When an invitee list is loaded, each submission is matched to a household
+    by invite code or email, and the seats it requests are checked against the
+    household's allowance and the venue capacity using running totals.
+    Accepted RSVPs are handed to the notification queue, which sends the
+    confirmation emails in the background.
+    
     Attributes:
         repository: The RSVP repository interface implementation
+        activity_stats: Optional activity counters updated on each new RSVP
+        invitee_repository: Optional invitee list used to match households
+        venue_capacity: Optional maximum number of seats across all RSVPs
+        notifications: Optional queue for confirmation and digest emails
+        tenant: Slug of the hosted wedding, or None for the default event
+        couple_email: Optional recipient of the RSVP digest
+        seats_reserved: Running total of seats held by attending RSVPs
+        seats_by_household: Running total of seats held per invite code
     """
     
-    def __init__(self, repository: IRsvpRepository):
+    def __init__(
+        self,
+        repository: IRsvpRepository,
+        activity_stats: Optional[ActivityStatsService] = None,
+        invitee_repository: Optional[IInviteeRepository] = None,
+        venue_capacity: Optional[int] = None,
+        notifications: Optional[NotificationService] = None,
+        tenant: Optional[str] = None,
+        couple_email: Optional[str] = None
+    ):
         """Initialize the RSVP service with a repository."""
         self.repository = repository
+        self.activity_stats = activity_stats
+        self.invitee_repository = invitee_repository
+        self.venue_capacity = venue_capacity
+        self.notifications = notifications
+        self.tenant = tenant
+        self.couple_email = couple_email
+        self._lock = threading.Lock()
+        # The serialized RSVP list, or None until it is next requested after a change
+        self._all_rsvps: Optional[Tuple[Dict[str, Any], CachedResponse]] = None
+        self._recount_seats()
+    
+    def _recount_seats(self) -> None:
+        """Rebuild the running seat totals from the stored RSVPs."""
+        seats_by_household: Dict[str, int] = {}
+        seats_reserved = 0
+        for rsvp in self.repository.get_all():
+            seats_reserved += rsvp.seats
+            if rsvp.inviteCode:
+                seats_by_household[rsvp.inviteCode] = (
+                    seats_by_household.get(rsvp.inviteCode, 0) + rsvp.seats
+                )
+        
+        self.seats_reserved = seats_reserved
+        self.seats_by_household = seats_by_household
+    
+    def load_invitees(
+        self, invitees: List[InsertInvitee]
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Replace the invitee list used to match RSVPs to households.
+        
+        Args:
+            invitees: The invitees to load
+            
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        if self.invitee_repository is None:
+            return {"message": "Invitee list is not configured"}, 501
+        
+        with self._lock:
+            household_count = self.invitee_repository.bulk_load(invitees)
+            self._recount_seats()
+            self._all_rsvps = None
+        
+        return {
+            "message": "Invitee list loaded successfully",
+            "invitees": len(invitees),
+            "households": household_count
+        }, 200
+    
+    def _match_household(
+        self, rsvp_data: InsertRsvp
+    ) -> Tuple[Optional[Household], Optional[str]]:
+        """
+        Find the household an RSVP belongs to.
+        
+        Returns:
+            A tuple of the matched household and an error message, both None
+            when no invitee list is loaded
+        """
+        if self.invitee_repository is None or self.invitee_repository.is_empty():
+            return None, None
+        
+        if rsvp_data.inviteCode:
+            household = self.invitee_repository.get_household_by_code(
+                rsvp_data.inviteCode
+            )
+            if household is None:
+                return None, "We couldn't find an invitation with this invite code"
+            # The code alone is not a credential: the email must be one of the
+            # household's
+            if normalize_email(rsvp_data.email) not in household.emails:
+                return None, (
+                    "This email address is not on the invitation for this invite code"
+                )
+        else:
+            household = self.invitee_repository.get_household_by_email(rsvp_data.email)
+            if household is None:
+                return None, "We couldn't find an invitation for this email address"
+        
+        return household, None
     
     def submit_rsvp(self, rsvp_data: InsertRsvp) -> Tuple[Dict[str, Any], int]:
         """
@@ -31,17 +148,90 @@ class RsvpService:
         Returns:
             A tuple containing the response data and HTTP status code
         """
-        # Check if an RSVP with this email already exists
-        existing_rsvp = self.repository.get_by_email(rsvp_data.email)
+        # Guests who already RSVP'd with a code keep their household on resubmission
+        if not rsvp_data.inviteCode:
+            existing_rsvp = self.repository.get_by_email(rsvp_data.email)
+            if existing_rsvp and existing_rsvp.inviteCode:
+                rsvp_data = rsvp_data.model_copy(
+                    update={"inviteCode": existing_rsvp.inviteCode}
+                )
+        
+        household, error = self._match_household(rsvp_data)
+        if error:
+            return {"message": error}, 403
+        
+        if household:
+            rsvp_data = rsvp_data.model_copy(
+                update={"inviteCode": household.inviteCode}
+            )
+        
+        with self._lock:
+            # Check if an RSVP with this email already exists
+            existing_rsvp = self.repository.get_by_email(rsvp_data.email)
+            previous_seats = existing_rsvp.seats if existing_rsvp else 0
+            previous_code = existing_rsvp.inviteCode if existing_rsvp else None
+            
+            if household:
+                held = self.seats_by_household.get(household.inviteCode, 0)
+                if previous_code == household.inviteCode:
+                    held -= previous_seats
+                if held + rsvp_data.seats > household.allowedSeats:
+                    remaining = max(household.allowedSeats - held, 0)
+                    return {
+                        "message": f"Your invitation has {remaining} seat(s) remaining"
+                    }, 409
+            
+            if (
+                self.venue_capacity is not None
+                and self.seats_reserved - previous_seats + rsvp_data.seats
+                > self.venue_capacity
+            ):
+                return {"message": "Sorry, the venue has reached its capacity"}, 409
+            
+            if existing_rsvp:
+                # Update existing RSVP
+                rsvp = self.repository.update(existing_rsvp.id, rsvp_data)
+            else:
+                # Create new RSVP
+                rsvp = self.repository.create(rsvp_data)
+            
+            # Move the RSVP's seats between the running totals
+            self.seats_reserved += rsvp.seats - previous_seats
+            if previous_code:
+                self.seats_by_household[previous_code] -= previous_seats
+            if rsvp.inviteCode:
+                self.seats_by_household[rsvp.inviteCode] = (
+                    self.seats_by_household.get(rsvp.inviteCode, 0) + rsvp.seats
+                )
+            self._all_rsvps = None
+        
+        if self.notifications:
+            try:
+                self.notifications.rsvp_received(
+                    rsvp,
+                    updated=existing_rsvp is not None,
+                    tenant=self.tenant,
+                    couple_email=self.couple_email,
+                    listed=household is not None
+                )
+            except Exception:
+                # A queue failure must not reject an RSVP that was already stored
+                logger.exception("Error queueing RSVP notification")
         
         if existing_rsvp:
-            # Update existing RSVP
-            rsvp = self.repository.update(existing_rsvp.id, rsvp_data)
-            return {"message": "RSVP updated successfully", "rsvp": rsvp.dict()}, 200
-        else:
-            # Create new RSVP
-            rsvp = self.repository.create(rsvp_data)
-            return {"message": "RSVP submitted successfully", "rsvp": rsvp.dict()}, 201
+            return {
+                "message": "RSVP updated successfully",
+                "rsvp": rsvp.model_dump()
+            }, 200
+        
+        if self.activity_stats:
+            self.activity_stats.record(
+                "rsvps", datetime.datetime.fromisoformat(rsvp.created_at)
+            )
+        return {
+            "message": "RSVP submitted successfully",
+            "rsvp": rsvp.model_dump()
+        }, 201
     
     def get_all_rsvps(self) -> Tuple[Dict[str, Any], int]:
         """
@@ -50,6 +240,27 @@ class RsvpService:
         Returns:
             A tuple containing the response data and HTTP status code
         """
+        return self._get_all_cached()[0], 200
+    
+    def get_all_rsvps_response(self) -> CachedResponse:
+        """
+        Get the precomputed response for all RSVPs with statistics.
+        
+        Returns:
+            The serialized response body and its ETag
+        """
+        return self._get_all_cached()[1]
+    
+    def _get_all_cached(self) -> Tuple[Dict[str, Any], CachedResponse]:
+        """Get the RSVP list and its serialized response, rebuilt after a change."""
+        with self._lock:
+            if self._all_rsvps is None:
+                response_data = self._build_all_rsvps()
+                self._all_rsvps = response_data, build_cached_response(response_data)
+            return self._all_rsvps
+    
+    def _build_all_rsvps(self) -> Dict[str, Any]:
+        """Build the RSVP list with statistics. Caller holds the lock."""
         rsvps = self.repository.get_all()
         
         # Calculate statistics
@@ -57,23 +268,23 @@ class RsvpService:
         attending_count = sum(1 for rsvp in rsvps if rsvp.attending)
         not_attending_count = total_count - attending_count
         
-        # Count total guests (includes the RSVP person + any additional guests)
-        guest_count = sum(
-            1 + (rsvp.guestCount or 0) for rsvp in rsvps if rsvp.attending
-        )
+        # Count total guests; guestCount already includes the RSVP person
+        guest_count = sum(rsvp.seats for rsvp in rsvps)
         
         # Format response
         response_data = {
-            "rsvps": [rsvp.dict() for rsvp in rsvps],
+            "rsvps": [rsvp.model_dump() for rsvp in rsvps],
             "stats": {
                 "total": total_count,
                 "attending": attending_count,
                 "notAttending": not_attending_count,
-                "guestCount": guest_count
+                "guestCount": guest_count,
+                "seatsReserved": self.seats_reserved,
+                "venueCapacity": self.venue_capacity
             }
         }
         
-        return response_data, 200
+        return response_data
     
     def get_rsvp_by_email(self, email: str) -> Tuple[Dict[str, Any], int]:
         """
@@ -88,6 +299,6 @@ class RsvpService:
         rsvp = self.repository.get_by_email(email)
         
         if rsvp:
-            return {"rsvp": rsvp.dict()}, 200
+            return {"rsvp": rsvp.model_dump()}, 200
         else:
-            return {"message": "RSVP not found"}, 404
\ No newline at end of file
+            return {"message": "RSVP not found"}, 404
@@ -0,0 +1,274 @@
+# app_modules/services/tenant_registry.py
+"""
+Registry of hosted weddings (tenants) with cold-tenant eviction.
+
+Active tenants keep their service container in memory. When more than
+``max_active`` tenants are loaded, the least recently used tenant with no
+request in flight is pickled to ``state_dir`` and dropped from memory; it is
+rehydrated on its next request.
+
+The registry lock only guards the in-memory bookkeeping. Pickling and
+unpickling happen outside it, under a lock per tenant, so a slow disk holds
+up requests to the tenant being moved but not to the other tenants.
+"""
+
+import os
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from app_modules.services.container import ServiceContainer
+
+# Tenant slugs double as file names, so keep them to a safe character set
+TENANT_SLUG_PATTERN = re.compile(r'^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?$')
+
+
+class TenantRegistry:
+    """
+    LRU registry of tenant service containers.
+    
+    Attributes:
+        state_dir: Directory evicted tenants are written to
+        max_active: Number of tenants kept in memory
+        container_factory: Callable creating the container of a new tenant from
+            its slug and settings, passed as keyword arguments
+        state_loader: Callable rebuilding a container from its saved state
+    """
+    
+    def __init__(
+        self,
+        state_dir: str = 'tenant_state',
+        max_active: int = 100,
+        container_factory: Callable[..., ServiceContainer] = ServiceContainer,
+        state_loader: Callable[
+            [Dict[str, Any]], ServiceContainer
+        ] = ServiceContainer.from_state
+    ):
+        """Initialize an empty registry."""
+        self.state_dir = state_dir
+        self.max_active = max_active
+        self.container_factory = container_factory
+        self.state_loader = state_loader
+        self._lock = threading.Lock()
+        self._active: "OrderedDict[str, ServiceContainer]" = OrderedDict()
+        # Evicted tenants whose state is still being written to disk
+        self._evicting: Dict[str, ServiceContainer] = {}
+        self._slug_locks: Dict[str, threading.Lock] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._evictions = 0
+        self._rehydrations = 0
+    
+    def _state_path(self, slug: str) -> str:
+        """Get the file an evicted tenant is stored in."""
+        return os.path.join(self.state_dir, f"{slug}.pickle")
+    
+    def _slug_lock(self, slug: str) -> threading.Lock:
+        """Get the lock serializing disk I/O for one tenant."""
+        with self._lock:
+            return self._slug_locks.setdefault(slug, threading.Lock())
+    
+    def exists(self, slug: str) -> bool:
+        """
+        Check whether a tenant has been created.
+        
+        Args:
+            slug: The tenant slug
+            
+        Returns:
+            True if the tenant is active or stored on disk
+        """
+        if not TENANT_SLUG_PATTERN.match(slug):
+            return False
+        with self._lock:
+            return self._exists(slug)
+    
+    def _exists(self, slug: str) -> bool:
+        """Check whether a tenant is active or stored on disk. Caller holds the lock."""
+        return (
+            slug in self._active
+            or slug in self._evicting
+            or os.path.exists(self._state_path(slug))
+        )
+    
+    def create(
+        self,
+        slug: str,
+        couple_email: Optional[str] = None,
+        admin_password_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Create a new tenant with empty repositories.
+        
+        Args:
+            slug: The tenant slug
+            couple_email: Recipient of the tenant's RSVP digest, if any
+            admin_password_hash: Hash of the tenant's own admin password
+            
+        Returns:
+            True if the tenant was created, False if it already existed
+            
+        Raises:
+            ValueError: If the slug is not valid
+        """
+        if not TENANT_SLUG_PATTERN.match(slug):
+            raise ValueError(f"Invalid tenant slug '{slug}'")
+        
+        # Checked and inserted under one lock, so two creates cannot both succeed
+        with self._lock:
+            if self._exists(slug):
+                return False
+            self._active[slug] = self.container_factory(
+                tenant=slug,
+                couple_email=couple_email,
+                admin_password_hash=admin_password_hash
+            )
+            evicted = self._evict_cold()
+        self._write_evicted(evicted)
+        return True
+    
+    def acquire(self, slug: str) -> Optional[ServiceContainer]:
+        """
+        Get a tenant's container for the duration of a request.
+        
+        Every successful acquire must be paired with a release.
+        
+        Args:
+            slug: The tenant slug
+            
+        Returns:
+            The tenant's container, or None if the tenant does not exist
+        """
+        if not TENANT_SLUG_PATTERN.match(slug):
+            return None
+        
+        with self._lock:
+            container = self._active.get(slug)
+            if container is not None:
+                evicted = self._checkout(slug)
+        
+        if container is None:
+            with self._slug_lock(slug):
+                # A tenant evicted but not yet written is taken back, which cancels
+                # the write; one already being written is on disk once we get here
+                with self._lock:
+                    container = self._active.get(slug)
+                    if container is None:
+                        container = self._evicting.pop(slug, None)
+                if container is None:
+                    container = self._rehydrate(slug)
+                    if container is None:
+                        return None
+                
+                with self._lock:
+                    container = self._active.setdefault(slug, container)
+                    evicted = self._checkout(slug)
+        
+        self._write_evicted(evicted)
+        return container
+    
+    def release(self, slug: str) -> None:
+        """
+        Mark a request on a tenant as finished.
+        
+        Args:
+            slug: The tenant slug
+        """
+        with self._lock:
+            remaining = self._in_flight.get(slug, 0) - 1
+            if remaining > 0:
+                self._in_flight[slug] = remaining
+            else:
+                self._in_flight.pop(slug, None)
+            evicted = self._evict_cold()
+        self._write_evicted(evicted)
+    
+    def _checkout(self, slug: str) -> Dict[str, ServiceContainer]:
+        """Mark an active tenant as used by a request. Caller holds the lock."""
+        self._active.move_to_end(slug)
+        self._in_flight[slug] = self._in_flight.get(slug, 0) + 1
+        return self._evict_cold()
+    
+    def _rehydrate(self, slug: str) -> Optional[ServiceContainer]:
+        """Load an evicted tenant from disk; call with the tenant's lock held."""
+        try:
+            with open(self._state_path(slug), 'rb') as state_file:
+                state = pickle.load(state_file)
+        except FileNotFoundError:
+            return None
+        
+        container = self.state_loader(state)
+        with self._lock:
+            self._rehydrations += 1
+        return container
+    
+    def _persist(self, slug: str, container: ServiceContainer) -> None:
+        """Write a tenant's state to disk, replacing any previous copy atomically."""
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self._state_path(slug)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as state_file:
+            pickle.dump(
+                container.get_state(), state_file, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, path)
+    
+    def _evict_cold(self) -> Dict[str, ServiceContainer]:
+        """
+        Drop least recently used idle tenants until within max_active.
+        
+        Called with the registry lock held. The dropped tenants stay in
+        ``_evicting`` until ``_write_evicted`` has saved them.
+        
+        Returns:
+            The evicted tenants by slug
+        """
+        excess = len(self._active) - self.max_active
+        if excess <= 0:
+            return {}
+        
+        # OrderedDict iterates from least to most recently used
+        evicted = {}
+        for slug in [s for s in self._active if s not in self._in_flight][:excess]:
+            evicted[slug] = self._evicting[slug] = self._active.pop(slug)
+            self._evictions += 1
+        return evicted
+    
+    def _write_evicted(self, evicted: Dict[str, ServiceContainer]) -> None:
+        """Save evicted tenants to disk; call without the registry lock held."""
+        for slug, container in evicted.items():
+            with self._slug_lock(slug):
+                with self._lock:
+                    if self._evicting.get(slug) is not container:
+                        # Taken back by a request before it could be written
+                        continue
+                try:
+                    self._persist(slug, container)
+                finally:
+                    with self._lock:
+                        self._evicting.pop(slug, None)
+    
+    def persist_all(self) -> None:
+        """Write every active tenant to disk, e.g. on shutdown."""
+        with self._lock:
+            active = list(self._active.items())
+        for slug, container in active:
+            with self._slug_lock(slug):
+                self._persist(slug, container)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry counters.
+        
+        Returns:
+            Active tenant slugs and eviction/rehydration counts
+        """
+        with self._lock:
+            return {
+                "active": list(self._active),
+                "maxActive": self.max_active,
+                "inFlight": dict(self._in_flight),
+                "evictions": self._evictions,
+                "rehydrations": self._rehydrations
+            }
@@ -0,0 +1,483 @@
+# app_modules/services/upload_service.py
+"""
+Resumable chunked uploads for guest photos and videos.
+
+A client starts an upload session with the file's size, then PUTs fixed-size
+parts at their byte offsets in any order, retrying only the parts that
+failed. Each part is streamed straight into its place in a file preallocated
+at the full size, and is accepted only if its SHA-256 matches the one the
+client sent. Once every part is in, the file is already assembled; completing
+the upload hands it to a background worker pool that verifies the whole-file
+checksum and forwards it to the remote store.
+
+A part is marked as in flight while it is written, so the same part is never
+written twice at once and an upload cannot be completed, or expire, under a
+part still being written. Uploads that could not be forwarded keep their file,
+and completing them again retries the forward. Preallocated files count
+against a total disk quota until they are handed off; the service keeps a
+running total of them rather than scanning every session.
+
+Sessions that have not changed for the session TTL are discarded, whatever
+state they ended in, unless they are still being forwarded.
+
+Sessions belong to the event they were started in; other events see them as
+not found.
+"""
+
+import datetime
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, Optional, Set, Tuple
+
+from app_modules.models import (
+    UPLOAD_COMPLETE,
+    UPLOAD_FAILED,
+    UPLOAD_FORWARDING,
+    UPLOAD_RECEIVING,
+    InsertUpload,
+    Upload,
+)
+from app_modules.repositories.interfaces import IUploadRepository
+from app_modules.services.remote_store import RemoteStore
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from the request body at a time while streaming a part to disk
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadService:
+    """
+    Service for managing resumable upload sessions.
+    
+    Attributes:
+        repository: The upload session repository interface implementation
+        remote_store: Store completed uploads are forwarded to
+        storage_dir: Directory the partial files are written to
+        part_size: Size of every part except the last, in bytes
+        max_size: Largest file accepted, in bytes
+        max_pending_bytes: Total size of the files not yet handed off, in bytes
+        session_ttl: Seconds an upload session is kept after its last change
+        max_attempts: Forwarding attempts before an upload is marked failed
+    """
+    
+    def __init__(
+        self,
+        repository: IUploadRepository,
+        remote_store: RemoteStore,
+        storage_dir: str = 'upload_state',
+        part_size: int = 8 * 1024 * 1024,
+        max_size: int = 2 * 1024 * 1024 * 1024,
+        max_pending_bytes: int = 20 * 1024 * 1024 * 1024,
+        session_ttl: float = 24 * 3600,
+        workers: int = 2,
+        max_attempts: int = 3
+    ):
+        """Initialize the upload service; forwarding threads start on demand."""
+        self.repository = repository
+        self.remote_store = remote_store
+        self.storage_dir = storage_dir
+        self.part_size = part_size
+        self.max_size = max_size
+        self.max_pending_bytes = max_pending_bytes
+        self.session_ttl = session_ttl
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        # Indexes of the parts being written, per upload
+        self._writing: Dict[str, Set[int]] = {}
+        # Size of the files not yet handed off, kept up to date under the lock
+        self._pending_bytes = sum(
+            upload.size for upload in repository.get_all()
+            if upload.status != UPLOAD_COMPLETE
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='upload'
+        )
+        self._last_cleanup = 0.0
+    
+    def _path(self, upload_id: str) -> str:
+        """Get the path of an upload's partial file."""
+        return os.path.join(self.storage_dir, f"{upload_id}.part")
+    
+    def _remove_file(self, upload_id: str) -> None:
+        """Delete an upload's partial file if it still exists."""
+        try:
+            os.remove(self._path(upload_id))
+        except FileNotFoundError:
+            pass
+    
+    def _get(self, upload_id: str, tenant: Optional[str]) -> Optional[Upload]:
+        """Get an upload session of the given event."""
+        upload = self.repository.get_by_id(upload_id)
+        if upload is None or upload.tenant != tenant:
+            return None
+        return upload
+    
+    def _status(self, upload: Upload) -> Dict[str, Any]:
+        """Describe an upload session for the client."""
+        received = set(upload.receivedParts)
+        return {
+            **upload.model_dump(),
+            "missingParts": [i for i in range(upload.partCount) if i not in received],
+            "receivedBytes": sum(self._part_length(upload, i) for i in received),
+        }
+    
+    def _part_length(self, upload: Upload, index: int) -> int:
+        """Get the length of a part; only the last one may be shorter."""
+        return min(upload.partSize, upload.size - index * upload.partSize)
+    
+    def _delete(self, upload: Upload) -> None:
+        """Delete an upload session and release its space. Caller holds the lock."""
+        if self.repository.delete(upload.id) and upload.status != UPLOAD_COMPLETE:
+            self._pending_bytes -= upload.size
+    
+    def _done_writing(self, upload_id: str, index: int) -> None:
+        """Clear a part's in-flight mark. Caller holds the lock."""
+        writing = self._writing.get(upload_id)
+        if writing is not None:
+            writing.discard(index)
+            if not writing:
+                del self._writing[upload_id]
+    
+    def _expire_stale(self) -> None:
+        """Discard upload sessions idle past the session TTL, at most once a minute."""
+        now = time.time()
+        if now - self._last_cleanup < 60:
+            return
+        self._last_cleanup = now
+        
+        cutoff = (
+            datetime.datetime.now() - datetime.timedelta(seconds=self.session_ttl)
+        ).isoformat()
+        with self._lock:
+            stale = [
+                upload for upload in self.repository.get_all()
+                if upload.status != UPLOAD_FORWARDING
+                and upload.updated_at < cutoff
+                and upload.id not in self._writing
+            ]
+            for upload in stale:
+                self._delete(upload)
+        
+        for upload in stale:
+            self._remove_file(upload.id)
+    
+    def initiate(
+        self,
+        upload_data: InsertUpload,
+        tenant: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Start an upload session and preallocate its file.
+        
+        Args:
+            upload_data: The file's name, size and optional checksum
+            tenant: Slug of the hosted wedding, or None for the default event
+        
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        if upload_data.size > self.max_size:
+            return {
+                "message": f"File is larger than the {self.max_size} byte limit"
+            }, 413
+        
+        self._expire_stale()
+        with self._lock:
+            # Anyone may start an upload, so the space they can reserve is capped
+            if self._pending_bytes + upload_data.size > self.max_pending_bytes:
+                return {
+                    "message": "Upload storage is full, please try again later"
+                }, 507
+            upload = self.repository.create(upload_data, self.part_size, tenant)
+            self._pending_bytes += upload.size
+        
+        try:
+            os.makedirs(self.storage_dir, exist_ok=True)
+            fd = os.open(
+                self._path(upload.id), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600
+            )
+            try:
+                # Reserve the disk space up front so a part never fails halfway for
+                # lack of it
+                if hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(fd, 0, upload.size)
+                else:
+                    os.ftruncate(fd, upload.size)
+            finally:
+                os.close(fd)
+        except OSError:
+            logger.exception("Failed to preallocate upload file")
+            with self._lock:
+                self._delete(upload)
+            self._remove_file(upload.id)
+            return {"message": "Not enough storage for this upload"}, 507
+        
+        return {"message": "Upload started", "upload": self._status(upload)}, 201
+    
+    def write_part(
+        self,
+        upload_id: str,
+        offset: int,
+        length: int,
+        total: Optional[int],
+        stream: BinaryIO,
+        sha256: str,
+        tenant: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Stream one part into place in the upload's file.
+        
+        Args:
+            upload_id: The upload session ID
+            offset: Byte offset of the part, a multiple of the part size
+            length: Length of the part in bytes
+            total: File size given in Content-Range, if the client sent one
+            stream: The request body
+            sha256: Hex SHA-256 the part must match
+            tenant: Slug of the hosted wedding, or None for the default event
+        
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        with self._lock:
+            upload = self._get(upload_id, tenant)
+            if upload is None:
+                return {"message": "Upload not found"}, 404
+            if upload.status != UPLOAD_RECEIVING:
+                return {"message": f"Upload is already {upload.status}"}, 409
+            if total is not None and total != upload.size:
+                return {
+                    "message": (
+                        f"Content-Range total must be the file size, {upload.size}"
+                    )
+                }, 416
+            
+            index, remainder = divmod(offset, upload.partSize)
+            if remainder or index >= upload.partCount:
+                return {
+                    "message": (
+                        f"Parts must start at a multiple of {upload.partSize} bytes"
+                    )
+                }, 416
+            part_length = self._part_length(upload, index)
+            if length != part_length:
+                return {"message": f"Part {index} must be {part_length} bytes"}, 416
+            
+            # A retry of a part that made it is acknowledged without rewriting it
+            if index in upload.receivedParts:
+                return {
+                    "message": f"Part {index} already received",
+                    "upload": self._status(upload)
+                }, 200
+            
+            writing = self._writing.setdefault(upload_id, set())
+            if index in writing:
+                return {"message": f"Part {index} is already being received"}, 409
+            writing.add(index)
+        
+        received = False
+        try:
+            try:
+                fd = os.open(self._path(upload_id), os.O_WRONLY)
+            except FileNotFoundError:
+                # Cancelled or expired since the check above
+                return {"message": "Upload not found"}, 404
+            
+            digest = hashlib.sha256()
+            written = 0
+            try:
+                while written < length:
+                    chunk = stream.read(min(STREAM_CHUNK_SIZE, length - written))
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    # Positional writes, so parts can be written concurrently
+                    view, position = memoryview(chunk), offset + written
+                    while view:
+                        count = os.pwrite(fd, view, position)
+                        view, position = view[count:], position + count
+                    written += len(chunk)
+            finally:
+                os.close(fd)
+            
+            if written != length:
+                return {"message": "Part was incomplete, please retry it"}, 400
+            if digest.hexdigest() != sha256.lower():
+                return {"message": "Part checksum mismatch, please retry it"}, 422
+            
+            with self._lock:
+                upload = self._get(upload_id, tenant)
+                if upload is None:
+                    return {"message": "Upload not found"}, 404
+                upload = self.repository.update(
+                    upload_id, receivedParts=sorted([*upload.receivedParts, index])
+                )
+                self._done_writing(upload_id, index)
+                received = True
+        
+        finally:
+            if not received:
+                with self._lock:
+                    self._done_writing(upload_id, index)
+        
+        return {
+            "message": f"Part {index} received",
+            "upload": self._status(upload)
+        }, 200
+    
+    def get_status(
+        self, upload_id: str, tenant: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Get the progress of an upload.
+        
+        Args:
+            upload_id: The upload session ID
+            tenant: Slug of the hosted wedding, or None for the default event
+        
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        upload = self._get(upload_id, tenant)
+        if upload is None:
+            return {"message": "Upload not found"}, 404
+        return {"upload": self._status(upload)}, 200
+    
+    def complete(
+        self, upload_id: str, tenant: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Finish receiving an upload and queue it for forwarding.
+        
+        Completing an upload whose forwarding failed queues it again.
+        
+        Args:
+            upload_id: The upload session ID
+            tenant: Slug of the hosted wedding, or None for the default event
+        
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        with self._lock:
+            upload = self._get(upload_id, tenant)
+            if upload is None:
+                return {"message": "Upload not found"}, 404
+            if upload.status not in (UPLOAD_RECEIVING, UPLOAD_FAILED):
+                # Completing twice is harmless, so clients can retry it
+                return {"upload": self._status(upload)}, 200
+            
+            status = self._status(upload)
+            if upload_id in self._writing:
+                return {
+                    "message": "Parts are still being received",
+                    "upload": status
+                }, 409
+            if status["missingParts"]:
+                return {"message": "Upload is missing parts", "upload": status}, 409
+            
+            upload = self.repository.update(
+                upload_id, status=UPLOAD_FORWARDING, error=None
+            )
+        
+        self._executor.submit(self._forward, upload_id)
+        return {
+            "message": "Upload received and is being saved",
+            "upload": self._status(upload)
+        }, 202
+    
+    def abort(
+        self, upload_id: str, tenant: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], int]:
+        """
+        Cancel an upload and delete its file.
+        
+        Args:
+            upload_id: The upload session ID
+            tenant: Slug of the hosted wedding, or None for the default event
+        
+        Returns:
+            A tuple containing the response data and HTTP status code
+        """
+        with self._lock:
+            upload = self._get(upload_id, tenant)
+            if upload is None:
+                return {"message": "Upload not found"}, 404
+            if upload.status == UPLOAD_FORWARDING:
+                return {
+                    "message": "Upload is being saved and can no longer be cancelled"
+                }, 409
+            self._delete(upload)
+        
+        self._remove_file(upload_id)
+        return {"message": "Upload cancelled"}, 200
+    
+    def _verify_checksum(self, upload: Upload) -> bool:
+        """Check the assembled file against the whole-file checksum, if given."""
+        if not upload.sha256:
+            return True
+        
+        digest = hashlib.sha256()
+        with open(self._path(upload.id), 'rb') as file:
+            while chunk := file.read(STREAM_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest() == upload.sha256.lower()
+    
+    def _forward(self, upload_id: str) -> None:
+        """Verify an assembled upload and forward it to the remote store."""
+        upload = self.repository.get_by_id(upload_id)
+        if upload is None:
+            return
+        
+        path = self._path(upload_id)
+        try:
+            with open(path, 'rb+') as file:
+                os.fsync(file.fileno())
+            if not self._verify_checksum(upload):
+                # Every part matched its own checksum, so the client has to send
+                # them all again
+                self.repository.update(
+                    upload_id,
+                    status=UPLOAD_RECEIVING,
+                    receivedParts=[],
+                    error="File checksum mismatch, please send every part again"
+                )
+                return
+        except OSError as e:
+            logger.exception("Failed to verify upload", extra={"uploadId": upload_id})
+            self.repository.update(upload_id, status=UPLOAD_FAILED, error=str(e))
+            return
+        
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                file_id, link = self.remote_store.upload(path, upload)
+                break
+            except Exception as e:
+                logger.warning(
+                    "Forwarding upload failed: %s", e,
+                    extra={"uploadId": upload_id, "attempt": attempt}
+                )
+                if attempt == self.max_attempts:
+                    # Keep the file, so completing the upload again retries the forward
+                    self.repository.update(
+                        upload_id, status=UPLOAD_FAILED, error=str(e)
+                    )
+                    return
+                time.sleep(2 ** attempt)
+        
+        with self._lock:
+            self.repository.update(
+                upload_id,
+                status=UPLOAD_COMPLETE,
+                remoteFileId=file_id,
+                webViewLink=link
+            )
+            self._pending_bytes -= upload.size
+        self._remove_file(upload_id)
+        logger.info(
+            "Upload forwarded", extra={"uploadId": upload_id, "remoteFileId": file_id}
+        )
@@ -0,0 +1,4 @@
+# benchmarks/__init__.py
+"""
+Micro-benchmarks for the wedding e-invitation application.
+"""
@@ -169,8 +169,8 @@ export default function AdminDashboard() {
     rsvps.rsvps.forEach((rsvp: Rsvp) => {
       if (rsvp.attending) {
         attending++;
-        // Add additional guests if present
-        totalGuests += 1 + (rsvp.guestCount || 0);
+        // guestCount already includes the guest themselves
+        totalGuests += rsvp.guestCount || 1;
       } else {
         notAttending++;
       }
@@ -5,5 +5,5 @@ import os
 port = int(os.environ.get('PORT', 5001))
 
 if __name__ == '__main__':
-    print(f"Starting Flask server on port {port}...")
+    print(f"Starting Flask server on http://0.0.0.0:{port}...", flush=True)
     app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
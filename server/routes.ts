@@ -5,7 +5,7 @@ import { insertRsvpSchema, insertMediaSchema, insertConfigImageSchema, insertFea
 import { z } from "zod";
 import { fromZodError } from "zod-validation-error";
 import { log } from './vite';
-import { createProxyMiddleware } from "http-proxy-middleware";
+import { createProxyMiddleware, fixRequestBody } from "http-proxy-middleware";
 import multer from "multer";
 import path from "path";
 import fs from "fs";
@@ -16,6 +16,40 @@ import { weddingObjectStorage, ObjectNotFoundError } from "./objectStorage";
 
 const FLASK_API_URL = "http://localhost:5001";
 
+// Tell Flask who the client is, so its per-client rate limits don't see every request as localhost
+function forwardedFor(req: Request): string {
+  const incoming = req.headers["x-forwarded-for"];
+  return [incoming, req.socket.remoteAddress].flat().filter(Boolean).join(", ");
+}
+
+// Pass a Flask response on unchanged, keeping Retry-After so shed clients back off
+async function relayFlaskResponse(flaskResponse: Awaited<ReturnType<typeof fetch>>, res: Response) {
+  const retryAfter = flaskResponse.headers.get("retry-after");
+  if (retryAfter) {
+    res.set("Retry-After", retryAfter);
+  }
+  const data = await flaskResponse.json();
+  return res.status(flaskResponse.status).json(data);
+}
+
+// Stream a public read through from Flask untouched, so its compressed body, ETag,
+// Vary and 304 responses reach the browser without being decoded and re-encoded
+// here. Node only answers, with the fallback, when Flask cannot be reached.
+function flaskReadProxy(fallback: (req: Request, res: Response) => unknown) {
+  return createProxyMiddleware<Request, Response>({
+    target: FLASK_API_URL,
+    xfwd: true,
+    on: {
+      error: (err, req, res) => {
+        log(`Flask server not available for GET ${req.originalUrl}: ${err.message}`, 'flask-proxy');
+        if ("writeHead" in res && !res.headersSent) {
+          fallback(req, res);
+        }
+      },
+    },
+  });
+}
+
 // Keep uploads directory for backward compatibility (existing files)
 const uploadsDir = path.join(process.cwd(), 'public', 'uploads');
 if (!fs.existsSync(uploadsDir)) {
@@ -72,6 +106,25 @@ export async function registerRoutes(app: Express): Promise<Server> {
     log(`Failed to start Flask server: ${err}`, 'flask');
   }
 
+  // Resumable uploads exist only in Flask. Parts are streamed through untouched;
+  // the JSON start request was already parsed by express.json, so it is re-sent.
+  app.use(createProxyMiddleware({
+    target: FLASK_API_URL,
+    pathFilter: "/api/uploads",
+    xfwd: true,
+    proxyTimeout: 10 * 60 * 1000,
+    on: {
+      proxyReq: fixRequestBody,
+      error: (err, _req, res) => {
+        log(`Error proxying upload to Flask: ${err.message}`, 'flask-proxy');
+        if ("writeHead" in res && !res.headersSent) {
+          res.writeHead(502, { "Content-Type": "application/json" });
+          res.end(JSON.stringify({ message: "Upload service is unavailable" }));
+        }
+      },
+    },
+  }));
+
   // Try using the Flask API first, if available
   app.post("/api/rsvp", async (req: Request, res: Response, next: NextFunction) => {
     try {
@@ -81,6 +134,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
+          "X-Forwarded-For": forwardedFor(req),
         },
         body: JSON.stringify(req.body),
       };
@@ -90,39 +144,23 @@ export async function registerRoutes(app: Express): Promise<Server> {
         return null;
       });
       
-      if (flaskResponse && flaskResponse.ok) {
-        const data = await flaskResponse.json();
-        return res.status(flaskResponse.status).json(data);
+      // Flask's answer is final, rejections included: storing a rejected RSVP
+      // in Node would bypass the household and capacity checks
+      if (flaskResponse) {
+        return relayFlaskResponse(flaskResponse, res);
       }
       
-      // If Flask is not available, use the Node.js implementation
+      // Only if Flask cannot be reached, use the Node.js implementation
       log("Flask server not available, using Node.js implementation", 'flask-proxy');
       return handleRsvpSubmission(req, res);
     } catch (error) {
       log(`Error proxying to Flask: ${error}`, 'flask-proxy');
-      return handleRsvpSubmission(req, res);
+      return res.status(502).json({ message: "Failed to submit RSVP." });
     }
   });
 
-  app.get("/api/rsvp", async (req: Request, res: Response, next: NextFunction) => {
-    try {
-      // Try forwarding to Flask server
-      const flaskUrl = `${FLASK_API_URL}/api/rsvp`;
-      const flaskResponse = await fetch(flaskUrl).catch(() => null);
-      
-      if (flaskResponse && flaskResponse.ok) {
-        const data = await flaskResponse.json();
-        return res.status(flaskResponse.status).json(data);
-      }
-      
-      // If Flask is not available, use the Node.js implementation
-      log("Flask server not available for GET /api/rsvp, using Node.js implementation", 'flask-proxy');
-      return handleGetRsvps(req, res);
-    } catch (error) {
-      log(`Error proxying to Flask: ${error}`, 'flask-proxy');
-      return handleGetRsvps(req, res);
-    }
-  });
+  // If Flask is not available, use the Node.js implementation
+  app.get("/api/rsvp", flaskReadProxy((req, res) => handleGetRsvps(req, res)));
 
   // Add message board routes that proxy to Flask
   app.post("/api/messages", async (req: Request, res: Response) => {
@@ -133,15 +171,16 @@ export async function registerRoutes(app: Express): Promise<Server> {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
+          "X-Forwarded-For": forwardedFor(req),
         },
         body: JSON.stringify(req.body),
       };
 
       const flaskResponse = await fetch(flaskUrl, flaskOptions).catch(() => null);
       
-      if (flaskResponse && flaskResponse.ok) {
-        const data = await flaskResponse.json();
-        return res.status(flaskResponse.status).json(data);
+      // Rejections, rate limits and shedding are relayed as Flask sent them
+      if (flaskResponse) {
+        return relayFlaskResponse(flaskResponse, res);
       }
       
       // If Flask is not available, return an error
@@ -156,28 +195,8 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
-  app.get("/api/messages", async (req: Request, res: Response) => {
-    try {
-      // Try forwarding to Flask server
-      const flaskUrl = `${FLASK_API_URL}/api/messages`;
-      const flaskResponse = await fetch(flaskUrl).catch(() => null);
-      
-      if (flaskResponse && flaskResponse.ok) {
-        const data = await flaskResponse.json();
-        return res.status(flaskResponse.status).json(data);
-      }
-      
-      // If Flask is not available, return an empty array
-      return res.status(200).json({ 
-        messages: []
-      });
-    } catch (error) {
-      log(`Error proxying to Flask message board: ${error}`, 'flask-proxy');
-      return res.status(500).json({ 
-        message: "Failed to fetch messages."
-      });
-    }
-  });
+  // If Flask is not available, return an empty array
+  app.get("/api/messages", flaskReadProxy((_req, res) => res.status(200).json({ messages: [] })));
 
   // Add individual RSVP lookup by email
   app.get("/api/rsvp/:email", async (req: Request, res: Response) => {
@@ -1,71 +1,283 @@
 # start_app.py
 """
 Script to start both the Express and Flask servers.
+
+The supervisor runs an event loop over the children's output pipes, so their
+logs are forwarded line by line as they are written and the children never
+block on a full pipe. Flask must accept connections on its port before
+Express is started, crashed children are restarted with exponential backoff,
+and SIGINT/SIGTERM are forwarded to the children for a graceful shutdown.
 """
-import subprocess
 import os
+import selectors
+import signal
+import socket
+import subprocess
+import sys
 import time
+from typing import Dict, List, Optional
+
+# Seconds a child may take to start accepting connections
+READY_TIMEOUT = 60.0
+# Seconds between readiness checks while a child is starting
+READY_POLL_INTERVAL = 0.25
+# Restart backoff bounds, in seconds
+RESTART_BACKOFF_MIN = 1.0
+RESTART_BACKOFF_MAX = 30.0
+# A child that stays up this long has its backoff reset
+STABLE_AFTER = 30.0
+# Seconds children get to exit after SIGTERM before they are killed
+SHUTDOWN_GRACE = 10.0
+
+
+def port_is_open(port: int, host: str = "127.0.0.1") -> bool:
+    """Check whether something accepts TCP connections on the port."""
+    try:
+        with socket.create_connection((host, port), timeout=READY_POLL_INTERVAL):
+            return True
+    except OSError:
+        return False
+
+
+class ManagedProcess:
+    """A child server with its output pipes, readiness check and restart state."""
+
+    def __init__(
+        self,
+        name: str,
+        args: List[str],
+        port: int,
+        env: Optional[Dict[str, str]] = None
+    ):
+        """
+        Describe a child server; it is not started until the supervisor does so.
+
+        Args:
+            name: Name shown on the child's log lines
+            args: Command line that starts the server
+            port: Port the server accepts connections on once it is ready
+            env: Environment for the child, or None to inherit this process's
+        """
+        self.name = name
+        self.args = args
+        self.port = port
+        self.env = env
+        self.process: Optional[subprocess.Popen] = None
+        self.ready = False
+        self.started_at = 0.0
+        self.backoff = RESTART_BACKOFF_MIN
+        self.restart_at: Optional[float] = None
+        self._buffers: Dict[int, bytes] = {}
+
+    def start(self, selector: selectors.BaseSelector) -> None:
+        """Start the child and register its output pipes with the selector."""
+        print(f"Starting {self.name} server...", flush=True)
+        self.process = subprocess.Popen(
+            self.args,
+            env=self.env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            # Own process group, so signals reach the whole child tree
+            start_new_session=True
+        )
+        self.ready = False
+        self.started_at = time.monotonic()
+        self.restart_at = None
+
+        for stream, label in (
+            (self.process.stdout, "out"), (self.process.stderr, "err")
+        ):
+            os.set_blocking(stream.fileno(), False)
+            self._buffers[stream.fileno()] = b""
+            selector.register(stream, selectors.EVENT_READ, (self, label))
+
+    def read(self, selector: selectors.BaseSelector, stream, label: str) -> None:
+        """Forward whatever complete lines are available on a pipe."""
+        fd = stream.fileno()
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return
+
+        if not chunk:
+            # EOF: flush a trailing partial line and stop watching the pipe
+            self._emit(label, self._buffers.pop(fd, b""))
+            selector.unregister(stream)
+            stream.close()
+            return
+
+        *lines, self._buffers[fd] = (self._buffers[fd] + chunk).split(b"\n")
+        for line in lines:
+            self._emit(label, line)
+
+    def _emit(self, label: str, line: bytes) -> None:
+        """Print one line of child output with the child's name."""
+        if not line:
+            return
+        text = line.decode("utf-8", errors="replace").rstrip("\r")
+        target = sys.stderr if label == "err" else sys.stdout
+        print(f"[{self.name}] {text}", file=target, flush=True)
+
+    def signal(self, signum: int) -> None:
+        """Send a signal to the child's process group."""
+        if self.process is not None and self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signum)
+            except ProcessLookupError:
+                pass
+
+
+class Supervisor:
+    """Event loop running the children until shutdown."""
+
+    def __init__(self, children: List[ManagedProcess]):
+        """
+        Set up the selector and install the signal handlers.
+
+        Args:
+            children: Servers to run, each started once the one before it is ready
+        """
+        self.children = children
+        self.selector = selectors.DefaultSelector()
+        self.shutting_down = False
+
+        # Signals only set a flag; the wakeup pipe interrupts the select call
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
+        signal.set_wakeup_fd(self._wakeup_write)
+        self.selector.register(self._wakeup_read, selectors.EVENT_READ, None)
+
+        signal.signal(signal.SIGINT, self._request_shutdown)
+        signal.signal(signal.SIGTERM, self._request_shutdown)
+        # A handler is needed for SIGCHLD to wake the loop when a child exits
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    def _request_shutdown(self, signum, frame) -> None:
+        """Signal handler for SIGINT/SIGTERM; the loop shuts down on its next pass."""
+        if not self.shutting_down:
+            print("Shutting down servers...", flush=True)
+        self.shutting_down = True
+
+    def _next_timeout(self) -> Optional[float]:
+        """Seconds until the loop has scheduled work, or None to wait for events."""
+        now = time.monotonic()
+        deadlines = []
+        for child in self.children:
+            if child.restart_at is not None:
+                deadlines.append(child.restart_at)
+            elif child.process is not None and not child.ready:
+                deadlines.append(now + READY_POLL_INTERVAL)
+            elif child.ready and child.backoff > RESTART_BACKOFF_MIN:
+                deadlines.append(child.started_at + STABLE_AFTER)
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - now)
+
+    def _check_children(self) -> None:
+        """Handle exits, readiness and scheduled restarts."""
+        now = time.monotonic()
+        for index, child in enumerate(self.children):
+            # Each child waits for the one before it to be ready
+            previous_ready = index == 0 or self.children[index - 1].ready
+
+            if child.process is None:
+                if previous_ready and (
+                    child.restart_at is None or child.restart_at <= now
+                ):
+                    child.start(self.selector)
+                continue
+
+            status = child.process.poll()
+            if status is not None:
+                print(f"{child.name} server exited with code {status}", flush=True)
+                child.process = None
+                child.ready = False
+                child.restart_at = now + child.backoff
+                print(
+                    f"Restarting {child.name} server in {child.backoff:.0f}s",
+                    flush=True
+                )
+                child.backoff = min(child.backoff * 2, RESTART_BACKOFF_MAX)
+                continue
+
+            if not child.ready:
+                if port_is_open(child.port):
+                    child.ready = True
+                    print(
+                        f"{child.name} server started successfully on port "
+                        f"{child.port}",
+                        flush=True
+                    )
+                elif now - child.started_at > READY_TIMEOUT:
+                    print(
+                        f"{child.name} server did not become ready, restarting",
+                        flush=True
+                    )
+                    child.signal(signal.SIGKILL)
+            elif now - child.started_at >= STABLE_AFTER:
+                child.backoff = RESTART_BACKOFF_MIN
+
+    def _dispatch(self, timeout: Optional[float]) -> None:
+        """Wait for output or signals and handle them."""
+        for key, _ in self.selector.select(timeout):
+            if key.data is None:
+                try:
+                    while os.read(self._wakeup_read, 512):
+                        pass
+                except BlockingIOError:
+                    pass
+                continue
+            child, label = key.data
+            child.read(self.selector, key.fileobj, label)
+
+    def run(self) -> None:
+        """Run the children until a shutdown signal arrives."""
+        while not self.shutting_down:
+            self._check_children()
+            self._dispatch(self._next_timeout())
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Forward SIGTERM to the children and kill those that do not exit in time."""
+        for child in self.children:
+            child.signal(signal.SIGTERM)
+
+        deadline = time.monotonic() + SHUTDOWN_GRACE
+        while any(
+            c.process is not None and c.process.poll() is None for c in self.children
+        ):
+            if time.monotonic() >= deadline:
+                for child in self.children:
+                    child.signal(signal.SIGKILL)
+                break
+            # Keep draining output so children can finish writing their last logs
+            self._dispatch(0.1)
+
+        for child in self.children:
+            if child.process is not None:
+                child.process.wait()
+                print(
+                    f"{child.name} server exited with code {child.process.returncode}",
+                    flush=True
+                )
+        # Drain anything left in the pipes
+        while len(self.selector.get_map()) > 1 and self.selector.select(0):
+            self._dispatch(0)
+
 
 def start_servers():
     """Start both the Flask and Express servers."""
-    print("Starting Flask server...")
-    flask_process = subprocess.Popen(
-        ["python3", "app_flask.py"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-
-    # Give the Flask server a moment to start
-    time.sleep(2)
-
-    # Check if the Flask server started successfully
-    flask_status = flask_process.poll()
-    if flask_status is not None:
-        print("Error starting Flask server!")
-        stdout, stderr = flask_process.communicate()
-        print(f"STDOUT: {stdout}")
-        print(f"STDERR: {stderr}")
-        return
-
-    print("Flask server started successfully on port 5001")
-    
-    # Start the Express server which handles the frontend
-    print("Starting Express server...")
     express_env = os.environ.copy()
-    express_process = subprocess.Popen(
-        ["npm", "run", "dev"],
-        env=express_env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-
-    # Wait for both servers to exit
-    try:
-        while True:
-            flask_status = flask_process.poll()
-            express_status = express_process.poll()
-            
-            if flask_status is not None:
-                print(f"Flask server exited with code {flask_status}")
-                stdout, stderr = flask_process.communicate()
-                print(f"STDOUT: {stdout}")
-                print(f"STDERR: {stderr}")
-                break
-                
-            if express_status is not None:
-                print(f"Express server exited with code {express_status}")
-                stdout, stderr = express_process.communicate()
-                print(f"STDOUT: {stdout}")
-                print(f"STDERR: {stderr}")
-                break
-                
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("Shutting down servers...")
-        flask_process.terminate()
-        express_process.terminate()
+
+    supervisor = Supervisor([
+        ManagedProcess("Flask", ["python3", "app_flask.py"], 5001),
+        # The Express server handles the frontend
+        ManagedProcess("Express", ["npm", "run", "dev"], 5000, env=express_env),
+    ])
+    supervisor.run()
+
 
 if __name__ == "__main__":
-    start_servers()
\ No newline at end of file
+    start_servers()
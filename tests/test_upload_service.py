@@ -0,0 +1,153 @@
+"""Tests for resumable uploads forwarded to a local directory store."""
+
+import hashlib
+import io
+import os
+import time
+
+import pytest
+
+from app_modules.models import UPLOAD_COMPLETE, InsertUpload
+from app_modules.repositories.memory_repositories import MemoryUploadRepository
+from app_modules.services.remote_store import LocalDirectoryStore
+from app_modules.services.upload_service import UploadService
+
+PART_SIZE = 4
+CONTENT = b"0123456789"
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def send_part(service, upload_id, index, data=CONTENT, tenant=None):
+    part = data[index * PART_SIZE:(index + 1) * PART_SIZE]
+    return service.write_part(
+        upload_id,
+        index * PART_SIZE,
+        len(part),
+        len(data),
+        io.BytesIO(part),
+        sha256(part),
+        tenant
+    )
+
+
+def wait_for_status(service, upload_id, status, tenant=None):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        data, _ = service.get_status(upload_id, tenant)
+        if data["upload"]["status"] == status:
+            return data["upload"]
+        time.sleep(0.01)
+    pytest.fail(f"Upload never reached {status}")
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    return tmp_path / "store"
+
+
+@pytest.fixture
+def service(tmp_path, store_dir):
+    return UploadService(
+        MemoryUploadRepository(),
+        LocalDirectoryStore(str(store_dir)),
+        storage_dir=str(tmp_path / "state"),
+        part_size=PART_SIZE,
+        max_pending_bytes=25
+    )
+
+
+def initiate(service, size=len(CONTENT), tenant=None):
+    data, status = service.initiate(
+        InsertUpload(fileName="photo.jpg", size=size, sha256=sha256(CONTENT)), tenant
+    )
+    assert status == 201
+    return data["upload"]
+
+
+def test_upload_is_assembled_and_forwarded(service, store_dir):
+    upload = initiate(service)
+    assert upload["partCount"] == 3
+    
+    # Parts may arrive in any order
+    for index in (2, 0, 1):
+        _, status = send_part(service, upload["id"], index)
+        assert status == 200
+    
+    _, status = service.complete(upload["id"])
+    assert status == 202
+    
+    done = wait_for_status(service, upload["id"], UPLOAD_COMPLETE)
+    assert (store_dir / done["remoteFileId"]).read_bytes() == CONTENT
+    assert not os.path.exists(service._path(upload["id"]))
+
+
+def test_upload_resumes_with_missing_parts(service):
+    upload = initiate(service)
+    send_part(service, upload["id"], 0)
+    
+    data, status = service.complete(upload["id"])
+    assert status == 409
+    assert data["upload"]["missingParts"] == [1, 2]
+    
+    # A client resuming asks which parts are missing and sends only those
+    data, _ = service.get_status(upload["id"])
+    for index in data["upload"]["missingParts"]:
+        send_part(service, upload["id"], index)
+    
+    # Retrying a part that made it is acknowledged without rewriting it
+    data, status = send_part(service, upload["id"], 0)
+    assert status == 200
+    assert data["message"] == "Part 0 already received"
+    
+    assert service.complete(upload["id"])[1] == 202
+    wait_for_status(service, upload["id"], UPLOAD_COMPLETE)
+
+
+def test_part_with_wrong_checksum_is_rejected(service):
+    upload = initiate(service)
+    part = CONTENT[:PART_SIZE]
+    
+    _, status = service.write_part(
+        upload["id"], 0, len(part), len(CONTENT), io.BytesIO(part), sha256(b"other")
+    )
+    assert status == 422
+    
+    data, _ = service.get_status(upload["id"])
+    assert data["upload"]["missingParts"] == [0, 1, 2]
+
+
+def test_uploads_are_scoped_to_their_event(service):
+    upload = initiate(service, tenant="smith")
+    
+    assert service.get_status(upload["id"])[1] == 404
+    assert send_part(service, upload["id"], 0)[1] == 404
+    assert send_part(service, upload["id"], 0, tenant="smith")[1] == 200
+
+
+def test_pending_space_is_capped_and_released(service):
+    first = initiate(service)
+    initiate(service)
+    
+    _, status = service.initiate(InsertUpload(fileName="big.mp4", size=len(CONTENT)))
+    assert status == 507
+    
+    assert service.abort(first["id"])[1] == 200
+    initiate(service)
+
+
+def test_finished_sessions_expire(service):
+    upload = initiate(service)
+    for index in range(3):
+        send_part(service, upload["id"], index)
+    service.complete(upload["id"])
+    wait_for_status(service, upload["id"], UPLOAD_COMPLETE)
+    
+    service.session_ttl = 0
+    service._last_cleanup = 0.0
+    service._expire_stale()
+    
+    assert service.get_status(upload["id"])[1] == 404
+    assert len(service.repository) == 0